@@ -0,0 +1,237 @@
+"""Alert generation and grouping utility functions for Streamlit pages"""
+
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from src.alert_generator import AlertGenerator
+from pages.data_utils import data_fingerprint
+
+
+# Default alert rules shared by the dashboard and alerts pages
+ALERT_RULES = {
+    'delay_threshold_hours': 24,
+    'low_stock_threshold': 1.0,
+    'supplier_performance_threshold': 70.0
+}
+
+# Display format for alert timestamps
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Severity levels in display order (most severe first)
+SEVERITY_ORDER = ("critical", "high", "medium", "low")
+
+# Display labels for filter widgets, precomputed once at import
+TYPE_LABELS = {
+    "shipment_delay": "Shipment Delay",
+    "low_stock": "Low Stock",
+    "supplier_performance": "Supplier Performance"
+}
+SEVERITY_LABELS = {severity: severity.title() for severity in SEVERITY_ORDER}
+
+# Acknowledgment buckets tracked alongside severity
+STATUS_KEYS = ("active", "acknowledged")
+
+# Session state key of this session's acknowledgment times
+ACKNOWLEDGMENTS_KEY = "alert_acknowledgments"
+
+
+def _acknowledgments():
+    """This session's acknowledgment times, keyed by (entity ID, alert type value)"""
+    return st.session_state.setdefault(ACKNOWLEDGMENTS_KEY, {})
+
+
+def acknowledgment_times(alerts):
+    """
+    Look up when this session acknowledged each alert
+
+    Acknowledgments are kept per session and keyed by the alerted entity and
+    alert type, so they survive alerts being regenerated with new IDs.
+
+    Args:
+        alerts: List of Alert objects
+
+    Returns:
+        List of acknowledgment datetimes aligned with alerts, None where still active
+    """
+    acknowledged = _acknowledgments()
+    if not acknowledged:
+        return [None] * len(alerts)
+    return [acknowledged.get((a.entity_id, a.type.value)) for a in alerts]
+
+
+def acknowledge_alerts(alerts):
+    """
+    Mark alerts as acknowledged for this session, all at the same time
+
+    Args:
+        alerts: List of Alert objects to acknowledge
+    """
+    acknowledged = _acknowledgments()
+    now = datetime.now()
+    for alert in alerts:
+        acknowledged.setdefault((alert.entity_id, alert.type.value), now)
+
+
+@lru_cache(maxsize=None)
+def alert_type_label(type_value: str) -> str:
+    """Get the display title for an alert type value (e.g. "low_stock" -> "Low Stock")"""
+    return TYPE_LABELS.get(type_value) or type_value.replace("_", " ").title()
+
+
+def bucket_alerts(alerts, severities=None):
+    """
+    Group alerts by severity and acknowledgment status in a single pass
+
+    Args:
+        alerts: List of Alert objects
+        severities: Optional precomputed severity values aligned with alerts
+
+    Returns:
+        Dictionary of alert lists keyed by severity ("critical", ...), status
+        ("active", "acknowledged") and status/severity pairs ("active_critical", ...)
+    """
+    buckets = {key: [] for key in SEVERITY_ORDER + STATUS_KEYS}
+    for status in STATUS_KEYS:
+        for severity in SEVERITY_ORDER:
+            buckets[f"{status}_{severity}"] = []
+
+    if severities is None:
+        severities = [alert.severity.value for alert in alerts]
+
+    for alert, severity, acknowledged_at in zip(alerts, severities, acknowledgment_times(alerts)):
+        status = "active" if acknowledged_at is None else "acknowledged"
+        buckets[severity].append(alert)
+        buckets[status].append(alert)
+        buckets[f"{status}_{severity}"].append(alert)
+
+    return buckets
+
+
+def alerts_to_dataframe(alerts, types=None, severities=None):
+    """
+    Convert alerts to a display/export DataFrame built column by column
+
+    Args:
+        alerts: List of Alert objects
+        types: Optional precomputed alert type values aligned with alerts
+        severities: Optional precomputed severity values aligned with alerts
+
+    Returns:
+        DataFrame with one row per alert
+    """
+    acknowledged, acknowledged_at = acknowledgment_columns(alerts)
+    created_at = pd.to_datetime([a.created_at for a in alerts]).strftime(TIME_FORMAT)
+    if types is None:
+        types = [a.type.value for a in alerts]
+    if severities is None:
+        severities = [a.severity.value for a in alerts]
+
+    return pd.DataFrame({
+        "ID": [a.id for a in alerts],
+        "Type": types,
+        "Severity": severities,
+        "Message": [a.message for a in alerts],
+        "Entity ID": [a.entity_id for a in alerts],
+        "Created At": created_at,
+        "Acknowledged": acknowledged,
+        "Acknowledged At": acknowledged_at
+    })
+
+
+def acknowledgment_columns(alerts):
+    """
+    Format the acknowledgment columns, the only alert fields that change after generation
+
+    Args:
+        alerts: List of Alert objects
+
+    Returns:
+        Tuple of ("Yes"/"No" array, formatted acknowledgment time array)
+    """
+    times = acknowledgment_times(alerts)
+    acknowledged = np.array([t is not None for t in times], dtype=bool)
+    acknowledged_at = pd.to_datetime(times).strftime(TIME_FORMAT).fillna("")
+    return np.where(acknowledged, "Yes", "No"), acknowledged_at.to_numpy()
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _generate_alerts_cached(fingerprint, _data):
+    """Generate alerts once per dataset; shared read-only by every session"""
+    return AlertGenerator().generate_alerts(_data, ALERT_RULES)
+
+
+def get_alerts(data):
+    """
+    Get generated alerts for a dataset, reusing them across reruns and sessions
+
+    Delay alerts depend on the current time, so they are regenerated whenever
+    the data is reloaded, at least every load cache ttl. Acknowledge them with
+    acknowledge_alerts, never by mutating the shared Alert objects.
+
+    Args:
+        data: SupplyChainData object
+
+    Returns:
+        List of Alert objects
+    """
+    return _generate_alerts_cached(data_fingerprint(data), data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _alert_columns_cached(fingerprint, _alerts):
+    """Type and severity arrays for a dataset's alerts; both are fixed once generated"""
+    types = np.array([a.type.value for a in _alerts], dtype=object)
+    severities = np.array([a.severity.value for a in _alerts], dtype=object)
+    return types, severities
+
+
+def get_alert_columns(data, alerts):
+    """
+    Get alert type and severity values, read from the enums once per dataset
+
+    Args:
+        data: SupplyChainData object the alerts were generated from
+        alerts: List of Alert objects returned by get_alerts
+
+    Returns:
+        Tuple of (type value array, severity value array) aligned with alerts
+    """
+    return _alert_columns_cached(data_fingerprint(data), alerts)
+
+
+def filter_alerts(data, alerts, type_filter=None, severity_filter=None, status_filter="All"):
+    """
+    Filter alerts with one combined boolean mask over cached attribute arrays
+
+    Args:
+        data: SupplyChainData object the alerts were generated from
+        alerts: List of Alert objects returned by get_alerts
+        type_filter: Alert type values to keep (None or empty keeps all)
+        severity_filter: Severity values to keep (None or empty keeps all)
+        status_filter: "Active", "Acknowledged" or "All"
+
+    Returns:
+        Tuple of (matching Alert objects in original order, their type values,
+        their severity values)
+    """
+    types, severities = get_alert_columns(data, alerts)
+    mask = np.ones(len(alerts), dtype=bool)
+
+    if type_filter:
+        mask &= np.isin(types, type_filter)
+
+    if severity_filter:
+        mask &= np.isin(severities, severity_filter)
+
+    if status_filter in ("Active", "Acknowledged"):
+        # Acknowledgment changes between reruns, so it is read fresh
+        acknowledged = np.fromiter(
+            (t is not None for t in acknowledgment_times(alerts)), dtype=bool, count=len(alerts)
+        )
+        mask &= acknowledged if status_filter == "Acknowledged" else ~acknowledged
+
+    indices = np.flatnonzero(mask)
+    return [alerts[i] for i in indices], types[indices], severities[indices]
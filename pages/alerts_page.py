@@ -1,8 +1,20 @@
 """Alerts page for Supply Chain Visibility application"""
 
 import streamlit as st
-import pandas as pd
-from src.alert_generator import AlertGenerator
+from pages.data_utils import get_data
+from pages.alert_utils import (
+    TYPE_LABELS,
+    SEVERITY_LABELS,
+    acknowledge_alerts,
+    acknowledgment_columns,
+    alert_type_label,
+    alerts_to_dataframe,
+    bucket_alerts,
+    filter_alerts,
+    get_alerts,
+)
+from pages.tooltip_utils import render_help_section
+from pages.export_utils import render_export_buttons
 
 
 def render_alerts_page():
@@ -10,7 +22,6 @@ def render_alerts_page():
     st.title("⚠️ Supply Chain Alerts")
     
     # Help section
-    from pages.tooltip_utils import render_help_section
     render_help_section("Alerts")
     
     # Load data
@@ -19,16 +30,8 @@ def render_alerts_page():
         st.error("❌ Failed to load alert data")
         return
     
-    alert_generator = AlertGenerator()
-    
-    # Define default alert rules
-    rules = {
-        'delay_threshold_hours': 24,
-        'low_stock_threshold': 1.0,
-        'supplier_performance_threshold': 70.0
-    }
-    
-    alerts = alert_generator.generate_alerts(data, rules)
+    # Alerts are generated once per dataset and reused across reruns
+    alerts = get_alerts(data)
     
     # Filter controls
     col1, col2, col3 = st.columns(3)
@@ -36,18 +39,18 @@ def render_alerts_page():
     with col1:
         alert_type_filter = st.multiselect(
             "Filter by type",
-            options=["shipment_delay", "low_stock", "supplier_performance"],
+            options=list(TYPE_LABELS),
             default=None,
-            format_func=lambda x: x.replace("_", " ").title(),
+            format_func=TYPE_LABELS.get,
             help="Filter alerts by their type"
         )
     
     with col2:
         severity_filter = st.multiselect(
             "Filter by severity",
-            options=["critical", "high", "medium", "low"],
+            options=list(SEVERITY_LABELS),
             default=None,
-            format_func=lambda x: x.title(),
+            format_func=SEVERITY_LABELS.get,
             help="Filter alerts by severity level"
         )
     
@@ -58,85 +61,51 @@ def render_alerts_page():
             help="Filter by acknowledgment status"
         )
     
-    # Apply filters
-    filtered_alerts = alerts
-    
-    if alert_type_filter:
-        filtered_alerts = [a for a in filtered_alerts if a.type.value in alert_type_filter]
-    
-    if severity_filter:
-        filtered_alerts = [a for a in filtered_alerts if a.severity.value in severity_filter]
+    # Apply all filters as one boolean mask over cached alert attributes
+    filtered_alerts, types, severities = filter_alerts(
+        data, alerts, alert_type_filter, severity_filter, status_filter
+    )
+    buckets = bucket_alerts(filtered_alerts, severities)
     
-    if status_filter == "Active":
-        filtered_alerts = [a for a in filtered_alerts if not a.acknowledged]
-    elif status_filter == "Acknowledged":
-        filtered_alerts = [a for a in filtered_alerts if a.acknowledged]
+    # Format every alert once; the detail tables and the export share the result
+    alerts_df = alerts_to_dataframe(filtered_alerts, types, severities)
     
     # Display alert summary
     st.markdown("---")
-    render_alert_summary(filtered_alerts)
+    render_alert_summary(filtered_alerts, buckets)
     
     st.markdown("---")
     
     # Display alerts by severity
-    render_alerts_by_severity(filtered_alerts, alert_generator)
+    render_alerts_by_severity(filtered_alerts, buckets, alerts_df)
     
     # Export functionality
     if filtered_alerts:
         st.markdown("---")
         st.markdown("### Export Data")
-        from pages.export_utils import render_export_buttons
         
-        # Convert alerts to DataFrame for export
-        df_export = pd.DataFrame([{
-            "ID": alert.id,
-            "Type": alert.type.value,
-            "Severity": alert.severity.value,
-            "Message": alert.message,
-            "Entity ID": alert.entity_id,
-            "Created At": alert.created_at.strftime("%Y-%m-%d %H:%M"),
-            "Acknowledged": "Yes" if alert.acknowledged else "No",
-            "Acknowledged At": alert.acknowledged_at.strftime("%Y-%m-%d %H:%M") if alert.acknowledged_at else ""
-        } for alert in filtered_alerts])
-        
-        render_export_buttons(df_export, "alerts")
-
-
-def get_data():
-    """Get data from session state"""
-    if st.session_state.data_cache is None:
-        try:
-            data_service = st.session_state.data_service
-            data = data_service.load_data("csv")
-            st.session_state.data_cache = data
-            return data
-        except Exception:
-            return None
-    return st.session_state.data_cache
+        render_export_buttons(alerts_df, "alerts")
 
 
-def render_alert_summary(alerts):
+def render_alert_summary(alerts, buckets):
     """Render alert summary metrics"""
     st.markdown("### Alert Summary")
     
-    active_alerts = [a for a in alerts if not a.acknowledged]
-    critical_alerts = [a for a in alerts if a.severity.value == "critical" and not a.acknowledged]
-    high_alerts = [a for a in alerts if a.severity.value == "high" and not a.acknowledged]
-    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total Alerts", len(alerts))
     with col2:
-        st.metric("Active", len(active_alerts))
+        st.metric("Active", len(buckets["active"]))
     with col3:
-        st.metric("Critical", len(critical_alerts))
+        st.metric("Critical", len(buckets["active_critical"]))
     with col4:
-        st.metric("High Priority", len(high_alerts))
+        st.metric("High Priority", len(buckets["active_high"]))
 
 
-def render_alerts_by_severity(alerts, alert_generator):
-    """Render alerts grouped by severity"""
+@st.fragment
+def render_alerts_by_severity(alerts, buckets, alerts_df):
+    """Render alerts grouped by severity; acknowledging reruns only this section"""
     st.markdown("### Alert Details")
     
     if not alerts:
@@ -144,69 +113,59 @@ def render_alerts_by_severity(alerts, alert_generator):
         return
     
     # Group by severity
-    critical_alerts = [a for a in alerts if a.severity.value == "critical"]
-    high_alerts = [a for a in alerts if a.severity.value == "high"]
-    medium_alerts = [a for a in alerts if a.severity.value == "medium"]
-    low_alerts = [a for a in alerts if a.severity.value == "low"]
+    critical_alerts = buckets["critical"]
+    high_alerts = buckets["high"]
+    medium_alerts = buckets["medium"]
+    low_alerts = buckets["low"]
     
     # Render each severity group
     if critical_alerts:
-        render_alert_group("🔴 Critical Alerts", critical_alerts, alert_generator, "error")
+        render_alert_group("🔴 Critical Alerts", critical_alerts, alerts_df, "error")
     
     if high_alerts:
-        render_alert_group("🟠 High Priority Alerts", high_alerts, alert_generator, "warning")
+        render_alert_group("🟠 High Priority Alerts", high_alerts, alerts_df, "warning")
     
     if medium_alerts:
-        render_alert_group("🟡 Medium Priority Alerts", medium_alerts, alert_generator, "info")
+        render_alert_group("🟡 Medium Priority Alerts", medium_alerts, alerts_df, "info")
     
     if low_alerts:
-        render_alert_group("🟢 Low Priority Alerts", low_alerts, alert_generator, "info")
+        render_alert_group("🟢 Low Priority Alerts", low_alerts, alerts_df, "info")
 
 
-def render_alert_group(title, alerts, alert_generator, message_type):
-    """Render a group of alerts with the same severity"""
+def render_alert_group(title, alerts, alerts_df, message_type):
+    """Render a group of alerts with the same severity as a single table"""
     with st.expander(f"{title} ({len(alerts)})", expanded=(message_type in ["error", "warning"])):
-        for alert in alerts:
-            render_alert_card(alert, alert_generator, message_type)
-
-
-def render_alert_card(alert, alert_generator, message_type):
-    """Render an individual alert card"""
-    # Create container for alert
-    container = st.container()
-    
-    with container:
-        col1, col2 = st.columns([4, 1])
+        group_key = alerts[0].severity.value
         
-        with col1:
-            # Alert header
-            alert_title = f"**{alert.type.value.replace('_', ' ').title()}**"
-            if alert.acknowledged:
-                alert_title += " ✓ Acknowledged"
-            
-            if message_type == "error":
-                st.error(alert_title)
-            elif message_type == "warning":
-                st.warning(alert_title)
-            else:
-                st.info(alert_title)
-            
-            # Alert details
-            st.markdown(f"{alert.message}")
-            st.caption(f"Entity ID: {alert.entity_id} | Created: {alert.created_at.strftime('%Y-%m-%d %H:%M')}")
-            
-            if alert.acknowledged and alert.acknowledged_at:
-                st.caption(f"Acknowledged at: {alert.acknowledged_at.strftime('%Y-%m-%d %H:%M')}")
+        # Reuse the preformatted rows; only acknowledgment can change between fragment reruns
+        df = alerts_df[alerts_df["Severity"] == group_key].copy()
+        df["Acknowledged"], df["Acknowledged At"] = acknowledgment_columns(alerts)
+        df["Type"] = df["Type"].map(alert_type_label)
+        st.dataframe(
+            df.drop(columns=["Severity"]),
+            hide_index=True,
+            use_container_width=True
+        )
         
-        with col2:
-            # Acknowledge button
-            if not alert.acknowledged:
-                if st.button("Acknowledge", key=f"ack_{alert.id}", use_container_width=True):
-                    try:
-                        alert_generator.acknowledge_alert(alert.id)
-                        st.success("Alert acknowledged")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Failed to acknowledge: {str(e)}")
+        # Acknowledge action for the group's active alerts
+        active_ids = df.loc[df["Acknowledged"] == "No", "ID"].tolist()
+        if not active_ids:
+            return
         
-        st.markdown("---")
+        # A form collects the selection without a rerun per change
+        with st.form(key=f"ack_form_{group_key}", border=False):
+            selected = st.multiselect(
+                "Acknowledge IDs",
+                options=active_ids,
+                help="Select alerts to mark as acknowledged"
+            )
+            submitted = st.form_submit_button("Ack selected")
+        
+        if submitted and selected:
+            try:
+                by_id = {alert.id: alert for alert in alerts}
+                acknowledge_alerts([by_id[alert_id] for alert_id in selected])
+                st.success(f"{len(selected)} alert(s) acknowledged")
+                st.rerun(scope="fragment")
+            except Exception as e:
+                st.error(f"Failed to acknowledge: {str(e)}")
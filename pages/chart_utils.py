@@ -0,0 +1,54 @@
+"""Chart data utility functions for Streamlit pages"""
+
+import numpy as np
+
+
+# Upper bound on points sent to the browser per line trace; roughly the
+# horizontal pixel resolution of a wide chart
+MAX_CHART_POINTS = 1000
+
+
+def lttb_indices(x, y, n_out: int = MAX_CHART_POINTS):
+    """
+    Pick the points to keep when downsampling a line with Largest-Triangle-Three-Buckets
+
+    The first and last points are always kept. The points in between are split
+    into n_out - 2 buckets, and from each bucket the point forming the largest
+    triangle with the previously kept point and the next bucket's average is kept,
+    which preserves peaks and troughs that plain striding would drop.
+
+    Args:
+        x: Sorted numeric x values (convert datetimes to integers first)
+        y: Numeric y values aligned with x
+        n_out: Maximum number of points to keep
+
+    Returns:
+        Sorted integer array of indices into x and y
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket edges over the interior points [1, n - 1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+
+        # Twice the triangle area for every candidate point in the bucket
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+
+    return indices
@@ -1,9 +1,12 @@
 """Dashboard page for Supply Chain Visibility application"""
 
 import streamlit as st
-from datetime import datetime
 from src.dashboard import Dashboard
-from src.alert_generator import AlertGenerator
+from pages.data_utils import load_cached_data, clear_data_cache, data_fingerprint
+from pages.alert_utils import alert_type_label, bucket_alerts, get_alert_columns, get_alerts
+from pages.tooltip_utils import render_help_section
+from pages.refresh_utils import mark_refreshed
+from pages.error_utils import handle_data_unavailable, handle_data_load_error, show_transient_error
 
 
 def render_dashboard_page():
@@ -11,7 +14,6 @@ def render_dashboard_page():
     st.title("📊 Supply Chain Dashboard")
     
     # Help section
-    from pages.tooltip_utils import render_help_section
     render_help_section("Dashboard")
     
     # Data refresh controls
@@ -53,20 +55,17 @@ def render_dashboard_page():
 def load_data():
     """Load supply chain data from data service"""
     try:
-        if st.session_state.data_cache is None:
-            data_service = st.session_state.data_service
-            data = data_service.load_data("csv")
-            st.session_state.data_cache = data
-            st.session_state.last_refresh = datetime.now()
-        return st.session_state.data_cache
+        data = load_cached_data("csv")
+        st.session_state.data_cache = data
+        if st.session_state.last_refresh is None:
+            mark_refreshed()
+        return data
     except Exception as e:
         # Check if we have cached data to fall back to
         if st.session_state.data_cache:
-            from pages.error_utils import handle_data_unavailable
             handle_data_unavailable()
             return st.session_state.data_cache
         else:
-            from pages.error_utils import handle_data_load_error
             handle_data_load_error(e, retry_callback=lambda: load_data())
             return None
 
@@ -74,21 +73,31 @@ def load_data():
 def refresh_data():
     """Refresh data from source"""
     try:
-        data_service = st.session_state.data_service
-        data = data_service.refresh_data("data")
+        clear_data_cache()
+        data = load_cached_data("csv")
         st.session_state.data_cache = data
-        st.session_state.last_refresh = datetime.now()
+        mark_refreshed()
         st.success("✅ Data refreshed successfully")
         st.rerun()
     except Exception as e:
-        from pages.error_utils import show_transient_error
         show_transient_error(e, retry_callback=refresh_data)
 
 
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _get_dashboard_cached(fingerprint, _data):
+    """Build the Dashboard once per dataset instead of on every rerun"""
+    return Dashboard(_data)
+
+
+def get_dashboard(data):
+    """Get the Dashboard for a dataset, rebuilt only when the data reloads"""
+    return _get_dashboard_cached(data_fingerprint(data), data)
+
+
 def render_metrics(data):
     """Render key metrics cards"""
-    dashboard = Dashboard(data)
-    metrics = dashboard.get_metrics(data)
+    dashboard = get_dashboard(data)
+    metrics = dashboard.render()
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -131,46 +140,38 @@ def render_alerts(data):
     """Render active alerts section"""
     st.markdown("### ⚠️ Active Alerts")
     
-    alert_generator = AlertGenerator()
-    
-    # Define default alert rules
-    rules = {
-        'delay_threshold_hours': 24,
-        'low_stock_threshold': 1.0,
-        'supplier_performance_threshold': 70.0
-    }
-    
-    alerts = alert_generator.generate_alerts(data, rules)
+    # Alerts are generated once per dataset and reused across reruns
+    alerts = get_alerts(data)
     
-    # Filter to show only unacknowledged alerts
-    active_alerts = [alert for alert in alerts if not alert.acknowledged]
+    # Group in one pass and show only unacknowledged alerts
+    buckets = bucket_alerts(alerts, get_alert_columns(data, alerts)[1])
     
-    if not active_alerts:
+    if not buckets["active"]:
         st.success("✅ No active alerts")
         return
     
     # Display alerts by severity
-    critical_alerts = [a for a in active_alerts if a.severity.value == "critical"]
-    high_alerts = [a for a in active_alerts if a.severity.value == "high"]
-    medium_alerts = [a for a in active_alerts if a.severity.value == "medium"]
-    low_alerts = [a for a in active_alerts if a.severity.value == "low"]
+    critical_alerts = buckets["active_critical"]
+    high_alerts = buckets["active_high"]
+    medium_alerts = buckets["active_medium"]
+    low_alerts = buckets["active_low"]
     
     if critical_alerts:
         with st.expander(f"🔴 Critical Alerts ({len(critical_alerts)})", expanded=True):
             for alert in critical_alerts:
-                st.error(f"**{alert.type.value.replace('_', ' ').title()}**: {alert.message}")
+                st.error(f"**{alert_type_label(alert.type.value)}**: {alert.message}")
     
     if high_alerts:
         with st.expander(f"🟠 High Priority Alerts ({len(high_alerts)})", expanded=True):
             for alert in high_alerts:
-                st.warning(f"**{alert.type.value.replace('_', ' ').title()}**: {alert.message}")
+                st.warning(f"**{alert_type_label(alert.type.value)}**: {alert.message}")
     
     if medium_alerts:
         with st.expander(f"🟡 Medium Priority Alerts ({len(medium_alerts)})"):
             for alert in medium_alerts:
-                st.info(f"**{alert.type.value.replace('_', ' ').title()}**: {alert.message}")
+                st.info(f"**{alert_type_label(alert.type.value)}**: {alert.message}")
     
     if low_alerts:
         with st.expander(f"🟢 Low Priority Alerts ({len(low_alerts)})"):
             for alert in low_alerts:
-                st.info(f"**{alert.type.value.replace('_', ' ').title()}**: {alert.message}")
+                st.info(f"**{alert_type_label(alert.type.value)}**: {alert.message}")
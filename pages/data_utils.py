@@ -0,0 +1,124 @@
+"""Data loading utility functions for Streamlit pages"""
+
+import streamlit as st
+from src.data_access import DataAccessService
+from src.models import index_by_id
+
+
+@st.cache_resource(show_spinner=False)
+def get_data_service() -> DataAccessService:
+    """Get the DataAccessService instance shared by all sessions"""
+    return DataAccessService()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_load(source: str, signature: tuple):
+    """Load data from source, shared across sessions and reruns until files change"""
+    return get_data_service().load_data(source)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _search_indexes_cached(fingerprint):
+    """Search indexes for a dataset, shared by its per-rerun copies and filled on first search"""
+    return {}
+
+
+def load_cached_data(source: str = "csv"):
+    """
+    Load supply chain data through the shared Streamlit cache
+
+    Every call returns a fresh copy of the cached data, so the text search
+    indexes are attached from a resource cache instead of being rebuilt on
+    each copy.
+
+    Args:
+        source: Data source path passed to DataAccessService.load_data
+
+    Returns:
+        SupplyChainData object
+    """
+    # Keyed on the files and their change logs, so persisted edits reload the data
+    data = _cached_load(source, get_data_service().source_signature(source))
+    data.search_indexes = _search_indexes_cached(data_fingerprint(data))
+    return data
+
+
+def get_data():
+    """
+    Get data for a page from the shared cache, falling back to the session's last good load
+
+    A warm cache hit returns straight from st.cache_data; the session fallback is
+    recorded by the dashboard and refresh paths, not on every page rerun.
+
+    Returns:
+        SupplyChainData object, or None if nothing could be loaded
+    """
+    try:
+        return load_cached_data("csv")
+    except Exception:
+        return st.session_state.get("data_cache")
+
+
+def data_fingerprint(data):
+    """
+    Build a cheap cache key identifying a loaded dataset
+
+    Args:
+        data: SupplyChainData object
+
+    Returns:
+        Tuple of entity counts and the data's last_updated timestamp
+    """
+    return (len(data.shipments), len(data.inventory), len(data.suppliers), data.last_updated)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _facet_values_cached(fingerprint, collection: str, field: str, _data):
+    """Distinct field values for a dataset collection, computed once per dataset"""
+    return tuple(dict.fromkeys(getattr(item, field) for item in getattr(_data, collection)))
+
+
+def facet_values(data, collection: str, field: str):
+    """
+    Get the distinct values of a field in first-seen order, e.g. for filter options
+
+    Args:
+        data: SupplyChainData object
+        collection: Name of the entity list on data (e.g. "inventory")
+        field: Attribute to collect from each entity (e.g. "location")
+
+    Returns:
+        Tuple of distinct values
+    """
+    return _facet_values_cached(data_fingerprint(data), collection, field, data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _id_positions_cached(fingerprint, collection: str, _data):
+    """Position of each entity id in a dataset collection, built once per dataset"""
+    positions = {}
+    for position, item in enumerate(getattr(_data, collection)):
+        positions.setdefault(item.id, position)
+    return positions
+
+
+def id_positions(data, collection: str):
+    """
+    Get a persistent id -> list position index for a dataset collection
+
+    Positions rather than objects are stored so lookups resolve against the
+    caller's own data. Duplicate ids keep their first occurrence.
+
+    Args:
+        data: SupplyChainData object
+        collection: Name of the entity list on data (e.g. "shipments")
+
+    Returns:
+        Dictionary mapping entity id to its index in the collection
+    """
+    return _id_positions_cached(data_fingerprint(data), collection, data)
+
+
+def clear_data_cache():
+    """Invalidate cached data so the next load re-reads the source"""
+    _cached_load.clear()
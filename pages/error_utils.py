@@ -1,7 +1,7 @@
 """Error handling utility functions for Streamlit pages"""
 
 import streamlit as st
-from functools import wraps
+from functools import lru_cache, wraps
 import traceback
 
 
@@ -135,6 +135,28 @@ def show_transient_error(error: Exception, retry_callback=None):
                 st.rerun()
 
 
+def _iter_filter_errors(date_range, search_query):
+    """Yield validation error messages for filter values"""
+    # Validate date range
+    if date_range:
+        start_date, end_date = date_range
+        if start_date > end_date:
+            yield "Start date must be before end date"
+    
+    # Validate search query
+    if search_query:
+        if len(search_query) < 2:
+            yield "Search query must be at least 2 characters"
+        if len(search_query) > 100:
+            yield "Search query must be less than 100 characters"
+
+
+@lru_cache(maxsize=32)
+def _validate_filter_values(date_range, search_query):
+    """Validate hashable filter values; cached so unchanged filters skip re-validation"""
+    return tuple(_iter_filter_errors(date_range, search_query))
+
+
 def validate_filter_input(filters):
     """
     Validate filter criteria and return validation errors
@@ -143,24 +165,10 @@ def validate_filter_input(filters):
         filters: FilterCriteria object to validate
     
     Returns:
-        List of validation error messages (empty if valid)
+        Tuple of validation error messages (empty if valid)
     """
-    errors = []
-    
-    # Validate date range
-    if filters.date_range:
-        start_date, end_date = filters.date_range
-        if start_date > end_date:
-            errors.append("Start date must be before end date")
-    
-    # Validate search query
-    if filters.search_query:
-        if len(filters.search_query) < 2:
-            errors.append("Search query must be at least 2 characters")
-        if len(filters.search_query) > 100:
-            errors.append("Search query must be less than 100 characters")
-    
-    return errors
+    date_range = tuple(filters.date_range) if filters.date_range else None
+    return _validate_filter_values(date_range, filters.search_query)
 
 
 def display_validation_errors(errors):
@@ -168,7 +176,10 @@ def display_validation_errors(errors):
     Display validation error messages
     
     Args:
-        errors: List of validation error messages
+        errors: Sequence of validation error messages
+    
+    Returns:
+        True if any errors were displayed, False otherwise
     """
     if errors:
         st.error("❌ Validation Errors:")
@@ -2,56 +2,109 @@
 
 import streamlit as st
 import pandas as pd
+from functools import partial
 from io import BytesIO
 from src.export_service import ExportService
+from pages.error_utils import handle_export_error
 
 
-def render_export_buttons(data_df: pd.DataFrame, filename_prefix: str):
+# Row count above which Excel exports are streamed instead of built in memory
+STREAMING_EXCEL_ROWS = 50_000
+
+
+@st.cache_resource(show_spinner=False)
+def _export_service() -> ExportService:
+    """Get the ExportService instance shared across reruns"""
+    return ExportService()
+
+
+def _to_excel_streaming(data_df: pd.DataFrame) -> bytes:
     """
-    Render export buttons for CSV and Excel formats
+    Serialize a DataFrame to Excel bytes without building the full workbook in memory
+    
+    Uses an openpyxl write-only workbook that appends rows as they are produced.
     
     Args:
         data_df: DataFrame to export
+    
+    Returns:
+        Excel data as bytes
+    """
+    from openpyxl import Workbook
+    
+    buffer = BytesIO()
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Data")
+    worksheet.append([str(column) for column in data_df.columns])
+    rows = data_df.astype(object).where(data_df.notna(), None)
+    for row in rows.itertuples(index=False, name=None):
+        worksheet.append(row)
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv(data_df: pd.DataFrame, filename: str) -> bytes:
+    """Serialize a DataFrame to CSV bytes, cached by DataFrame content"""
+    return _export_service().export_to_csv(data_df, filename)
+
+
+@st.cache_data(show_spinner=False)
+def _to_excel(data_df: pd.DataFrame, filename: str) -> bytes:
+    """Serialize a DataFrame to Excel bytes, cached by DataFrame content"""
+    if len(data_df) > STREAMING_EXCEL_ROWS:
+        return _to_excel_streaming(data_df)
+    return _export_service().export_to_excel(data_df, filename)
+
+
+def _export_bytes(serializer, data_df, filename: str) -> bytes:
+    """Build the export DataFrame if it was deferred, then serialize it"""
+    if callable(data_df):
+        data_df = data_df()
+    return serializer(data_df, filename)
+
+
+def render_export_buttons(data_df, filename_prefix: str):
+    """
+    Render export buttons for CSV and Excel formats
+    
+    Files are serialized only when a download button is clicked, not on every rerun.
+    
+    Args:
+        data_df: DataFrame to export, or a zero-argument callable that builds it;
+            a callable is only invoked when a download button is clicked
         filename_prefix: Prefix for the exported filename (e.g., "shipments", "inventory")
     """
-    if data_df is None or data_df.empty:
+    if data_df is None or (not callable(data_df) and data_df.empty):
         st.info("No data available to export")
         return
     
     col1, col2 = st.columns(2)
     
-    export_service = ExportService()
-    
     with col1:
         try:
-            with st.spinner("Preparing CSV export..."):
-                csv_data = export_service.export_to_csv(data_df, f"{filename_prefix}.csv")
             st.download_button(
                 label="📥 Export to CSV",
-                data=csv_data,
+                data=partial(_export_bytes, _to_csv, data_df, f"{filename_prefix}.csv"),
                 file_name=f"{filename_prefix}.csv",
                 mime="text/csv",
                 use_container_width=True,
                 help="Download data as CSV file"
             )
         except Exception as e:
-            from pages.error_utils import handle_export_error
             handle_export_error(e, "CSV")
     
     with col2:
         try:
-            with st.spinner("Preparing Excel export..."):
-                excel_data = export_service.export_to_excel(data_df, f"{filename_prefix}.xlsx")
             st.download_button(
                 label="📥 Export to Excel",
-                data=excel_data,
+                data=partial(_export_bytes, _to_excel, data_df, f"{filename_prefix}.xlsx"),
                 file_name=f"{filename_prefix}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 use_container_width=True,
                 help="Download data as Excel file"
             )
         except Exception as e:
-            from pages.error_utils import handle_export_error
             handle_export_error(e, "Excel")
 
 
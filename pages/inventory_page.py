@@ -1,9 +1,23 @@
 """Inventory page for Supply Chain Visibility application"""
 
 import streamlit as st
+from functools import partial
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 from src.inventory_monitor import InventoryMonitor
+from src.filter_engine import FilterCriteria
+from pages.data_utils import facet_values, get_data, index_by_id
+from pages.chart_utils import MAX_CHART_POINTS, lttb_indices
+from pages.table_utils import render_paginated_dataframe
+from pages.inventory_utils import (
+    inventory_export_dataframe,
+    inventory_frame,
+    inventory_table_dataframe,
+    stock_levels,
+)
+from pages.tooltip_utils import render_help_section
+from pages.export_utils import render_export_buttons
 
 
 def render_inventory_page():
@@ -11,7 +25,6 @@ def render_inventory_page():
     st.title("📦 Inventory Management")
     
     # Help section
-    from pages.tooltip_utils import render_help_section
     render_help_section("Inventory")
     
     # Load data
@@ -20,13 +33,21 @@ def render_inventory_page():
         st.error("❌ Failed to load inventory data")
         return
     
+    # Filters and everything they drive rerun as a fragment, so widget
+    # changes skip the page header and data loading
+    render_inventory_view(data)
+
+
+@st.fragment
+def render_inventory_view(data):
+    """Render the inventory filters and the overview, table, trends and export they drive"""
     monitor = InventoryMonitor(data)
     
     # Filter controls
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        locations = list(set([item.location for item in data.inventory]))
+        locations = facet_values(data, "inventory", "location")
         location_filter = st.multiselect(
             "Filter by location",
             options=locations,
@@ -35,7 +56,7 @@ def render_inventory_page():
         )
     
     with col2:
-        categories = list(set([item.category for item in data.inventory]))
+        categories = facet_values(data, "inventory", "category")
         category_filter = st.multiselect(
             "Filter by category",
             options=categories,
@@ -51,137 +72,100 @@ def render_inventory_page():
         )
     
     # Apply filters
-    from src.filter_engine import FilterCriteria
     filters = FilterCriteria(
         location=location_filter if location_filter else None,
-        category=category_filter if category_filter else None
+        category=category_filter if category_filter else None,
+        low_stock_only=(stock_status == "Low Stock")
     )
     
     inventory_items = monitor.get_inventory_levels(filters)
     
-    # Apply stock status filter
-    if stock_status == "Low Stock":
-        inventory_items = monitor.get_low_stock_items(threshold=None)
-        if filters.location:
-            inventory_items = [item for item in inventory_items if item.location in filters.location]
-        if filters.category:
-            inventory_items = [item for item in inventory_items if item.category in filters.category]
+    # Select matching rows of the cached inventory DataFrame with boolean masks
+    inventory_df = inventory_frame(data)
+    all_quantities, all_low_mask = stock_levels(inventory_df)
+    mask = inventory_df["ID"].isin({item.id for item in inventory_items}).to_numpy()
+    
+    # Low stock is filtered in the same pass above; only "Normal" remains
+    if stock_status == "Normal":
+        mask = mask & ~all_low_mask
+    
+    positions = np.flatnonzero(mask)
+    inventory_items = [data.inventory[i] for i in positions]
+    items_by_id = index_by_id(inventory_items)
+    inventory_df = inventory_df.iloc[positions]
+    
+    # Stock levels are compared once; the overview, table and export share the mask
+    quantities, low_mask = all_quantities[positions], all_low_mask[positions]
     
     # Display inventory overview
     st.markdown("---")
-    render_inventory_overview(inventory_items, monitor)
+    render_inventory_overview(inventory_df, quantities, low_mask)
     
     st.markdown("---")
     
     # Display inventory table
-    render_inventory_table(inventory_items)
+    render_inventory_table(items_by_id, inventory_df, low_mask)
     
     st.markdown("---")
     
     # Display inventory trends
     if inventory_items:
-        render_inventory_trends(inventory_items, monitor)
+        render_inventory_trends(items_by_id, monitor)
     
     # Export functionality
     if inventory_items:
         st.markdown("---")
         st.markdown("### Export Data")
-        from pages.export_utils import render_export_buttons
-        
-        # Convert inventory to DataFrame for export
-        df_export = pd.DataFrame([{
-            "ID": item.id,
-            "Name": item.name,
-            "Category": item.category,
-            "Location": item.location,
-            "Quantity": item.quantity,
-            "Unit": item.unit,
-            "Reorder Point": item.reorder_point,
-            "Low Stock": "Yes" if item.quantity < item.reorder_point else "No",
-            "Last Updated": item.last_updated.strftime("%Y-%m-%d %H:%M")
-        } for item in inventory_items])
         
-        render_export_buttons(df_export, "inventory")
+        # Export DataFrame is built only when a download is requested
+        render_export_buttons(partial(inventory_export_dataframe, inventory_df, low_mask), "inventory")
 
 
-def get_data():
-    """Get data from session state"""
-    if st.session_state.data_cache is None:
-        try:
-            data_service = st.session_state.data_service
-            data = data_service.load_data("csv")
-            st.session_state.data_cache = data
-            return data
-        except Exception:
-            return None
-    return st.session_state.data_cache
-
-
-def render_inventory_overview(inventory_items, monitor):
-    """Render inventory overview metrics"""
+def render_inventory_overview(inventory_df, quantities, low_mask):
+    """Render inventory overview metrics from the filtered DataFrame and stock arrays"""
     st.markdown("### Inventory Overview")
     
-    low_stock_items = [item for item in inventory_items if item.quantity < item.reorder_point]
-    total_value = sum([item.quantity for item in inventory_items])
+    total_value = quantities.sum()
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Items", len(inventory_items))
+        st.metric("Total Items", len(inventory_df))
     with col2:
-        st.metric("Low Stock", len(low_stock_items))
+        st.metric("Low Stock", int(low_mask.sum()))
     with col3:
         st.metric("Total Units", f"{total_value:,.0f}")
     with col4:
-        unique_locations = len(set([item.location for item in inventory_items]))
+        unique_locations = inventory_df["Location"].nunique()
         st.metric("Locations", unique_locations)
 
 
-def render_inventory_table(inventory_items):
+def render_inventory_table(items_by_id, inventory_df, low_mask):
     """Render inventory data table with low stock highlighting"""
     st.markdown("### Inventory Details")
     
-    if not inventory_items:
+    if not items_by_id:
         st.info("No inventory items found matching the current filters")
         return
     
     # Convert to DataFrame
-    df_data = []
-    for item in inventory_items:
-        is_low_stock = item.quantity < item.reorder_point
-        df_data.append({
-            "ID": item.id,
-            "Name": item.name,
-            "Category": item.category,
-            "Location": item.location,
-            "Quantity": item.quantity,
-            "Unit": item.unit,
-            "Reorder Point": item.reorder_point,
-            "Status": "🔴 Low Stock" if is_low_stock else "✅ Normal"
-        })
-    
-    df = pd.DataFrame(df_data)
-    
-    # Display table with styling
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True
-    )
+    df = inventory_table_dataframe(inventory_df, low_mask)
+    
+    # Display table one page at a time
+    render_paginated_dataframe(df, key="inventory_table")
     
     # Item detail view
     st.markdown("---")
     st.markdown("### View Item Details")
     
-    item_ids = [item.id for item in inventory_items]
     selected_id = st.selectbox(
         "Select an item to view details",
-        options=item_ids,
+        options=list(items_by_id),
         help="Choose an inventory item to see detailed information"
     )
     
     if selected_id:
-        selected_item = next((item for item in inventory_items if item.id == selected_id), None)
+        selected_item = items_by_id.get(selected_id)
         if selected_item:
             render_item_detail(selected_item)
 
@@ -212,16 +196,56 @@ def render_item_detail(item):
             st.markdown(f"**Last Updated:** {item.last_updated.strftime('%Y-%m-%d %H:%M')}")
 
 
-def render_inventory_trends(inventory_items, monitor):
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_trend_figure(name, dates, values, reorder_point):
+    """
+    Build the inventory trend line chart, reused while its inputs are unchanged
+    
+    Args:
+        name: Item name for the chart title
+        dates: Tuple of trend timestamps
+        values: Tuple of quantities aligned with dates
+        reorder_point: Item reorder point drawn as a reference line
+    
+    Returns:
+        Plotly Figure shared across reruns; treat it as read-only
+    """
+    trend_dates = pd.DatetimeIndex(dates)
+    trend_values = np.asarray(values, dtype=np.float64)
+    
+    # Downsample long series so only about a chart-width of points reaches the browser
+    if len(trend_dates) > MAX_CHART_POINTS:
+        keep = lttb_indices(trend_dates.asi8, trend_values)
+        trend_dates, trend_values = trend_dates[keep], trend_values[keep]
+    
+    # Fixed-schema chart, so build the trace directly instead of through plotly express
+    fig = go.Figure(go.Scattergl(x=trend_dates, y=trend_values, mode="lines", name="Quantity"))
+    fig.update_layout(
+        title=f"Inventory Trend - {name}",
+        xaxis_title="Date",
+        yaxis_title="Quantity"
+    )
+    
+    # Add reorder point line
+    fig.add_hline(
+        y=reorder_point,
+        line_dash="dash",
+        line_color="red",
+        annotation_text="Reorder Point"
+    )
+    
+    return fig
+
+
+def render_inventory_trends(items_by_id, monitor):
     """Render inventory trend charts"""
     st.markdown("### Inventory Trends")
     
     # Select item for trend analysis
-    item_names = {item.id: item.name for item in inventory_items}
     selected_item_id = st.selectbox(
         "Select item for trend analysis",
-        options=list(item_names.keys()),
-        format_func=lambda x: f"{x} - {item_names[x]}",
+        options=list(items_by_id),
+        format_func=lambda x: f"{x} - {items_by_id[x].name}",
         help="View historical inventory levels for the selected item"
     )
     
@@ -231,30 +255,16 @@ def render_inventory_trends(inventory_items, monitor):
             trend_data = monitor.get_inventory_trends(selected_item_id, days=30)
             
             if trend_data and len(trend_data.dates) > 0:
-                # Create trend chart
-                df_trend = pd.DataFrame({
-                    "Date": trend_data.dates,
-                    "Quantity": trend_data.values
-                })
-                
-                fig = px.line(
-                    df_trend,
-                    x="Date",
-                    y="Quantity",
-                    title=f"Inventory Trend - {item_names[selected_item_id]}",
-                    labels={"Quantity": "Quantity", "Date": "Date"}
+                # Create trend chart; timestamps are floored to the minute so
+                # reruns within the same minute reuse the cached figure
+                selected_item = items_by_id[selected_item_id]
+                fig = build_trend_figure(
+                    selected_item.name,
+                    tuple(pd.DatetimeIndex(trend_data.dates).floor("min")),
+                    tuple(trend_data.values),
+                    selected_item.reorder_point
                 )
                 
-                # Add reorder point line
-                selected_item = next((item for item in inventory_items if item.id == selected_item_id), None)
-                if selected_item:
-                    fig.add_hline(
-                        y=selected_item.reorder_point,
-                        line_dash="dash",
-                        line_color="red",
-                        annotation_text="Reorder Point"
-                    )
-                
                 st.plotly_chart(fig, use_container_width=True)
             else:
                 st.info("No historical trend data available for this item")
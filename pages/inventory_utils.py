@@ -0,0 +1,112 @@
+"""Inventory table utility functions for Streamlit pages"""
+
+from operator import attrgetter
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from pages.data_utils import data_fingerprint
+
+
+# Display format for inventory timestamps
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Display column -> InventoryItem attribute
+INVENTORY_COLUMNS = {
+    "ID": "id",
+    "Name": "name",
+    "Category": "category",
+    "Location": "location",
+    "Quantity": "quantity",
+    "Unit": "unit",
+    "Reorder Point": "reorder_point",
+    "Last Updated": "last_updated"
+}
+
+_get_inventory_fields = attrgetter(*INVENTORY_COLUMNS.values())
+
+
+def inventory_to_dataframe(inventory_items):
+    """
+    Convert inventory items to a DataFrame built column by column
+
+    Args:
+        inventory_items: List of InventoryItem objects
+
+    Returns:
+        DataFrame with one row per item and the raw INVENTORY_COLUMNS values
+    """
+    columns = list(zip(*map(_get_inventory_fields, inventory_items))) or [()] * len(INVENTORY_COLUMNS)
+    return pd.DataFrame(dict(zip(INVENTORY_COLUMNS, columns)), columns=list(INVENTORY_COLUMNS))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _inventory_frame_cached(fingerprint, _data):
+    """Inventory DataFrame for a dataset, built once per dataset"""
+    return inventory_to_dataframe(_data.inventory)
+
+
+def inventory_frame(data):
+    """
+    Get the inventory DataFrame for a dataset, reused across reruns
+
+    Rows are in the same order as data.inventory.
+
+    Args:
+        data: SupplyChainData object
+
+    Returns:
+        DataFrame as built by inventory_to_dataframe
+    """
+    return _inventory_frame_cached(data_fingerprint(data), data)
+
+
+def stock_levels(inventory_df):
+    """
+    Extract stock quantities and the low stock mask in one vectorized pass
+
+    Args:
+        inventory_df: DataFrame from inventory_frame
+
+    Returns:
+        Tuple of (quantity array, boolean array True where quantity < reorder point)
+    """
+    quantities = inventory_df["Quantity"].to_numpy(dtype=np.float64)
+    return quantities, quantities < inventory_df["Reorder Point"].to_numpy(dtype=np.float64)
+
+
+def inventory_table_dataframe(inventory_df, low_mask):
+    """
+    Build the inventory details table with a low stock status column
+
+    Args:
+        inventory_df: DataFrame from inventory_frame
+        low_mask: Boolean low stock array aligned with inventory_df
+
+    Returns:
+        DataFrame for display in the inventory details table
+    """
+    df = inventory_df.drop(columns=["Last Updated"])
+    df["Status"] = np.where(low_mask, "🔴 Low Stock", "✅ Normal")
+    return df
+
+
+def inventory_export_dataframe(inventory_df, low_mask):
+    """
+    Build the inventory export DataFrame
+
+    Args:
+        inventory_df: DataFrame from inventory_frame
+        low_mask: Boolean low stock array aligned with inventory_df
+
+    Returns:
+        DataFrame for CSV/Excel export
+    """
+    df = inventory_df.copy()
+    df.insert(
+        df.columns.get_loc("Last Updated"),
+        "Low Stock",
+        np.where(low_mask, "Yes", "No")
+    )
+    df["Last Updated"] = pd.to_datetime(df["Last Updated"]).dt.strftime(TIME_FORMAT)
+    return df
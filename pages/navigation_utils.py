@@ -0,0 +1,48 @@
+"""Page routing utility functions for Streamlit pages"""
+
+import importlib
+from functools import lru_cache
+
+import streamlit as st
+
+
+# Page name -> (module path, render function name)
+PAGES = {
+    "Dashboard": ("pages.dashboard_page", "render_dashboard_page"),
+    "Shipments": ("pages.shipments_page", "render_shipments_page"),
+    "Inventory": ("pages.inventory_page", "render_inventory_page"),
+    "Network": ("pages.network_page", "render_network_page"),
+    "Alerts": ("pages.alerts_page", "render_alerts_page"),
+    "Suppliers": ("pages.suppliers_page", "render_suppliers_page"),
+}
+
+
+@lru_cache(maxsize=None)
+def get_page_renderer(page_name: str):
+    """
+    Resolve the render function for a page, importing its module only once
+
+    Lives outside app.py because Streamlit re-executes the main script on
+    every rerun, which would discard a cache defined there.
+
+    Args:
+        page_name: Name of the page (Dashboard, Shipments, etc.)
+
+    Returns:
+        Callable that renders the page
+    """
+    module_name, function_name = PAGES[page_name]
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def navigate_to(page_name: str):
+    """
+    Button callback that switches the current page
+
+    Runs before the script reruns, so the click renders the new page
+    directly without an extra st.rerun()
+
+    Args:
+        page_name: Name of the page to show
+    """
+    st.session_state.current_page = page_name
@@ -1,7 +1,10 @@
 """Network visualization page for Supply Chain Visibility application"""
 
 import streamlit as st
+import heapq
 from src.network_visualizer import NetworkVisualizer
+from pages.data_utils import data_fingerprint, get_data, id_positions
+from pages.tooltip_utils import render_help_section
 
 
 def render_network_page():
@@ -9,7 +12,6 @@ def render_network_page():
     st.title("🌐 Supply Chain Network")
     
     # Help section
-    from pages.tooltip_utils import render_help_section
     render_help_section("Network")
     
     # Load data
@@ -18,7 +20,7 @@ def render_network_page():
         st.error("❌ Failed to load network data")
         return
     
-    visualizer = NetworkVisualizer()
+    visualizer = NetworkVisualizer(data)
     
     # View toggle
     col1, col2 = st.columns([3, 1])
@@ -47,23 +49,34 @@ def render_network_page():
     render_node_details(data, visualizer)
 
 
-def get_data():
-    """Get data from session state"""
-    if st.session_state.data_cache is None:
-        try:
-            data_service = st.session_state.data_service
-            data = data_service.load_data("csv")
-            st.session_state.data_cache = data
-            return data
-        except Exception:
-            return None
-    return st.session_state.data_cache
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _network_figure_cached(fingerprint, view, _data):
+    """Build a network figure once per dataset and view"""
+    visualizer = NetworkVisualizer(_data)
+    if view == "map":
+        nodes_with_coords = [n for n in _data.nodes if n.latitude is not None and n.longitude is not None]
+        return visualizer.render_geographic_map(nodes_with_coords)
+    return visualizer.render_network(_data.nodes, _data.edges)
+
+
+def get_network_figure(data, view):
+    """
+    Get the network diagram or geographic map figure, reused across reruns
+    
+    Args:
+        data: SupplyChainData object
+        view: "diagram" or "map"
+    
+    Returns:
+        Plotly Figure shared across reruns; treat it as read-only
+    """
+    return _network_figure_cached(data_fingerprint(data), view, data)
 
 
 def render_network_diagram(data, visualizer):
     """Render network diagram visualization"""
     try:
-        fig = visualizer.render_network(data.nodes, data.edges)
+        fig = get_network_figure(data, "diagram")
         
         # Add legend for node status colors
         st.markdown("""
@@ -91,7 +104,7 @@ def render_geographic_map(data, visualizer):
             st.info("Geographic map requires latitude and longitude data for nodes")
             return
         
-        fig = visualizer.render_geographic_map(nodes_with_coords)
+        fig = get_network_figure(data, "map")
         
         # Add legend
         st.markdown("""
@@ -126,7 +139,7 @@ def render_node_details(data, visualizer):
     
     if selected_node_id:
         try:
-            node_details = visualizer.get_node_details(selected_node_id, data)
+            node_details = visualizer.get_node_details(selected_node_id)
             render_node_detail_card(node_details, data)
         except Exception as e:
             st.error(f"Failed to load node details: {str(e)}")
@@ -166,11 +179,17 @@ def render_node_detail_card(node_details, data):
             st.markdown("---")
             st.markdown(f"**Connected Shipments:** {len(node_details.connected_shipment_ids)}")
             
-            # Show shipment details
-            shipments = [s for s in data.shipments if s.id in node_details.connected_shipment_ids]
+            # Look up only the first 10 connected shipments (in data order) through the id index
+            positions = id_positions(data, "shipments")
+            shipments = [
+                data.shipments[position]
+                for position in heapq.nsmallest(
+                    10, (positions[sid] for sid in node_details.connected_shipment_ids if sid in positions)
+                )
+            ]
             if shipments:
                 shipment_data = []
-                for shipment in shipments[:10]:  # Limit to 10 for display
+                for shipment in shipments:  # Limited to 10 for display
                     shipment_data.append(f"- {shipment.id}: {shipment.origin} → {shipment.destination} ({shipment.status.value})")
                 
                 st.markdown("\n".join(shipment_data))
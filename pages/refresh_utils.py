@@ -1,7 +1,9 @@
 """Data refresh utility functions for Streamlit pages"""
 
 import streamlit as st
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from pages.data_utils import load_cached_data, clear_data_cache
 
 
 def init_refresh_config():
@@ -14,6 +16,10 @@ def init_refresh_config():
     
     if 'last_refresh' not in st.session_state:
         st.session_state.last_refresh = None
+    
+    # Monotonic deadline for the next automatic refresh (0 = refresh immediately)
+    if 'next_refresh_ts' not in st.session_state:
+        st.session_state.next_refresh_ts = 0.0
 
 
 def render_refresh_controls():
@@ -39,7 +45,10 @@ def render_refresh_controls():
             step=30,
             help="How often to automatically refresh data"
         )
-        st.session_state.refresh_interval = interval
+        if interval != st.session_state.refresh_interval:
+            # Keep the deadline relative to the last refresh under the new interval
+            st.session_state.next_refresh_ts += interval - st.session_state.refresh_interval
+            st.session_state.refresh_interval = interval
     
     # Manual refresh button
     if st.sidebar.button("🔄 Refresh Now", use_container_width=True):
@@ -63,25 +72,25 @@ def render_refresh_controls():
 def refresh_data():
     """Refresh data from source"""
     try:
-        data_service = st.session_state.data_service
-        data = data_service.refresh_data("data")
+        clear_data_cache()
+        data = load_cached_data("csv")
         st.session_state.data_cache = data
-        st.session_state.last_refresh = datetime.now()
+        mark_refreshed()
         st.sidebar.success("✅ Data refreshed")
     except Exception as e:
         st.sidebar.error(f"❌ Refresh failed: {str(e)}")
 
 
+def mark_refreshed():
+    """Record a data refresh and schedule the next automatic one on the monotonic clock"""
+    st.session_state.last_refresh = datetime.now()
+    st.session_state.next_refresh_ts = time.monotonic() + st.session_state.refresh_interval
+
+
 def check_auto_refresh():
     """Check if auto-refresh should trigger"""
-    if not st.session_state.auto_refresh_enabled:
-        return False
-    
-    if st.session_state.last_refresh is None:
-        return True
-    
-    time_since = datetime.now() - st.session_state.last_refresh
-    return time_since.total_seconds() >= st.session_state.refresh_interval
+    # Single float compare against the deadline set by mark_refreshed
+    return st.session_state.auto_refresh_enabled and time.monotonic() >= st.session_state.get('next_refresh_ts', 0)
 
 
 def handle_auto_refresh():
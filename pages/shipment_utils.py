@@ -0,0 +1,125 @@
+"""Shipment table utility functions for Streamlit pages"""
+
+from operator import attrgetter
+
+import pandas as pd
+import streamlit as st
+from pages.data_utils import data_fingerprint
+
+
+# Display format for shipment timestamps
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Shipment status values in display order
+STATUS_VALUES = ("pending", "in_transit", "delayed", "delivered")
+
+# Display labels for status values, mapped over whole columns at once
+STATUS_LABELS = {
+    "pending": "⏳ Pending",
+    "in_transit": "🚚 In Transit",
+    "delayed": "⚠️ Delayed",
+    "delivered": "✅ Delivered"
+}
+
+_get_frame_fields = attrgetter(
+    "id", "origin", "destination", "current_location", "status",
+    "estimated_delivery", "actual_delivery", "supplier_id", "items"
+)
+
+
+def shipments_to_dataframe(shipments):
+    """
+    Convert shipments to a DataFrame built column by column
+
+    Args:
+        shipments: List of Shipment objects
+
+    Returns:
+        DataFrame with one row per shipment; timestamps stay as datetime columns
+    """
+    (ids, origins, destinations, locations, statuses,
+     estimated, actual, supplier_ids, items) = list(zip(*map(_get_frame_fields, shipments))) or [()] * 9
+
+    return pd.DataFrame({
+        "ID": ids,
+        "Origin": origins,
+        "Destination": destinations,
+        "Current Location": locations,
+        "Status": [status.value for status in statuses],
+        "Estimated Delivery": pd.to_datetime(pd.Series(estimated, dtype=object)),
+        "Actual Delivery": pd.to_datetime(pd.Series(actual, dtype=object)),
+        "Supplier ID": supplier_ids,
+        "Items": pd.Series(items, dtype=object).str.join(", ").fillna("")
+    })
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _shipments_frame_cached(fingerprint, _data):
+    """Shipments DataFrame for a dataset, built once per dataset"""
+    return shipments_to_dataframe(_data.shipments)
+
+
+def shipments_frame(data):
+    """
+    Get the shipments DataFrame for a dataset, reused across reruns
+
+    Rows are in the same order as data.shipments.
+
+    Args:
+        data: SupplyChainData object
+
+    Returns:
+        DataFrame as built by shipments_to_dataframe
+    """
+    return _shipments_frame_cached(data_fingerprint(data), data)
+
+
+def status_counts(shipments_df):
+    """
+    Count shipments per status in one hash aggregate
+
+    Args:
+        shipments_df: DataFrame from shipments_frame
+
+    Returns:
+        Dictionary of counts keyed by every value in STATUS_VALUES
+    """
+    counts = shipments_df["Status"].value_counts()
+    return {status: int(counts.get(status, 0)) for status in STATUS_VALUES}
+
+
+def shipments_table_dataframe(shipments_df):
+    """
+    Build the shipment details table
+
+    Args:
+        shipments_df: DataFrame from shipments_frame
+
+    Returns:
+        DataFrame for display in the shipment details table
+    """
+    return pd.DataFrame({
+        "ID": shipments_df["ID"],
+        "Origin": shipments_df["Origin"],
+        "Destination": shipments_df["Destination"],
+        "Current Location": shipments_df["Current Location"],
+        "Status": shipments_df["Status"].map(STATUS_LABELS),
+        "Est. Delivery": shipments_df["Estimated Delivery"].dt.strftime(TIME_FORMAT).fillna("N/A"),
+        "Supplier": shipments_df["Supplier ID"]
+    })
+
+
+def shipments_export_dataframe(shipments_df):
+    """
+    Build the shipments export DataFrame
+
+    Args:
+        shipments_df: DataFrame from shipments_frame
+
+    Returns:
+        DataFrame for CSV/Excel export
+    """
+    df = shipments_df.copy()
+    for column in ("Estimated Delivery", "Actual Delivery"):
+        df[column] = df[column].dt.strftime(TIME_FORMAT).fillna("")
+    return df
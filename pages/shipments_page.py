@@ -1,9 +1,21 @@
 """Shipments page for Supply Chain Visibility application"""
 
 import streamlit as st
-import pandas as pd
+from functools import partial
+import numpy as np
 from src.shipment_tracker import ShipmentTracker
 from src.filter_engine import FilterEngine
+from pages.data_utils import get_data, index_by_id
+from pages.table_utils import render_paginated_dataframe
+from pages.shipment_utils import (
+    STATUS_LABELS,
+    shipments_export_dataframe,
+    shipments_frame,
+    shipments_table_dataframe,
+    status_counts,
+)
+from pages.tooltip_utils import render_help_section
+from pages.export_utils import render_export_buttons
 
 
 def render_shipments_page():
@@ -11,7 +23,6 @@ def render_shipments_page():
     st.title("🚚 Shipment Tracking")
     
     # Help section
-    from pages.tooltip_utils import render_help_section
     render_help_section("Shipments")
     
     # Load data
@@ -20,6 +31,14 @@ def render_shipments_page():
         st.error("❌ Failed to load shipment data")
         return
     
+    # Search, filters and everything they drive rerun as a fragment, so widget
+    # changes skip the page header and data loading
+    render_shipments_view(data)
+
+
+@st.fragment
+def render_shipments_view(data):
+    """Render the shipment search and filters and the summary, table and export they drive"""
     tracker = ShipmentTracker(data)
     
     # Search and filter controls
@@ -46,77 +65,55 @@ def render_shipments_page():
     else:
         shipments = tracker.list_shipments(st.session_state.filters)
     
+    # Select matching rows of the cached shipments DataFrame with boolean masks
+    shipments_df = shipments_frame(data)
+    mask = shipments_df["ID"].isin({s.id for s in shipments})
+    
     # Apply status filter
     if status_filter:
-        shipments = [s for s in shipments if s.status.value in status_filter]
+        mask &= shipments_df["Status"].isin(frozenset(status_filter))
+    
+    shipments_df = shipments_df[mask]
+    shipments = [data.shipments[i] for i in np.flatnonzero(mask.to_numpy())]
     
     # Display shipments by status category
     st.markdown("---")
-    render_shipments_by_status(shipments)
+    render_shipments_by_status(shipments_df)
     
     st.markdown("---")
     
     # Display shipments table
-    render_shipments_table(shipments)
+    render_shipments_table(shipments, shipments_df)
     
     # Export functionality
     if shipments:
         st.markdown("---")
         st.markdown("### Export Data")
-        from pages.export_utils import render_export_buttons
-        
-        # Convert shipments to DataFrame for export
-        df_export = pd.DataFrame([{
-            "ID": s.id,
-            "Origin": s.origin,
-            "Destination": s.destination,
-            "Current Location": s.current_location,
-            "Status": s.status.value,
-            "Estimated Delivery": s.estimated_delivery.strftime("%Y-%m-%d %H:%M") if s.estimated_delivery else "",
-            "Actual Delivery": s.actual_delivery.strftime("%Y-%m-%d %H:%M") if s.actual_delivery else "",
-            "Supplier ID": s.supplier_id,
-            "Items": ", ".join(s.items) if s.items else ""
-        } for s in shipments])
         
-        render_export_buttons(df_export, "shipments")
+        # Export DataFrame is built only when a download is requested
+        render_export_buttons(partial(shipments_export_dataframe, shipments_df), "shipments")
 
 
-def get_data():
-    """Get data from session state"""
-    if st.session_state.data_cache is None:
-        try:
-            data_service = st.session_state.data_service
-            data = data_service.load_data("csv")
-            st.session_state.data_cache = data
-            return data
-        except Exception:
-            return None
-    return st.session_state.data_cache
-
-
-def render_shipments_by_status(shipments):
+def render_shipments_by_status(shipments_df):
     """Render shipment counts by status category"""
     st.markdown("### Shipments by Status")
     
-    # Categorize shipments
-    pending = [s for s in shipments if s.status.value == "pending"]
-    in_transit = [s for s in shipments if s.status.value == "in_transit"]
-    delayed = [s for s in shipments if s.status.value == "delayed"]
-    delivered = [s for s in shipments if s.status.value == "delivered"]
+    # Count every status in one pass
+    counts = status_counts(shipments_df)
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Pending", len(pending))
+        st.metric("Pending", counts["pending"])
     with col2:
-        st.metric("In Transit", len(in_transit))
+        st.metric("In Transit", counts["in_transit"])
     with col3:
-        st.metric("Delayed", len(delayed))
+        st.metric("Delayed", counts["delayed"])
     with col4:
-        st.metric("Delivered", len(delivered))
+        st.metric("Delivered", counts["delivered"])
 
 
-def render_shipments_table(shipments):
+def render_shipments_table(shipments, shipments_df):
     """Render shipments data table with detail view"""
     st.markdown("### Shipment Details")
     
@@ -125,40 +122,24 @@ def render_shipments_table(shipments):
         return
     
     # Convert to DataFrame for display
-    df_data = []
-    for shipment in shipments:
-        df_data.append({
-            "ID": shipment.id,
-            "Origin": shipment.origin,
-            "Destination": shipment.destination,
-            "Current Location": shipment.current_location,
-            "Status": shipment.status.value.replace("_", " ").title(),
-            "Est. Delivery": shipment.estimated_delivery.strftime("%Y-%m-%d %H:%M") if shipment.estimated_delivery else "N/A",
-            "Supplier": shipment.supplier_id
-        })
-    
-    df = pd.DataFrame(df_data)
-    
-    # Display table
-    st.dataframe(
-        df,
-        use_container_width=True,
-        hide_index=True
-    )
+    df = shipments_table_dataframe(shipments_df)
+    
+    # Display table one page at a time
+    render_paginated_dataframe(df, key="shipments_table")
     
     # Shipment detail view
     st.markdown("---")
     st.markdown("### View Shipment Details")
     
-    shipment_ids = [s.id for s in shipments]
+    shipments_by_id = index_by_id(shipments)
     selected_id = st.selectbox(
         "Select a shipment to view details",
-        options=shipment_ids,
+        options=list(shipments_by_id),
         help="Choose a shipment to see detailed information"
     )
     
     if selected_id:
-        selected_shipment = next((s for s in shipments if s.id == selected_id), None)
+        selected_shipment = shipments_by_id.get(selected_id)
         if selected_shipment:
             render_shipment_detail(selected_shipment)
 
@@ -175,14 +156,7 @@ def render_shipment_detail(shipment):
             st.markdown(f"**Current Location:** {shipment.current_location}")
         
         with col2:
-            status_emoji = {
-                "pending": "⏳",
-                "in_transit": "🚚",
-                "delayed": "⚠️",
-                "delivered": "✅"
-            }
-            emoji = status_emoji.get(shipment.status.value, "📦")
-            st.markdown(f"**Status:** {emoji} {shipment.status.value.replace('_', ' ').title()}")
+            st.markdown(f"**Status:** {STATUS_LABELS[shipment.status.value]}")
             st.markdown(f"**Estimated Delivery:** {shipment.estimated_delivery.strftime('%Y-%m-%d %H:%M')}")
             if shipment.actual_delivery:
                 st.markdown(f"**Actual Delivery:** {shipment.actual_delivery.strftime('%Y-%m-%d %H:%M')}")
@@ -0,0 +1,158 @@
+"""Supplier table utility functions for Streamlit pages"""
+
+from operator import attrgetter
+
+import pandas as pd
+import streamlit as st
+from src.supplier_tracker import RankingCriteria, SupplierPerformanceTracker
+from pages.data_utils import data_fingerprint
+
+
+# Display format for supplier timestamps
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Export column -> Supplier attribute
+SUPPLIER_COLUMNS = {
+    "ID": "id",
+    "Name": "name",
+    "Contact": "contact",
+    "Performance Score": "performance_score",
+    "On-Time Delivery Rate": "on_time_delivery_rate",
+    "Quality Score": "quality_score",
+    "Average Lead Time": "average_lead_time",
+    "Total Shipments": "total_shipments",
+    "Last Updated": "last_updated"
+}
+
+_get_supplier_fields = attrgetter(*SUPPLIER_COLUMNS.values())
+
+# Rankings table column -> Supplier attribute; values stay numeric and are
+# formatted by the table's column config in the browser
+RANKING_COLUMNS = {
+    "Supplier": "name",
+    "Performance Score": "performance_score",
+    "On-Time Rate": "on_time_delivery_rate",
+    "Quality Score": "quality_score",
+    "Avg Lead Time": "average_lead_time",
+    "Total Shipments": "total_shipments"
+}
+
+_get_ranking_fields = attrgetter(*RANKING_COLUMNS.values())
+
+
+def suppliers_export_dataframe(suppliers):
+    """
+    Build the suppliers export DataFrame column by column
+
+    Args:
+        suppliers: List of Supplier objects
+
+    Returns:
+        DataFrame for CSV/Excel export
+    """
+    columns = list(zip(*map(_get_supplier_fields, suppliers))) or [()] * len(SUPPLIER_COLUMNS)
+    df = pd.DataFrame(dict(zip(SUPPLIER_COLUMNS, columns)), columns=list(SUPPLIER_COLUMNS))
+    df["Last Updated"] = pd.to_datetime(df["Last Updated"]).dt.strftime(TIME_FORMAT)
+    return df
+
+
+def rankings_dataframe(ranked_suppliers, suppliers_by_id):
+    """
+    Build the supplier rankings table column by column
+
+    Args:
+        ranked_suppliers: List of SupplierRanking objects, best first
+        suppliers_by_id: Dictionary mapping supplier id to Supplier
+
+    Returns:
+        DataFrame with a Rank column followed by the numeric RANKING_COLUMNS
+    """
+    ranks, suppliers = [], []
+    for rank, ranking in enumerate(ranked_suppliers, 1):
+        supplier = suppliers_by_id.get(ranking.supplier_id)
+        if supplier:
+            ranks.append(rank)
+            suppliers.append(supplier)
+
+    columns = list(zip(*map(_get_ranking_fields, suppliers))) or [()] * len(RANKING_COLUMNS)
+    return pd.DataFrame({"Rank": ranks, **dict(zip(RANKING_COLUMNS, columns))})
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _tracker_cached(fingerprint, _data):
+    """Build the SupplierPerformanceTracker once per dataset instead of on every rerun"""
+    return SupplierPerformanceTracker(_data)
+
+
+def get_supplier_tracker(data):
+    """
+    Get the supplier performance tracker for a dataset, reused across reruns
+
+    Args:
+        data: SupplyChainData object
+
+    Returns:
+        SupplierPerformanceTracker shared across reruns
+    """
+    return _tracker_cached(data_fingerprint(data), data)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _rankings_cached(fingerprint, metric: str, _data):
+    """Supplier rankings for a dataset and metric, computed once per pair"""
+    return get_supplier_tracker(_data).rank_suppliers(RankingCriteria(metric=metric, ascending=False))
+
+
+def rank_suppliers(data, metric: str):
+    """
+    Rank suppliers best first by a metric, skipping the ranking pass on unrelated reruns
+
+    Args:
+        data: SupplyChainData object
+        metric: Metric name accepted by RankingCriteria (e.g. "performance_score")
+
+    Returns:
+        List of SupplierRanking objects ordered by rank
+    """
+    return _rankings_cached(data_fingerprint(data), metric, data)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _supplier_metrics_cached(fingerprint, supplier_id: str, _data):
+    """Performance metrics for one supplier of a dataset"""
+    return get_supplier_tracker(_data).get_supplier_metrics(supplier_id)
+
+
+def supplier_metrics(data, supplier_id: str):
+    """
+    Get performance metrics for a supplier, cached per dataset
+
+    Args:
+        data: SupplyChainData object
+        supplier_id: Unique identifier for the supplier
+
+    Returns:
+        SupplierMetrics object
+    """
+    return _supplier_metrics_cached(data_fingerprint(data), supplier_id, data)
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=64)
+def _performance_history_cached(fingerprint, supplier_id: str, days: int, _data):
+    """Performance history for one supplier; the window ends at now, so entries expire"""
+    return get_supplier_tracker(_data).get_performance_history(supplier_id, days=days)
+
+
+def performance_history(data, supplier_id: str, days: int = 90):
+    """
+    Get a supplier's performance history, cached per dataset for a few minutes
+
+    Args:
+        data: SupplyChainData object
+        supplier_id: Unique identifier for the supplier
+        days: Number of days of history to retrieve
+
+    Returns:
+        Performance history as returned by SupplierPerformanceTracker.get_performance_history
+    """
+    return _performance_history_cached(data_fingerprint(data), supplier_id, days, data)
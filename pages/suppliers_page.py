@@ -1,9 +1,19 @@
 """Suppliers page for Supply Chain Visibility application"""
 
 import streamlit as st
+from functools import partial
 import pandas as pd
 import plotly.express as px
-from src.supplier_tracker import SupplierPerformanceTracker
+from pages.data_utils import facet_values, get_data, index_by_id
+from pages.supplier_utils import (
+    performance_history,
+    rank_suppliers,
+    rankings_dataframe,
+    supplier_metrics,
+    suppliers_export_dataframe,
+)
+from pages.tooltip_utils import render_help_section, add_calculation_explanation
+from pages.export_utils import render_export_buttons
 
 
 def render_suppliers_page():
@@ -11,7 +21,6 @@ def render_suppliers_page():
     st.title("🏭 Supplier Performance")
     
     # Help section
-    from pages.tooltip_utils import render_help_section
     render_help_section("Suppliers")
     
     # Load data
@@ -20,7 +29,8 @@ def render_suppliers_page():
         st.error("❌ Failed to load supplier data")
         return
     
-    tracker = SupplierPerformanceTracker(data)
+    # Built once per render and shared by the ranking, comparison and detail views
+    suppliers_by_id = index_by_id(data.suppliers)
     
     # Ranking criteria selection
     col1, col2 = st.columns([3, 1])
@@ -36,109 +46,71 @@ def render_suppliers_page():
             help="Select the metric to rank suppliers by"
         )
     
-    # Get ranked suppliers
-    from src.supplier_tracker import RankingCriteria
-    criteria = RankingCriteria(metric=ranking_criteria, ascending=False)
-    ranked_suppliers = tracker.rank_suppliers(criteria)
+    # Get ranked suppliers (cached per dataset and metric)
+    ranked_suppliers = rank_suppliers(data, ranking_criteria)
     
     st.markdown("---")
     
     # Display supplier rankings table
-    render_supplier_rankings(ranked_suppliers, data)
+    render_supplier_rankings(ranked_suppliers, suppliers_by_id)
     
     st.markdown("---")
     
     # Supplier comparison view
-    render_supplier_comparison(data, tracker)
+    render_supplier_comparison(suppliers_by_id, data)
     
     st.markdown("---")
     
     # Detailed supplier metrics
-    render_supplier_details(data, tracker)
+    render_supplier_details(suppliers_by_id, data)
     
     # Export functionality
     if data.suppliers:
         st.markdown("---")
         st.markdown("### Export Data")
-        from pages.export_utils import render_export_buttons
         
-        # Convert suppliers to DataFrame for export
-        df_export = pd.DataFrame([{
-            "ID": supplier.id,
-            "Name": supplier.name,
-            "Contact": supplier.contact,
-            "Performance Score": supplier.performance_score,
-            "On-Time Delivery Rate": supplier.on_time_delivery_rate,
-            "Quality Score": supplier.quality_score,
-            "Average Lead Time": supplier.average_lead_time,
-            "Total Shipments": supplier.total_shipments,
-            "Last Updated": supplier.last_updated.strftime("%Y-%m-%d %H:%M")
-        } for supplier in data.suppliers])
-        
-        render_export_buttons(df_export, "suppliers")
-
+        # Export DataFrame is built only when a download is requested
+        render_export_buttons(partial(suppliers_export_dataframe, data.suppliers), "suppliers")
 
-def get_data():
-    """Get data from session state"""
-    if st.session_state.data_cache is None:
-        try:
-            data_service = st.session_state.data_service
-            data = data_service.load_data("csv")
-            st.session_state.data_cache = data
-            return data
-        except Exception:
-            return None
-    return st.session_state.data_cache
 
-
-def render_supplier_rankings(ranked_suppliers, data):
+def render_supplier_rankings(ranked_suppliers, suppliers_by_id):
     """Render supplier performance rankings table"""
     if not ranked_suppliers:
         st.info("No supplier data available")
         return
     
     # Add calculation explanation
-    from pages.tooltip_utils import add_calculation_explanation
     add_calculation_explanation("performance_score")
     
-    # Convert to DataFrame
-    df_data = []
-    for rank, ranking in enumerate(ranked_suppliers, 1):
-        supplier = next((s for s in data.suppliers if s.id == ranking.supplier_id), None)
-        if supplier:
-            df_data.append({
-                "Rank": rank,
-                "Supplier": supplier.name,
-                "Performance Score": f"{supplier.performance_score:.1f}",
-                "On-Time Rate": f"{supplier.on_time_delivery_rate:.1f}%",
-                "Quality Score": f"{supplier.quality_score:.1f}",
-                "Avg Lead Time": f"{supplier.average_lead_time:.1f} days",
-                "Total Shipments": supplier.total_shipments
-            })
-    
-    df = pd.DataFrame(df_data)
+    # Build numeric columns once; formatting happens client-side in the column config
+    df = rankings_dataframe(ranked_suppliers, suppliers_by_id)
     
     st.dataframe(
         df,
         use_container_width=True,
-        hide_index=True
+        hide_index=True,
+        column_config={
+            "Performance Score": st.column_config.NumberColumn(format="%.1f"),
+            "On-Time Rate": st.column_config.NumberColumn(format="%.1f%%"),
+            "Quality Score": st.column_config.NumberColumn(format="%.1f"),
+            "Avg Lead Time": st.column_config.NumberColumn(format="%.1f days")
+        }
     )
 
 
-def render_supplier_comparison(data, tracker):
+def render_supplier_comparison(suppliers_by_id, data):
     """Render supplier comparison view"""
     st.markdown("### Compare Suppliers")
     
-    if not data.suppliers:
+    if not suppliers_by_id:
         st.info("No suppliers available for comparison")
         return
     
     # Supplier selection for comparison
-    supplier_names = {s.id: s.name for s in data.suppliers}
     selected_suppliers = st.multiselect(
         "Select suppliers to compare (up to 5)",
-        options=list(supplier_names.keys()),
-        format_func=lambda x: supplier_names[x],
+        options=facet_values(data, "suppliers", "id"),
+        format_func=lambda x: suppliers_by_id[x].name,
         max_selections=5,
         help="Choose up to 5 suppliers to compare their performance metrics"
     )
@@ -150,8 +122,8 @@ def render_supplier_comparison(data, tracker):
     # Get metrics for selected suppliers
     comparison_data = []
     for supplier_id in selected_suppliers:
-        metrics = tracker.get_supplier_metrics(supplier_id)
-        supplier = next((s for s in data.suppliers if s.id == supplier_id), None)
+        metrics = supplier_metrics(data, supplier_id)
+        supplier = suppliers_by_id.get(supplier_id)
         if supplier and metrics:
             comparison_data.append({
                 "Supplier": supplier.name,
@@ -162,58 +134,86 @@ def render_supplier_comparison(data, tracker):
             })
     
     if comparison_data:
-        df_comparison = pd.DataFrame(comparison_data)
+        fig1, fig2 = build_comparison_figures(
+            tuple(row["Supplier"] for row in comparison_data),
+            tuple(row["Performance Score"] for row in comparison_data),
+            tuple(row["On-Time Rate"] for row in comparison_data)
+        )
         
         # Create comparison charts
         col1, col2 = st.columns(2)
         
         with col1:
-            fig1 = px.bar(
-                df_comparison,
-                x="Supplier",
-                y="Performance Score",
-                title="Performance Score Comparison",
-                color="Performance Score",
-                color_continuous_scale="RdYlGn"
-            )
             st.plotly_chart(fig1, use_container_width=True)
         
         with col2:
-            fig2 = px.bar(
-                df_comparison,
-                x="Supplier",
-                y="On-Time Rate",
-                title="On-Time Delivery Rate Comparison",
-                color="On-Time Rate",
-                color_continuous_scale="RdYlGn"
-            )
             st.plotly_chart(fig2, use_container_width=True)
 
 
-def render_supplier_details(data, tracker):
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_comparison_figures(names, performance_scores, on_time_rates):
+    """
+    Build the supplier comparison bar charts, reused while the selection is unchanged
+    
+    Args:
+        names: Tuple of supplier names in selection order
+        performance_scores: Tuple of performance scores aligned with names
+        on_time_rates: Tuple of on-time delivery rates aligned with names
+    
+    Returns:
+        Tuple of (performance score figure, on-time rate figure) shared across
+        reruns; treat them as read-only
+    """
+    df_comparison = pd.DataFrame({
+        "Supplier": names,
+        "Performance Score": performance_scores,
+        "On-Time Rate": on_time_rates
+    })
+    
+    fig1 = px.bar(
+        df_comparison,
+        x="Supplier",
+        y="Performance Score",
+        title="Performance Score Comparison",
+        color="Performance Score",
+        color_continuous_scale="RdYlGn"
+    )
+    
+    fig2 = px.bar(
+        df_comparison,
+        x="Supplier",
+        y="On-Time Rate",
+        title="On-Time Delivery Rate Comparison",
+        color="On-Time Rate",
+        color_continuous_scale="RdYlGn"
+    )
+    
+    return fig1, fig2
+
+
+def render_supplier_details(suppliers_by_id, data):
     """Render detailed supplier metrics and history"""
     st.markdown("### Supplier Details")
     
-    if not data.suppliers:
+    if not suppliers_by_id:
         st.info("No supplier data available")
         return
     
     # Supplier selection
-    supplier_names = {s.id: s.name for s in data.suppliers}
     selected_supplier_id = st.selectbox(
         "Select a supplier to view details",
-        options=list(supplier_names.keys()),
-        format_func=lambda x: supplier_names[x],
+        options=facet_values(data, "suppliers", "id"),
+        format_func=lambda x: suppliers_by_id[x].name,
         help="Choose a supplier to see detailed performance metrics and history"
     )
     
     if selected_supplier_id:
-        supplier = next((s for s in data.suppliers if s.id == selected_supplier_id), None)
+        supplier = suppliers_by_id.get(selected_supplier_id)
         if supplier:
-            render_supplier_detail_card(supplier, tracker)
+            render_supplier_detail_card(supplier, data)
 
 
-def render_supplier_detail_card(supplier, tracker):
+def render_supplier_detail_card(supplier, data):
     """Render detailed information card for a supplier"""
     with st.expander("🏭 Supplier Information", expanded=True):
         col1, col2 = st.columns(2)
@@ -264,20 +264,13 @@ def render_supplier_detail_card(supplier, tracker):
     st.markdown("### Performance History (90 days)")
     
     try:
-        history = tracker.get_performance_history(supplier.id, days=90)
+        history = performance_history(data, supplier.id, days=90)
         
-        if history and len(history.dates) > 0:
-            df_history = pd.DataFrame({
-                "Date": history.dates,
-                "Performance Score": history.values
-            })
-            
-            fig = px.line(
-                df_history,
-                x="Date",
-                y="Performance Score",
-                title=f"Performance Trend - {supplier.name}",
-                labels={"Performance Score": "Score", "Date": "Date"}
+        if history:
+            fig = build_history_figure(
+                supplier.name,
+                tuple(point.date for point in history),
+                tuple(point.on_time_delivery_rate for point in history)
             )
             
             st.plotly_chart(fig, use_container_width=True)
@@ -285,3 +278,30 @@ def render_supplier_detail_card(supplier, tracker):
             st.info("No historical performance data available for this supplier")
     except Exception as e:
         st.warning(f"Unable to load performance history: {str(e)}")
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_history_figure(name, dates, values):
+    """
+    Build the supplier performance history line chart, reused while its inputs are unchanged
+    
+    Args:
+        name: Supplier name for the chart title
+        dates: Tuple of period start dates
+        values: Tuple of on-time delivery rates aligned with dates
+    
+    Returns:
+        Plotly Figure shared across reruns; treat it as read-only
+    """
+    df_history = pd.DataFrame({
+        "Date": dates,
+        "On-Time Rate": values
+    })
+    
+    return px.line(
+        df_history,
+        x="Date",
+        y="On-Time Rate",
+        title=f"Performance Trend - {name}",
+        labels={"On-Time Rate": "On-Time Rate (%)", "Date": "Date"}
+    )
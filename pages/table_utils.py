@@ -0,0 +1,46 @@
+"""Table display utility functions for Streamlit pages"""
+
+import math
+
+import streamlit as st
+
+
+# Rows serialized to the browser per table page
+PAGE_SIZE = 100
+
+
+def render_paginated_dataframe(df, key: str, page_size: int = PAGE_SIZE):
+    """
+    Render a DataFrame one page at a time so only the visible slice is sent to the browser
+
+    Tables that fit on a single page are shown without pagination controls.
+
+    Args:
+        df: DataFrame to display
+        key: Unique widget key prefix for the page selector
+        page_size: Number of rows per page
+    """
+    n_pages = max(1, math.ceil(len(df) / page_size))
+
+    if n_pages > 1:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input(
+                "Page",
+                min_value=1,
+                max_value=n_pages,
+                value=1,
+                step=1,
+                key=f"{key}_page",
+                help=f"{len(df)} rows, {page_size} per page"
+            )
+        with col2:
+            start = (page - 1) * page_size
+            st.caption(f"Showing rows {start + 1}-{min(start + page_size, len(df))} of {len(df)}")
+        df = df.iloc[start:start + page_size]
+
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True
+    )
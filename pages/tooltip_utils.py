@@ -55,6 +55,125 @@ TOOLTIPS = {
 }
 
 
+# Help section text for each page, shown by render_help_section
+HELP_CONTENT = {
+    "Dashboard": """
+    **Dashboard Overview**
+    
+    The dashboard provides a high-level view of your supply chain health:
+    - **Total Shipments**: All active shipments being tracked
+    - **In Transit**: Shipments currently moving to their destination
+    - **Delayed**: Shipments behind schedule requiring attention
+    - **Low Stock Items**: Inventory below reorder thresholds
+    
+    Active alerts are displayed by severity to help prioritize responses.
+    """,
+    
+    "Shipments": """
+    **Shipment Tracking**
+    
+    Track all shipments across your supply chain:
+    - Use the search bar to find specific shipments by ID, origin, or destination
+    - Filter by status to focus on pending, in-transit, delayed, or delivered shipments
+    - Click on a shipment to view detailed information including route and timeline
+    - Export data for reporting and analysis
+    """,
+    
+    "Inventory": """
+    **Inventory Management**
+    
+    Monitor stock levels across all locations:
+    - Items below reorder point are highlighted in red
+    - Filter by location and category to focus on specific areas
+    - View 30-day trends to understand consumption patterns
+    - Use the reorder point as a guide for restocking decisions
+    """,
+    
+    "Network": """
+    **Network Visualization**
+    
+    Visualize your supply chain network:
+    - **Network Diagram**: Shows connections between nodes
+    - **Geographic Map**: Displays nodes on an interactive map (requires coordinates)
+    - Node colors indicate status: Green (normal), Yellow (congested), Red (disrupted)
+    - Select a node to see connected shipments and details
+    """,
+    
+    "Alerts": """
+    **Alert Management**
+    
+    Monitor and respond to supply chain disruptions:
+    - Alerts are generated automatically based on business rules
+    - Filter by type (shipment delay, low stock, supplier performance) and severity
+    - Acknowledge alerts to mark them as reviewed
+    - Critical and high-priority alerts require immediate attention
+    """,
+    
+    "Suppliers": """
+    **Supplier Performance**
+    
+    Track and compare supplier performance:
+    - **Performance Score**: Composite metric of overall reliability (0-100)
+    - **On-Time Rate**: Percentage of shipments delivered on schedule
+    - **Quality Score**: Assessment of product quality (0-100)
+    - **Lead Time**: Average days from order to delivery
+    - Compare multiple suppliers to inform sourcing decisions
+    """
+}
+
+
+# Metric calculation explanations, shown by add_calculation_explanation
+CALCULATION_EXPLANATIONS = {
+    "on_time_delivery_rate": """
+    **On-Time Delivery Rate Calculation:**
+    
+    ```
+    On-Time Rate = (Shipments Delivered On Time / Total Shipments) × 100
+    ```
+    
+    A shipment is considered "on time" if the actual delivery date is on or before 
+    the estimated delivery date. This metric is calculated over the past 90 days.
+    """,
+    
+    "performance_score": """
+    **Performance Score Calculation:**
+    
+    The performance score is a weighted composite of multiple factors:
+    - On-time delivery rate (40%)
+    - Quality score (30%)
+    - Lead time performance (20%)
+    - Communication and responsiveness (10%)
+    
+    Scores range from 0-100, with higher scores indicating better performance.
+    """,
+    
+    "low_stock_detection": """
+    **Low Stock Detection:**
+    
+    An item is flagged as low stock when:
+    ```
+    Current Quantity < Reorder Point
+    ```
+    
+    The reorder point is set based on:
+    - Average daily consumption rate
+    - Lead time for restocking
+    - Safety stock buffer
+    """,
+    
+    "alert_generation": """
+    **Alert Generation Rules:**
+    
+    Alerts are automatically generated when:
+    - **Shipment Delay**: Actual time > Estimated delivery + threshold
+    - **Low Stock**: Quantity < Reorder point
+    - **Supplier Performance**: Performance score < acceptable threshold
+    
+    Alert severity is determined by the magnitude of the deviation from normal.
+    """
+}
+
+
 def show_tooltip(key: str, label: str = None):
     """
     Display an info icon with tooltip for a metric or field
@@ -104,72 +223,7 @@ def render_help_section(page_name: str):
     Args:
         page_name: Name of the page (Dashboard, Shipments, etc.)
     """
-    help_content = {
-        "Dashboard": """
-        **Dashboard Overview**
-        
-        The dashboard provides a high-level view of your supply chain health:
-        - **Total Shipments**: All active shipments being tracked
-        - **In Transit**: Shipments currently moving to their destination
-        - **Delayed**: Shipments behind schedule requiring attention
-        - **Low Stock Items**: Inventory below reorder thresholds
-        
-        Active alerts are displayed by severity to help prioritize responses.
-        """,
-        
-        "Shipments": """
-        **Shipment Tracking**
-        
-        Track all shipments across your supply chain:
-        - Use the search bar to find specific shipments by ID, origin, or destination
-        - Filter by status to focus on pending, in-transit, delayed, or delivered shipments
-        - Click on a shipment to view detailed information including route and timeline
-        - Export data for reporting and analysis
-        """,
-        
-        "Inventory": """
-        **Inventory Management**
-        
-        Monitor stock levels across all locations:
-        - Items below reorder point are highlighted in red
-        - Filter by location and category to focus on specific areas
-        - View 30-day trends to understand consumption patterns
-        - Use the reorder point as a guide for restocking decisions
-        """,
-        
-        "Network": """
-        **Network Visualization**
-        
-        Visualize your supply chain network:
-        - **Network Diagram**: Shows connections between nodes
-        - **Geographic Map**: Displays nodes on an interactive map (requires coordinates)
-        - Node colors indicate status: Green (normal), Yellow (congested), Red (disrupted)
-        - Select a node to see connected shipments and details
-        """,
-        
-        "Alerts": """
-        **Alert Management**
-        
-        Monitor and respond to supply chain disruptions:
-        - Alerts are generated automatically based on business rules
-        - Filter by type (shipment delay, low stock, supplier performance) and severity
-        - Acknowledge alerts to mark them as reviewed
-        - Critical and high-priority alerts require immediate attention
-        """,
-        
-        "Suppliers": """
-        **Supplier Performance**
-        
-        Track and compare supplier performance:
-        - **Performance Score**: Composite metric of overall reliability (0-100)
-        - **On-Time Rate**: Percentage of shipments delivered on schedule
-        - **Quality Score**: Assessment of product quality (0-100)
-        - **Lead Time**: Average days from order to delivery
-        - Compare multiple suppliers to inform sourcing decisions
-        """
-    }
-    
-    content = help_content.get(page_name, "")
+    content = HELP_CONTENT.get(page_name, "")
     if content:
         with st.expander("ℹ️ Help & Information", expanded=False):
             st.markdown(content)
@@ -182,57 +236,7 @@ def add_calculation_explanation(calculation_name: str):
     Args:
         calculation_name: Name of the calculation to explain
     """
-    explanations = {
-        "on_time_delivery_rate": """
-        **On-Time Delivery Rate Calculation:**
-        
-        ```
-        On-Time Rate = (Shipments Delivered On Time / Total Shipments) × 100
-        ```
-        
-        A shipment is considered "on time" if the actual delivery date is on or before 
-        the estimated delivery date. This metric is calculated over the past 90 days.
-        """,
-        
-        "performance_score": """
-        **Performance Score Calculation:**
-        
-        The performance score is a weighted composite of multiple factors:
-        - On-time delivery rate (40%)
-        - Quality score (30%)
-        - Lead time performance (20%)
-        - Communication and responsiveness (10%)
-        
-        Scores range from 0-100, with higher scores indicating better performance.
-        """,
-        
-        "low_stock_detection": """
-        **Low Stock Detection:**
-        
-        An item is flagged as low stock when:
-        ```
-        Current Quantity < Reorder Point
-        ```
-        
-        The reorder point is set based on:
-        - Average daily consumption rate
-        - Lead time for restocking
-        - Safety stock buffer
-        """,
-        
-        "alert_generation": """
-        **Alert Generation Rules:**
-        
-        Alerts are automatically generated when:
-        - **Shipment Delay**: Actual time > Estimated delivery + threshold
-        - **Low Stock**: Quantity < Reorder point
-        - **Supplier Performance**: Performance score < acceptable threshold
-        
-        Alert severity is determined by the magnitude of the deviation from normal.
-        """
-    }
-    
-    explanation = explanations.get(calculation_name, "")
+    explanation = CALCULATION_EXPLANATIONS.get(calculation_name, "")
     if explanation:
         with st.expander("📊 How is this calculated?", expanded=False):
             st.markdown(explanation)
@@ -5,10 +5,19 @@ This module provides the AlertGenerator class that generates alerts based on
 business rules for shipment delays, low inventory, and supplier performance issues.
 """
 
+import os
 import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
+import numpy as np
+
+from src.alert_kernels import (
+    hours_overdue,
+    delay_scan,
+    low_stock_scan,
+    supplier_scan,
+)
 from src.models import (
     Alert,
     AlertType,
@@ -21,6 +30,32 @@ from src.models import (
 )
 
 
+# AlertSeverity indexed by the severity codes returned by the alert kernels
+SEVERITY_LEVELS = (
+    AlertSeverity.LOW,
+    AlertSeverity.MEDIUM,
+    AlertSeverity.HIGH,
+    AlertSeverity.CRITICAL,
+)
+
+
+def _new_alert_ids(count: int) -> List[str]:
+    """
+    Generate random (version 4) UUID strings for a batch of alerts.
+    
+    Reads the random bytes for the whole batch with a single os.urandom call
+    instead of one call per alert.
+    
+    Args:
+        count: Number of IDs to generate
+        
+    Returns:
+        List of UUID strings
+    """
+    raw = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=raw[start:start + 16], version=4)) for start in range(0, len(raw), 16)]
+
+
 class AlertGenerator:
     """
     Generates and manages supply chain alerts.
@@ -31,7 +66,9 @@ class AlertGenerator:
     
     def __init__(self):
         """Initialize the alert generator with empty alert storage."""
-        self._alerts: Dict[str, Alert] = {}
+        # Alerts in generation order, plus an alert ID -> list position index
+        self._alerts: List[Alert] = []
+        self._alert_index: Dict[str, int] = {}
     
     def generate_alerts(self, data: SupplyChainData, rules: Dict[str, Any]) -> List[Alert]:
         """
@@ -52,34 +89,46 @@ class AlertGenerator:
         """
         alerts = []
         
+        # One reference time for the whole pass, so every alert shares created_at
+        now = datetime.now()
+        
         # Check for shipment delays
         delay_alerts = self.check_shipment_delays(
             data.shipments,
-            rules.get('delay_threshold_hours', 24)
+            rules.get('delay_threshold_hours', 24),
+            now=now
         )
         alerts.extend(delay_alerts)
         
         # Check for low inventory
         inventory_alerts = self.check_inventory_levels(
             data.inventory,
-            rules.get('low_stock_threshold', 1.0)
+            rules.get('low_stock_threshold', 1.0),
+            now=now
         )
         alerts.extend(inventory_alerts)
         
         # Check for supplier performance issues
         supplier_alerts = self.check_supplier_performance(
             data.suppliers,
-            rules.get('supplier_performance_threshold', 70.0)
+            rules.get('supplier_performance_threshold', 70.0),
+            now=now
         )
         alerts.extend(supplier_alerts)
         
         # Store alerts for acknowledgment tracking
-        for alert in alerts:
-            self._alerts[alert.id] = alert
+        start = len(self._alerts)
+        self._alerts.extend(alerts)
+        self._alert_index.update(zip((alert.id for alert in alerts), range(start, len(self._alerts))))
         
         return alerts
     
-    def check_shipment_delays(self, shipments: List[Shipment], delay_threshold_hours: float = 24) -> List[Alert]:
+    def check_shipment_delays(
+        self,
+        shipments: List[Shipment],
+        delay_threshold_hours: float = 24,
+        now: Optional[datetime] = None
+    ) -> List[Alert]:
         """
         Check for delayed shipments.
         
@@ -89,49 +138,54 @@ class AlertGenerator:
         Args:
             shipments: List of Shipment objects to check
             delay_threshold_hours: Hours past estimated delivery to trigger alert
+            now: Reference time for overdue hours and created_at (defaults to current time)
             
         Returns:
             List of Alert objects for delayed shipments
         """
         alerts = []
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
+        
+        # Evaluate the rule for all shipments at once; only matches reach the loop
+        estimated = np.array([s.estimated_delivery for s in shipments], dtype="datetime64[us]")
+        overdue = hours_overdue(estimated, now)
+        delayed = np.array([s.status == ShipmentStatus.DELAYED for s in shipments], dtype=bool)
+        delivered = np.array([s.status == ShipmentStatus.DELIVERED for s in shipments], dtype=bool)
+        indices, severities = delay_scan(overdue, delayed, delivered, delay_threshold_hours)
+        
+        alert_ids = _new_alert_ids(len(indices))
         
-        for shipment in shipments:
-            # Check if shipment is explicitly marked as delayed
-            if shipment.status == ShipmentStatus.DELAYED:
-                severity = self._calculate_delay_severity(shipment, now, delay_threshold_hours)
-                alert = Alert(
-                    id=str(uuid.uuid4()),
-                    type=AlertType.SHIPMENT_DELAY,
-                    severity=severity,
-                    message=f"Shipment {shipment.id} from {shipment.origin} to {shipment.destination} is delayed",
-                    entity_id=shipment.id,
-                    created_at=now,
-                    acknowledged=False,
-                    acknowledged_at=None
-                )
-                alerts.append(alert)
+        for alert_id, index, severity in zip(alert_ids, indices.tolist(), severities.tolist()):
+            shipment = shipments[index]
             
-            # Check if shipment is past estimated delivery and not delivered
-            elif shipment.status != ShipmentStatus.DELIVERED:
-                hours_overdue = (now - shipment.estimated_delivery).total_seconds() / 3600
-                if hours_overdue > delay_threshold_hours:
-                    severity = self._calculate_delay_severity(shipment, now, delay_threshold_hours)
-                    alert = Alert(
-                        id=str(uuid.uuid4()),
-                        type=AlertType.SHIPMENT_DELAY,
-                        severity=severity,
-                        message=f"Shipment {shipment.id} is {int(hours_overdue)} hours overdue",
-                        entity_id=shipment.id,
-                        created_at=now,
-                        acknowledged=False,
-                        acknowledged_at=None
-                    )
-                    alerts.append(alert)
+            # Shipments explicitly marked as delayed get a status message,
+            # others are past estimated delivery and not yet delivered
+            if delayed[index]:
+                message = f"Shipment {shipment.id} from {shipment.origin} to {shipment.destination} is delayed"
+            else:
+                message = f"Shipment {shipment.id} is {int(overdue[index])} hours overdue"
+            
+            alert = Alert(
+                id=alert_id,
+                type=AlertType.SHIPMENT_DELAY,
+                severity=SEVERITY_LEVELS[severity],
+                message=message,
+                entity_id=shipment.id,
+                created_at=now,
+                acknowledged=False,
+                acknowledged_at=None
+            )
+            alerts.append(alert)
         
         return alerts
     
-    def check_inventory_levels(self, inventory: List[InventoryItem], low_stock_threshold: float = 1.0) -> List[Alert]:
+    def check_inventory_levels(
+        self,
+        inventory: List[InventoryItem],
+        low_stock_threshold: float = 1.0,
+        now: Optional[datetime] = None
+    ) -> List[Alert]:
         """
         Check for critical low stock.
         
@@ -141,32 +195,45 @@ class AlertGenerator:
         Args:
             inventory: List of InventoryItem objects to check
             low_stock_threshold: Multiplier of reorder_point to trigger alert (default 1.0)
+            now: Timestamp for created_at (defaults to current time)
             
         Returns:
             List of Alert objects for low stock items
         """
         alerts = []
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
+        
+        # Evaluate the rule for all items at once; only matches reach the loop
+        quantities = np.array([item.quantity for item in inventory], dtype=np.float64)
+        reorder_points = np.array([item.reorder_point for item in inventory], dtype=np.float64)
+        indices, severities = low_stock_scan(quantities, reorder_points, low_stock_threshold)
         
-        for item in inventory:
+        alert_ids = _new_alert_ids(len(indices))
+        
+        for alert_id, index, severity in zip(alert_ids, indices.tolist(), severities.tolist()):
+            item = inventory[index]
             threshold = item.reorder_point * low_stock_threshold
-            if item.quantity < threshold:
-                severity = self._calculate_inventory_severity(item, threshold)
-                alert = Alert(
-                    id=str(uuid.uuid4()),
-                    type=AlertType.LOW_STOCK,
-                    severity=severity,
-                    message=f"Low stock alert: {item.name} at {item.location} has {item.quantity} {item.unit} (threshold: {threshold})",
-                    entity_id=item.id,
-                    created_at=now,
-                    acknowledged=False,
-                    acknowledged_at=None
-                )
-                alerts.append(alert)
+            alert = Alert(
+                id=alert_id,
+                type=AlertType.LOW_STOCK,
+                severity=SEVERITY_LEVELS[severity],
+                message=f"Low stock alert: {item.name} at {item.location} has {item.quantity} {item.unit} (threshold: {threshold})",
+                entity_id=item.id,
+                created_at=now,
+                acknowledged=False,
+                acknowledged_at=None
+            )
+            alerts.append(alert)
         
         return alerts
     
-    def check_supplier_performance(self, suppliers: List[Supplier], performance_threshold: float = 70.0) -> List[Alert]:
+    def check_supplier_performance(
+        self,
+        suppliers: List[Supplier],
+        performance_threshold: float = 70.0,
+        now: Optional[datetime] = None
+    ) -> List[Alert]:
         """
         Check for underperforming suppliers.
         
@@ -176,27 +243,34 @@ class AlertGenerator:
         Args:
             suppliers: List of Supplier objects to check
             performance_threshold: Minimum acceptable performance score (0-100)
+            now: Timestamp for created_at (defaults to current time)
             
         Returns:
             List of Alert objects for underperforming suppliers
         """
         alerts = []
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         
-        for supplier in suppliers:
-            if supplier.performance_score < performance_threshold:
-                severity = self._calculate_supplier_severity(supplier, performance_threshold)
-                alert = Alert(
-                    id=str(uuid.uuid4()),
-                    type=AlertType.SUPPLIER_PERFORMANCE,
-                    severity=severity,
-                    message=f"Supplier {supplier.name} performance below threshold: {supplier.performance_score:.1f}% (threshold: {performance_threshold}%)",
-                    entity_id=supplier.id,
-                    created_at=now,
-                    acknowledged=False,
-                    acknowledged_at=None
-                )
-                alerts.append(alert)
+        # Evaluate the rule for all suppliers at once; only matches reach the loop
+        scores = np.array([supplier.performance_score for supplier in suppliers], dtype=np.float64)
+        indices, severities = supplier_scan(scores, performance_threshold)
+        
+        alert_ids = _new_alert_ids(len(indices))
+        
+        for alert_id, index, severity in zip(alert_ids, indices.tolist(), severities.tolist()):
+            supplier = suppliers[index]
+            alert = Alert(
+                id=alert_id,
+                type=AlertType.SUPPLIER_PERFORMANCE,
+                severity=SEVERITY_LEVELS[severity],
+                message=f"Supplier {supplier.name} performance below threshold: {supplier.performance_score:.1f}% (threshold: {performance_threshold}%)",
+                entity_id=supplier.id,
+                created_at=now,
+                acknowledged=False,
+                acknowledged_at=None
+            )
+            alerts.append(alert)
         
         return alerts
     
@@ -212,50 +286,52 @@ class AlertGenerator:
         Raises:
             ValueError: If alert_id is not found
         """
-        if alert_id not in self._alerts:
+        index = self._alert_index.get(alert_id)
+        if index is None:
             raise ValueError(f"Alert not found: {alert_id}")
         
-        alert = self._alerts[alert_id]
+        self.acknowledge_by_index(index)
+    
+    def acknowledge_by_index(self, index: int) -> None:
+        """
+        Mark alert as acknowledged by its position in generation order.
+        
+        Fast path for callers that already hold the alert's position, skipping
+        the alert ID lookup.
+        
+        Args:
+            index: Position of the alert among all generated alerts
+            
+        Raises:
+            ValueError: If index is out of range
+        """
+        if not 0 <= index < len(self._alerts):
+            raise ValueError(f"Alert index out of range: {index}")
+        
+        alert = self._alerts[index]
         alert.acknowledged = True
         alert.acknowledged_at = datetime.now()
     
-    # Private helper methods for severity calculation
-    
-    def _calculate_delay_severity(self, shipment: Shipment, now: datetime, threshold_hours: float) -> AlertSeverity:
-        """Calculate severity level for shipment delay."""
-        hours_overdue = (now - shipment.estimated_delivery).total_seconds() / 3600
-        
-        if hours_overdue > threshold_hours * 3:
-            return AlertSeverity.CRITICAL
-        elif hours_overdue > threshold_hours * 2:
-            return AlertSeverity.HIGH
-        elif hours_overdue > threshold_hours:
-            return AlertSeverity.MEDIUM
-        else:
-            return AlertSeverity.LOW
-    
-    def _calculate_inventory_severity(self, item: InventoryItem, threshold: float) -> AlertSeverity:
-        """Calculate severity level for low inventory."""
-        percentage_of_threshold = (item.quantity / threshold * 100) if threshold > 0 else 0
-        
-        if percentage_of_threshold < 25:
-            return AlertSeverity.CRITICAL
-        elif percentage_of_threshold < 50:
-            return AlertSeverity.HIGH
-        elif percentage_of_threshold < 75:
-            return AlertSeverity.MEDIUM
-        else:
-            return AlertSeverity.LOW
-    
-    def _calculate_supplier_severity(self, supplier: Supplier, threshold: float) -> AlertSeverity:
-        """Calculate severity level for supplier performance."""
-        gap = threshold - supplier.performance_score
-        
-        if gap > 30:
-            return AlertSeverity.CRITICAL
-        elif gap > 20:
-            return AlertSeverity.HIGH
-        elif gap > 10:
-            return AlertSeverity.MEDIUM
-        else:
-            return AlertSeverity.LOW
+    def acknowledge_alerts(self, alert_ids: List[str]) -> None:
+        """
+        Mark several alerts as acknowledged in one call.
+        
+        All IDs are validated before any alert is updated, and every alert
+        receives the same acknowledgment timestamp.
+        
+        Args:
+            alert_ids: IDs of the alerts to acknowledge
+            
+        Raises:
+            ValueError: If any alert_id is not found
+        """
+        indices = [self._alert_index.get(alert_id) for alert_id in alert_ids]
+        missing = [alert_id for alert_id, index in zip(alert_ids, indices) if index is None]
+        if missing:
+            raise ValueError(f"Alert not found: {', '.join(missing)}")
+        
+        acknowledged_at = datetime.now()
+        for index in indices:
+            alert = self._alerts[index]
+            alert.acknowledged = True
+            alert.acknowledged_at = acknowledged_at
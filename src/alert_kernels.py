@@ -0,0 +1,121 @@
+"""
+Vectorized alert rule kernels for Supply Chain Visibility application.
+
+This module evaluates the AlertGenerator business rules over NumPy arrays that
+are extracted once per check, so Python-level work is limited to building Alert
+objects for the entities that actually match a rule.
+"""
+
+from datetime import datetime
+from typing import Tuple
+
+import numpy as np
+
+
+# Severity codes returned by the scans, from least to most severe
+SEVERITY_LOW, SEVERITY_MEDIUM, SEVERITY_HIGH, SEVERITY_CRITICAL = range(4)
+
+# Bin edges for delay (as multiples of the threshold hours), percentage of
+# low stock threshold, and supplier score gap
+DELAY_THRESHOLD_MULTIPLES = np.array([1.0, 2.0, 3.0])
+LOW_STOCK_PERCENT_EDGES = np.array([25.0, 50.0, 75.0])
+SUPPLIER_GAP_EDGES = np.array([10.0, 20.0, 30.0])
+
+
+def hours_overdue(estimated_delivery: np.ndarray, now: datetime) -> np.ndarray:
+    """
+    Compute hours elapsed since each estimated delivery time.
+
+    Differences are taken in integer microseconds, so the results match
+    ``(now - estimated).total_seconds() / 3600`` exactly.
+
+    Args:
+        estimated_delivery: Array of estimated delivery times as datetime64[us]
+        now: Reference time
+
+    Returns:
+        Float array of hours past estimated delivery (negative if not yet due)
+    """
+    elapsed_us = (np.datetime64(now, "us") - estimated_delivery).astype(np.int64)
+    return elapsed_us / 1e6 / 3600
+
+
+def delay_scan(
+    overdue_hours: np.ndarray,
+    delayed: np.ndarray,
+    delivered: np.ndarray,
+    threshold_hours: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find shipments that need a delay alert and grade their severity.
+
+    A shipment matches if it is marked delayed, or if it is not delivered and
+    is more than threshold_hours past its estimated delivery.
+
+    Args:
+        overdue_hours: Hours past estimated delivery for each shipment
+        delayed: Boolean array, True where the shipment status is delayed
+        delivered: Boolean array, True where the shipment status is delivered
+        threshold_hours: Hours past estimated delivery to trigger an alert
+
+    Returns:
+        Tuple of (indices of matching shipments, severity codes aligned with them)
+    """
+    matched = delayed | (~delivered & (overdue_hours > threshold_hours))
+    indices = np.flatnonzero(matched)
+
+    # Severity is the number of threshold multiples strictly exceeded
+    severities = np.searchsorted(threshold_hours * DELAY_THRESHOLD_MULTIPLES, overdue_hours[indices], side="left")
+    return indices, severities
+
+
+def low_stock_scan(
+    quantities: np.ndarray,
+    reorder_points: np.ndarray,
+    low_stock_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find inventory items below their low stock threshold and grade their severity.
+
+    Args:
+        quantities: Current quantity of each item
+        reorder_points: Reorder point of each item
+        low_stock_threshold: Multiplier of reorder point that triggers an alert
+
+    Returns:
+        Tuple of (indices of matching items, severity codes aligned with them)
+    """
+    thresholds = reorder_points * low_stock_threshold
+    indices = np.flatnonzero(quantities < thresholds)
+    matched_thresholds = thresholds[indices]
+
+    # Percentage of threshold, treated as 0 where the threshold is not positive
+    percentages = np.zeros(len(indices))
+    np.divide(quantities[indices], matched_thresholds, out=percentages, where=matched_thresholds > 0)
+    percentages *= 100
+
+    # Severity is the number of percentage bins the item is strictly below
+    severities = SEVERITY_CRITICAL - np.searchsorted(LOW_STOCK_PERCENT_EDGES, percentages, side="right")
+    return indices, severities
+
+
+def supplier_scan(
+    performance_scores: np.ndarray,
+    performance_threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find suppliers below the performance threshold and grade their severity.
+
+    Args:
+        performance_scores: Performance score of each supplier
+        performance_threshold: Minimum acceptable performance score
+
+    Returns:
+        Tuple of (indices of matching suppliers, severity codes aligned with them)
+    """
+    indices = np.flatnonzero(performance_scores < performance_threshold)
+    gaps = performance_threshold - performance_scores[indices]
+
+    # Severity is the number of gap bins strictly exceeded
+    severities = np.searchsorted(SUPPLIER_GAP_EDGES, gaps, side="left")
+    return indices, severities
@@ -5,11 +5,19 @@ This module provides the Dashboard class that handles the main dashboard
 display and metrics calculation functionality.
 """
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from src.models import SupplyChainData, ShipmentStatus
-from src.filter_engine import FilterCriteria, FilterEngine
+from src.filter_engine import FilterCriteria, FilterEngine, cached_apply_filters
+
+
+# Maximum number of (data version, filters) metric results kept per dashboard
+METRICS_CACHE_SIZE = 32
 
 
 @dataclass
@@ -56,13 +64,21 @@ class Dashboard:
         """
         self.data = data
         self.filter_engine = FilterEngine()
+        self._metrics_cache: Dict[Tuple, DashboardMetrics] = {}
+        
+        # (data.last_updated, metrics) for the unfiltered view, the common case
+        self._unfiltered_metrics: Optional[Tuple[datetime, DashboardMetrics]] = None
     
     def render(self, filters: Optional[FilterCriteria] = None) -> DashboardMetrics:
         """
         Render dashboard with current metrics.
         
         Calculates and returns dashboard metrics, optionally applying filters
-        to the data before calculation.
+        to the data before calculation. Results are cached by the data's
+        last_updated timestamp and the filter values, so repeat renders of unchanged
+        data return the stored metrics; persisted updates bump last_updated and
+        therefore invalidate the cache. Unfiltered metrics are kept separately
+        and returned without a cache lookup while the data is unchanged.
         
         Args:
             filters: Optional FilterCriteria to apply before calculating metrics
@@ -70,13 +86,24 @@ class Dashboard:
         Returns:
             DashboardMetrics object containing calculated metrics
         """
-        # Apply filters if provided
-        if filters:
-            data = self.filter_engine.apply_filters(self.data, filters)
-        else:
-            data = self.data
+        if filters is None:
+            if self._unfiltered_metrics is None or self._unfiltered_metrics[0] != self.data.last_updated:
+                self._unfiltered_metrics = (self.data.last_updated, self.get_metrics(self.data))
+            return self._unfiltered_metrics[1]
         
-        return self.get_metrics(data)
+        key = (self.data.last_updated, filters.cache_key())
+        metrics = self._metrics_cache.pop(key, None)
+        
+        if metrics is None:
+            metrics = self.get_metrics(cached_apply_filters(self.data, filters))
+            
+            # Evict the least recently used entry when full
+            if len(self._metrics_cache) >= METRICS_CACHE_SIZE:
+                del self._metrics_cache[next(iter(self._metrics_cache))]
+        
+        # Reinsert so the most recently used entry is last
+        self._metrics_cache[key] = metrics
+        return metrics
     
     def get_metrics(self, data: SupplyChainData) -> DashboardMetrics:
         """
@@ -91,20 +118,30 @@ class Dashboard:
         Returns:
             DashboardMetrics object containing all calculated metrics
         """
-        # Calculate shipment metrics
+        # Calculate shipment metrics, counting every status in a single pass
         total_shipments = len(data.shipments)
-        in_transit_count = sum(1 for s in data.shipments if s.status == ShipmentStatus.IN_TRANSIT)
-        delayed_count = sum(1 for s in data.shipments if s.status == ShipmentStatus.DELAYED)
-        delivered_count = sum(1 for s in data.shipments if s.status == ShipmentStatus.DELIVERED)
-        pending_count = sum(1 for s in data.shipments if s.status == ShipmentStatus.PENDING)
+        if data.shipment_status_codes is not None:
+            counts = np.bincount(data.shipment_status_codes, minlength=len(ShipmentStatus))
+            status_counts = dict(zip(ShipmentStatus, counts.tolist()))
+        else:
+            status_counts = Counter(s.status for s in data.shipments)
+        in_transit_count = status_counts[ShipmentStatus.IN_TRANSIT]
+        delayed_count = status_counts[ShipmentStatus.DELAYED]
+        delivered_count = status_counts[ShipmentStatus.DELIVERED]
+        pending_count = status_counts[ShipmentStatus.PENDING]
         
-        # Calculate inventory metrics
+        # Calculate inventory metrics, vectorized when the numeric arrays are built
         total_inventory_items = len(data.inventory)
-        low_stock_count = sum(1 for item in data.inventory if item.quantity < item.reorder_point)
+        if data.inventory_quantity is not None:
+            low_stock_count = int(np.count_nonzero(data.inventory_quantity < data.inventory_reorder_point))
+        else:
+            low_stock_count = sum(1 for item in data.inventory if item.quantity < item.reorder_point)
         
         # Calculate supplier metrics
         total_suppliers = len(data.suppliers)
-        if total_suppliers > 0:
+        if total_suppliers > 0 and data.supplier_performance is not None:
+            average_supplier_performance = float(data.supplier_performance.mean())
+        elif total_suppliers > 0:
             average_supplier_performance = sum(s.performance_score for s in data.suppliers) / total_suppliers
         else:
             average_supplier_performance = 0.0
@@ -6,9 +6,13 @@ implements caching, and handles data persistence.
 """
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+import numpy as np
+import pandas as pd
 
 from src.models import (
     SupplyChainData,
@@ -21,9 +25,137 @@ from src.models import (
     ShipmentStatus,
     NodeType,
     NodeStatus,
+    index_by_id,
 )
 
 
+# Column order of each entity CSV file
+SHIPMENT_FIELDS = ['id', 'origin', 'destination', 'current_location', 'status',
+                   'estimated_delivery', 'actual_delivery', 'items', 'supplier_id',
+                   'created_at', 'updated_at']
+INVENTORY_FIELDS = ['id', 'name', 'category', 'location', 'quantity',
+                    'unit', 'reorder_point', 'last_updated']
+SUPPLIER_FIELDS = ['id', 'name', 'contact', 'performance_score',
+                   'on_time_delivery_rate', 'quality_score', 'average_lead_time',
+                   'total_shipments', 'last_updated']
+
+
+# Entity CSV files read by load_data
+SOURCE_FILES = ("shipments.csv", "inventory.csv", "suppliers.csv", "nodes.csv", "edges.csv")
+
+
+def _source_signature(source_path: Path) -> tuple:
+    """
+    Identify the current state of a data source by its files' modification times and sizes.
+    
+    Covers the entity CSV files and their change logs; missing files are recorded as None.
+    """
+    signature = [str(source_path.resolve())]
+    for filename in SOURCE_FILES:
+        for filepath in (source_path / filename, _updates_path(source_path / filename)):
+            try:
+                stat = filepath.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _source_path(source: str) -> Path:
+    """Resolve a data source name to its directory, treating "csv" as an alias for "data"."""
+    return Path("data" if source == "csv" else source)
+
+
+def _updates_path(filepath: Path) -> Path:
+    """Path of the append-only change log kept next to an entity CSV file."""
+    return filepath.with_name(f"{filepath.stem}.updates.csv")
+
+
+def _read_csv_strings(filepath: Path) -> pd.DataFrame:
+    """Read a CSV file with the C parser, keeping every cell as a string."""
+    try:
+        return pd.read_csv(filepath, dtype=str, keep_default_na=False, encoding='utf-8')
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+
+
+def _read_frame(filepath: Path) -> pd.DataFrame:
+    """Read CSV rows as strings, replacing records with their latest logged version."""
+    df = _read_csv_strings(filepath)
+    
+    updates_path = _updates_path(filepath)
+    if df.empty or not updates_path.exists():
+        return df
+    
+    positions = {}
+    for position, entity_id in enumerate(df['id']):
+        positions.setdefault(entity_id, position)
+    
+    columns = list(df.columns)
+    records = df.to_numpy(dtype=object)
+    for logged in _read_csv_strings(updates_path).to_dict('records'):
+        position = positions.pop(logged['entity_id'], None)
+        if position is not None:
+            records[position] = [logged[column] for column in columns]
+            positions[logged['id']] = position
+    
+    return pd.DataFrame(records, columns=columns)
+
+
+def _to_shared_strings(values: pd.Series) -> list:
+    """
+    Convert a low-cardinality string column to a list sharing one str object per distinct value.
+    
+    Repeated values such as locations or units then cost one pointer per row
+    instead of one string object, and equality checks between them short-circuit
+    on identity.
+    """
+    codes, uniques = pd.factorize(values)
+    return np.asarray(uniques, dtype=object)[codes].tolist()
+
+
+def _to_floats(values: pd.Series) -> list:
+    """Convert a string column to Python floats."""
+    return values.astype(np.float64).tolist()
+
+
+def _to_optional_floats(values: pd.Series) -> list:
+    """Convert a string column to Python floats, with empty cells as None."""
+    floats = values.where(values != '').astype(np.float64)
+    return [None if np.isnan(value) else value for value in floats.tolist()]
+
+
+def _to_datetimes(values: pd.Series, optional: bool = False) -> list:
+    """
+    Convert a column of ISO 8601 strings to datetimes.
+    
+    Empty cells become None when optional, and raise ValueError otherwise.
+    Columns mixing UTC offsets cannot share one pandas dtype, so they are
+    parsed value by value with datetime.fromisoformat instead.
+    """
+    try:
+        parsed = pd.to_datetime(values.where(values != ''), format='ISO8601')
+    except ValueError:
+        datetimes = [None if value == '' else datetime.fromisoformat(value) for value in values.tolist()]
+    else:
+        datetimes = [None if value is pd.NaT else value for value in parsed.dt.to_pydatetime()]
+    if not optional and any(value is None for value in datetimes):
+        raise ValueError(f"Missing datetime in column: {values.name}")
+    return datetimes
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Get a column, or a column of empty strings if the file does not have it."""
+    return df[name] if name in df.columns else pd.Series('', index=df.index, name=name)
+
+
+def _build(cls, columns: dict) -> list:
+    """Construct one cls instance per row from a dict of equal-length column lists."""
+    names = list(columns)
+    return [cls(**dict(zip(names, values))) for values in zip(*columns.values())]
+
+
 class DataAccessService:
     """
     Abstracts data source access and implements caching.
@@ -36,6 +168,12 @@ class DataAccessService:
         """Initialize the data access service with empty cache."""
         self._cache: Optional[SupplyChainData] = None
         self._cache_timestamp: Optional[datetime] = None
+        self._cache_signature: Optional[tuple] = None
+        
+        # ID indexes over the cached entity lists, used to look up update targets
+        self._shipment_ix: Dict[str, Shipment] = {}
+        self._inventory_ix: Dict[str, InventoryItem] = {}
+        self._supplier_ix: Dict[str, Supplier] = {}
     
     def load_data(self, source: str = "data") -> SupplyChainData:
         """
@@ -56,20 +194,26 @@ class DataAccessService:
             ValueError: If CSV data is invalid or malformed
         """
         # Handle "csv" as an alias for "data" directory
-        if source == "csv":
-            source = "data"
-        
-        source_path = Path(source)
+        source_path = _source_path(source)
         
         if not source_path.exists():
-            raise FileNotFoundError(f"Data source not found: {source}")
-        
-        # Load each entity type from CSV
-        shipments = self._load_shipments_csv(source_path / "shipments.csv")
-        inventory = self._load_inventory_csv(source_path / "inventory.csv")
-        suppliers = self._load_suppliers_csv(source_path / "suppliers.csv")
-        nodes = self._load_nodes_csv(source_path / "nodes.csv")
-        edges = self._load_edges_csv(source_path / "edges.csv")
+            raise FileNotFoundError(f"Data source not found: {source_path}")
+        
+        # Taken before reading, so a write during the load makes the next refresh reload
+        signature = _source_signature(source_path)
+        
+        # Load each entity type from CSV; the files are independent and
+        # read_csv releases the GIL while parsing, so load them concurrently
+        loaders = [
+            (self._load_shipments_csv, "shipments.csv"),
+            (self._load_inventory_csv, "inventory.csv"),
+            (self._load_suppliers_csv, "suppliers.csv"),
+            (self._load_nodes_csv, "nodes.csv"),
+            (self._load_edges_csv, "edges.csv"),
+        ]
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [executor.submit(loader, source_path / filename) for loader, filename in loaders]
+            shipments, inventory, suppliers, nodes, edges = [future.result() for future in futures]
         
         # Create SupplyChainData object
         data = SupplyChainData(
@@ -80,10 +224,15 @@ class DataAccessService:
             edges=edges,
             last_updated=datetime.now()
         )
+        data.build_derived_caches()
         
-        # Update cache
+        # Update cache and its ID indexes
         self._cache = data
         self._cache_timestamp = datetime.now()
+        self._cache_signature = signature
+        self._shipment_ix = index_by_id(shipments)
+        self._inventory_ix = index_by_id(inventory)
+        self._supplier_ix = index_by_id(suppliers)
         
         return data
     
@@ -100,7 +249,9 @@ class DataAccessService:
         """
         Refresh data from source.
         
-        This method reloads data from the source and updates the cache.
+        This method reloads data from the source and updates the cache. If none of
+        the source files changed since the cached data was loaded from it, the
+        cached data is returned without reparsing.
         
         Args:
             source: Path to data source. Defaults to "data".
@@ -108,19 +259,63 @@ class DataAccessService:
         Returns:
             Refreshed SupplyChainData object
         """
+        if (
+            self._cache is not None
+            and _source_path(source).exists()
+            and self.source_signature(source) == self._cache_signature
+        ):
+            return self._cache
+        
         return self.load_data(source)
     
+    def source_signature(self, source: str = "data") -> tuple:
+        """
+        Identify the current state of a data source's files.
+        
+        The signature changes whenever an entity CSV file or its change log is
+        written, so callers can use it as a cache key for loads of the source.
+        
+        Args:
+            source: Path to data source. Defaults to "data"; "csv" is an alias for it.
+            
+        Returns:
+            Tuple of the resolved source path and each file's (mtime_ns, size), or None if missing
+        """
+        return _source_signature(_source_path(source))
+    
     def persist_update(self, update: StatusUpdate, source: str) -> None:
         """
         Persist status update to data store.
         
         This method updates the cached data and writes the change to the data store.
-        For CSV sources, this updates the corresponding CSV file.
+        For CSV sources, the updated record is appended to a change log next to the
+        entity's CSV file (e.g. shipments.updates.csv), so each update writes one
+        row instead of rewriting the whole file. load_data replays the log, and
+        compact() folds it back into the CSV files.
         
         Args:
             update: StatusUpdate object containing the update details
             source: Path to data source
             
+        Raises:
+            ValueError: If entity type or entity ID is not found
+            FileNotFoundError: If source directory doesn't exist
+        """
+        self.persist_updates([update], source)
+    
+    def persist_updates(self, updates: List[StatusUpdate], source: str) -> None:
+        """
+        Persist a batch of status updates to data store.
+        
+        All updates are applied to the cached data in order, then each affected
+        change log is opened once and the updated records are appended together.
+        If an update fails, the updates applied before it are still written so the
+        data store matches the cache, and the error is re-raised.
+        
+        Args:
+            updates: StatusUpdate objects to apply, in order
+            source: Path to data source
+            
         Raises:
             ValueError: If entity type or entity ID is not found
             FileNotFoundError: If source directory doesn't exist
@@ -132,22 +327,59 @@ class DataAccessService:
         if not source_path.exists():
             raise FileNotFoundError(f"Data source not found: {source}")
         
-        # Update cached data based on entity type
-        if update.entity_type == "shipment":
-            self._update_shipment(update)
-            self._persist_shipments_csv(source_path / "shipments.csv")
-        elif update.entity_type == "inventory":
-            self._update_inventory(update)
-            self._persist_inventory_csv(source_path / "inventory.csv")
-        elif update.entity_type == "supplier":
-            self._update_supplier(update)
-            self._persist_suppliers_csv(source_path / "suppliers.csv")
-        else:
-            raise ValueError(f"Unknown entity type: {update.entity_type}")
+        # Entity type -> (cache update helper, row serializer, CSV file name)
+        targets = {
+            "shipment": (self._update_shipment, self._shipment_row, "shipments.csv"),
+            "inventory": (self._update_inventory, self._inventory_row, "inventory.csv"),
+            "supplier": (self._update_supplier, self._supplier_row, "suppliers.csv"),
+        }
+        logged: Dict[str, list] = {}
+        
+        try:
+            # Update cached data based on entity type
+            for update in updates:
+                if update.entity_type not in targets:
+                    raise ValueError(f"Unknown entity type: {update.entity_type}")
+                
+                apply_update, to_row, filename = targets[update.entity_type]
+                entity = apply_update(update)
+                logged.setdefault(filename, []).append((update.entity_id, to_row(entity)))
+        finally:
+            for filename, entries in logged.items():
+                self._append_updates_csv(source_path / filename, entries)
+            
+            if logged:
+                # Update cache timestamp and drop results computed from stale data
+                self._cache.clear_derived_caches()
+                self._cache.last_updated = datetime.now()
+                self._cache_timestamp = datetime.now()
+    
+    def compact(self, source: str) -> None:
+        """
+        Rewrite the entity CSV files from cached data and remove their change logs.
         
-        # Update cache timestamp
-        self._cache.last_updated = datetime.now()
-        self._cache_timestamp = datetime.now()
+        Intended for offline batches; regular updates only append to the change logs.
+        
+        Args:
+            source: Path to data source
+            
+        Raises:
+            ValueError: If no data has been loaded
+            FileNotFoundError: If source directory doesn't exist
+        """
+        if self._cache is None:
+            raise ValueError("No cached data available. Load data first.")
+        
+        source_path = Path(source)
+        if not source_path.exists():
+            raise FileNotFoundError(f"Data source not found: {source}")
+        
+        self._persist_shipments_csv(source_path / "shipments.csv")
+        self._persist_inventory_csv(source_path / "inventory.csv")
+        self._persist_suppliers_csv(source_path / "suppliers.csv")
+        
+        for filename in ("shipments.csv", "inventory.csv", "suppliers.csv"):
+            _updates_path(source_path / filename).unlink(missing_ok=True)
     
     # Private helper methods for CSV loading
     
@@ -156,125 +388,110 @@ class DataAccessService:
         if not filepath.exists():
             return []
         
-        shipments = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                shipment = Shipment(
-                    id=row['id'],
-                    origin=row['origin'],
-                    destination=row['destination'],
-                    current_location=row['current_location'],
-                    status=ShipmentStatus(row['status']),
-                    estimated_delivery=datetime.fromisoformat(row['estimated_delivery']),
-                    actual_delivery=datetime.fromisoformat(row['actual_delivery']) if row.get('actual_delivery') else None,
-                    items=row['items'].split(';') if row.get('items') else [],
-                    supplier_id=row['supplier_id'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at'])
-                )
-                shipments.append(shipment)
-        
-        return shipments
+        df = _read_frame(filepath)
+        if df.empty:
+            return []
+        
+        return _build(Shipment, {
+            'id': df['id'].tolist(),
+            'origin': _to_shared_strings(df['origin']),
+            'destination': _to_shared_strings(df['destination']),
+            'current_location': _to_shared_strings(df['current_location']),
+            'status': [ShipmentStatus(value) for value in df['status']],
+            'estimated_delivery': _to_datetimes(df['estimated_delivery']),
+            'actual_delivery': _to_datetimes(_column(df, 'actual_delivery'), optional=True),
+            'items': [value.split(';') if value else [] for value in _column(df, 'items')],
+            'supplier_id': _to_shared_strings(df['supplier_id']),
+            'created_at': _to_datetimes(df['created_at']),
+            'updated_at': _to_datetimes(df['updated_at'])
+        })
     
     def _load_inventory_csv(self, filepath: Path) -> list[InventoryItem]:
         """Load inventory items from CSV file."""
         if not filepath.exists():
             return []
         
-        inventory = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                item = InventoryItem(
-                    id=row['id'],
-                    name=row['name'],
-                    category=row['category'],
-                    location=row['location'],
-                    quantity=float(row['quantity']),
-                    unit=row['unit'],
-                    reorder_point=float(row['reorder_point']),
-                    last_updated=datetime.fromisoformat(row['last_updated'])
-                )
-                inventory.append(item)
-        
-        return inventory
+        df = _read_frame(filepath)
+        if df.empty:
+            return []
+        
+        return _build(InventoryItem, {
+            'id': df['id'].tolist(),
+            'name': df['name'].tolist(),
+            'category': _to_shared_strings(df['category']),
+            'location': _to_shared_strings(df['location']),
+            'quantity': _to_floats(df['quantity']),
+            'unit': _to_shared_strings(df['unit']),
+            'reorder_point': _to_floats(df['reorder_point']),
+            'last_updated': _to_datetimes(df['last_updated'])
+        })
     
     def _load_suppliers_csv(self, filepath: Path) -> list[Supplier]:
         """Load suppliers from CSV file."""
         if not filepath.exists():
             return []
         
-        suppliers = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                supplier = Supplier(
-                    id=row['id'],
-                    name=row['name'],
-                    contact=row['contact'],
-                    performance_score=float(row['performance_score']),
-                    on_time_delivery_rate=float(row['on_time_delivery_rate']),
-                    quality_score=float(row['quality_score']),
-                    average_lead_time=float(row['average_lead_time']),
-                    total_shipments=int(row['total_shipments']),
-                    last_updated=datetime.fromisoformat(row['last_updated'])
-                )
-                suppliers.append(supplier)
-        
-        return suppliers
+        df = _read_frame(filepath)
+        if df.empty:
+            return []
+        
+        return _build(Supplier, {
+            'id': df['id'].tolist(),
+            'name': df['name'].tolist(),
+            'contact': df['contact'].tolist(),
+            'performance_score': _to_floats(df['performance_score']),
+            'on_time_delivery_rate': _to_floats(df['on_time_delivery_rate']),
+            'quality_score': _to_floats(df['quality_score']),
+            'average_lead_time': _to_floats(df['average_lead_time']),
+            'total_shipments': [int(value) for value in df['total_shipments']],
+            'last_updated': _to_datetimes(df['last_updated'])
+        })
     
     def _load_nodes_csv(self, filepath: Path) -> list[Node]:
         """Load network nodes from CSV file."""
         if not filepath.exists():
             return []
         
-        nodes = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                node = Node(
-                    id=row['id'],
-                    name=row['name'],
-                    type=NodeType(row['type']),
-                    location=row['location'],
-                    latitude=float(row['latitude']) if row.get('latitude') else None,
-                    longitude=float(row['longitude']) if row.get('longitude') else None,
-                    status=NodeStatus(row['status']),
-                    capacity=float(row['capacity']) if row.get('capacity') else None
-                )
-                nodes.append(node)
-        
-        return nodes
+        df = _read_csv_strings(filepath)
+        if df.empty:
+            return []
+        
+        return _build(Node, {
+            'id': df['id'].tolist(),
+            'name': df['name'].tolist(),
+            'type': [NodeType(value) for value in df['type']],
+            'location': _to_shared_strings(df['location']),
+            'latitude': _to_optional_floats(_column(df, 'latitude')),
+            'longitude': _to_optional_floats(_column(df, 'longitude')),
+            'status': [NodeStatus(value) for value in df['status']],
+            'capacity': _to_optional_floats(_column(df, 'capacity'))
+        })
     
     def _load_edges_csv(self, filepath: Path) -> list[Edge]:
         """Load network edges from CSV file."""
         if not filepath.exists():
             return []
         
-        edges = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                edge = Edge(
-                    id=row['id'],
-                    source_node_id=row['source_node_id'],
-                    target_node_id=row['target_node_id'],
-                    shipment_ids=row['shipment_ids'].split(';') if row.get('shipment_ids') else [],
-                    active=row['active'].lower() == 'true'
-                )
-                edges.append(edge)
-        
-        return edges
+        df = _read_csv_strings(filepath)
+        if df.empty:
+            return []
+        
+        return _build(Edge, {
+            'id': df['id'].tolist(),
+            'source_node_id': df['source_node_id'].tolist(),
+            'target_node_id': df['target_node_id'].tolist(),
+            'shipment_ids': [value.split(';') if value else [] for value in _column(df, 'shipment_ids')],
+            'active': (df['active'].str.lower() == 'true').tolist()
+        })
     
     # Private helper methods for updating cached data
     
-    def _update_shipment(self, update: StatusUpdate) -> None:
-        """Update a shipment in the cache."""
+    def _update_shipment(self, update: StatusUpdate) -> Shipment:
+        """Update a shipment in the cache and return it."""
         if self._cache is None:
             raise ValueError("No cached data available")
         
-        shipment = next((s for s in self._cache.shipments if s.id == update.entity_id), None)
+        shipment = self._shipment_ix.get(update.entity_id)
         if shipment is None:
             raise ValueError(f"Shipment not found: {update.entity_id}")
         
@@ -282,15 +499,19 @@ class DataAccessService:
         if hasattr(shipment, update.field):
             setattr(shipment, update.field, update.new_value)
             shipment.updated_at = update.timestamp
+            if update.field == "id":
+                self._shipment_ix[update.new_value] = self._shipment_ix.pop(update.entity_id)
         else:
             raise ValueError(f"Invalid field for shipment: {update.field}")
+        
+        return shipment
     
-    def _update_inventory(self, update: StatusUpdate) -> None:
-        """Update an inventory item in the cache."""
+    def _update_inventory(self, update: StatusUpdate) -> InventoryItem:
+        """Update an inventory item in the cache and return it."""
         if self._cache is None:
             raise ValueError("No cached data available")
         
-        item = next((i for i in self._cache.inventory if i.id == update.entity_id), None)
+        item = self._inventory_ix.get(update.entity_id)
         if item is None:
             raise ValueError(f"Inventory item not found: {update.entity_id}")
         
@@ -298,15 +519,19 @@ class DataAccessService:
         if hasattr(item, update.field):
             setattr(item, update.field, update.new_value)
             item.last_updated = update.timestamp
+            if update.field == "id":
+                self._inventory_ix[update.new_value] = self._inventory_ix.pop(update.entity_id)
         else:
             raise ValueError(f"Invalid field for inventory item: {update.field}")
+        
+        return item
     
-    def _update_supplier(self, update: StatusUpdate) -> None:
-        """Update a supplier in the cache."""
+    def _update_supplier(self, update: StatusUpdate) -> Supplier:
+        """Update a supplier in the cache and return it."""
         if self._cache is None:
             raise ValueError("No cached data available")
         
-        supplier = next((s for s in self._cache.suppliers if s.id == update.entity_id), None)
+        supplier = self._supplier_ix.get(update.entity_id)
         if supplier is None:
             raise ValueError(f"Supplier not found: {update.entity_id}")
         
@@ -314,37 +539,37 @@ class DataAccessService:
         if hasattr(supplier, update.field):
             setattr(supplier, update.field, update.new_value)
             supplier.last_updated = update.timestamp
+            if update.field == "id":
+                self._supplier_ix[update.new_value] = self._supplier_ix.pop(update.entity_id)
         else:
             raise ValueError(f"Invalid field for supplier: {update.field}")
+        
+        return supplier
     
     # Private helper methods for persisting to CSV
     
+    def _append_updates_csv(self, filepath: Path, entries: list) -> None:
+        """Append (replaced entity ID, updated record) pairs to the change log next to an entity CSV file."""
+        updates_path = _updates_path(filepath)
+        write_header = not updates_path.exists() or updates_path.stat().st_size == 0
+        
+        with open(updates_path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['entity_id', *entries[0][1]])
+            if write_header:
+                writer.writeheader()
+            writer.writerows({'entity_id': entity_id, **row} for entity_id, row in entries)
+    
     def _persist_shipments_csv(self, filepath: Path) -> None:
         """Persist shipments to CSV file."""
         if self._cache is None:
             return
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['id', 'origin', 'destination', 'current_location', 'status',
-                         'estimated_delivery', 'actual_delivery', 'items', 'supplier_id',
-                         'created_at', 'updated_at']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=SHIPMENT_FIELDS)
             writer.writeheader()
             
             for shipment in self._cache.shipments:
-                writer.writerow({
-                    'id': shipment.id,
-                    'origin': shipment.origin,
-                    'destination': shipment.destination,
-                    'current_location': shipment.current_location,
-                    'status': shipment.status.value,
-                    'estimated_delivery': shipment.estimated_delivery.isoformat(),
-                    'actual_delivery': shipment.actual_delivery.isoformat() if shipment.actual_delivery else '',
-                    'items': ';'.join(shipment.items),
-                    'supplier_id': shipment.supplier_id,
-                    'created_at': shipment.created_at.isoformat(),
-                    'updated_at': shipment.updated_at.isoformat()
-                })
+                writer.writerow(self._shipment_row(shipment))
     
     def _persist_inventory_csv(self, filepath: Path) -> None:
         """Persist inventory items to CSV file."""
@@ -352,22 +577,11 @@ class DataAccessService:
             return
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['id', 'name', 'category', 'location', 'quantity',
-                         'unit', 'reorder_point', 'last_updated']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=INVENTORY_FIELDS)
             writer.writeheader()
             
             for item in self._cache.inventory:
-                writer.writerow({
-                    'id': item.id,
-                    'name': item.name,
-                    'category': item.category,
-                    'location': item.location,
-                    'quantity': item.quantity,
-                    'unit': item.unit,
-                    'reorder_point': item.reorder_point,
-                    'last_updated': item.last_updated.isoformat()
-                })
+                writer.writerow(self._inventory_row(item))
     
     def _persist_suppliers_csv(self, filepath: Path) -> None:
         """Persist suppliers to CSV file."""
@@ -375,21 +589,56 @@ class DataAccessService:
             return
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['id', 'name', 'contact', 'performance_score',
-                         'on_time_delivery_rate', 'quality_score', 'average_lead_time',
-                         'total_shipments', 'last_updated']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=SUPPLIER_FIELDS)
             writer.writeheader()
             
             for supplier in self._cache.suppliers:
-                writer.writerow({
-                    'id': supplier.id,
-                    'name': supplier.name,
-                    'contact': supplier.contact,
-                    'performance_score': supplier.performance_score,
-                    'on_time_delivery_rate': supplier.on_time_delivery_rate,
-                    'quality_score': supplier.quality_score,
-                    'average_lead_time': supplier.average_lead_time,
-                    'total_shipments': supplier.total_shipments,
-                    'last_updated': supplier.last_updated.isoformat()
-                })
+                writer.writerow(self._supplier_row(supplier))
+    
+    # Private helper methods for serializing entities to CSV rows
+    
+    @staticmethod
+    def _shipment_row(shipment: Shipment) -> dict:
+        """Serialize a shipment to a CSV row."""
+        return {
+            'id': shipment.id,
+            'origin': shipment.origin,
+            'destination': shipment.destination,
+            'current_location': shipment.current_location,
+            'status': shipment.status.value,
+            'estimated_delivery': shipment.estimated_delivery.isoformat(),
+            'actual_delivery': shipment.actual_delivery.isoformat() if shipment.actual_delivery else '',
+            'items': ';'.join(shipment.items),
+            'supplier_id': shipment.supplier_id,
+            'created_at': shipment.created_at.isoformat(),
+            'updated_at': shipment.updated_at.isoformat()
+        }
+    
+    @staticmethod
+    def _inventory_row(item: InventoryItem) -> dict:
+        """Serialize an inventory item to a CSV row."""
+        return {
+            'id': item.id,
+            'name': item.name,
+            'category': item.category,
+            'location': item.location,
+            'quantity': item.quantity,
+            'unit': item.unit,
+            'reorder_point': item.reorder_point,
+            'last_updated': item.last_updated.isoformat()
+        }
+    
+    @staticmethod
+    def _supplier_row(supplier: Supplier) -> dict:
+        """Serialize a supplier to a CSV row."""
+        return {
+            'id': supplier.id,
+            'name': supplier.name,
+            'contact': supplier.contact,
+            'performance_score': supplier.performance_score,
+            'on_time_delivery_rate': supplier.on_time_delivery_rate,
+            'quality_score': supplier.quality_score,
+            'average_lead_time': supplier.average_lead_time,
+            'total_shipments': supplier.total_shipments,
+            'last_updated': supplier.last_updated.isoformat()
+        }
@@ -7,10 +7,28 @@ to CSV and Excel formats.
 
 import io
 from typing import Union
+import numpy as np
 import pandas as pd
 
-from src.models import SupplyChainData, Shipment, InventoryItem, Supplier, Node, Edge
-from src.filter_engine import FilterCriteria
+from src.models import (
+    SupplyChainData, Shipment, InventoryItem, Supplier, Node, Edge,
+    ShipmentStatus, NodeStatus, NodeType
+)
+from src.filter_engine import FilterCriteria, cached_apply_filters
+
+# Prefer the faster C-accelerated xlsxwriter engine when it is installed
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# Low-cardinality export columns stored as categoricals, with their possible values
+CATEGORICAL_COLUMNS = {
+    'type': ['shipment', 'inventory', 'supplier', 'node', 'edge'],
+    'status': list(dict.fromkeys([status.value for status in ShipmentStatus] + [status.value for status in NodeStatus])),
+    'node_type': [node_type.value for node_type in NodeType],
+}
 
 
 class ExportService:
@@ -32,12 +50,11 @@ class ExportService:
         Returns:
             CSV data as bytes
         """
-        # Create a string buffer to hold CSV data
-        buffer = io.StringIO()
-        data.to_csv(buffer, index=False)
+        # Encode straight into a bytes buffer, avoiding an intermediate str copy
+        buffer = io.BytesIO()
+        data.to_csv(buffer, index=False, encoding='utf-8')
         
-        # Convert string to bytes
-        csv_bytes = buffer.getvalue().encode('utf-8')
+        csv_bytes = buffer.getvalue()
         buffer.close()
         
         return csv_bytes
@@ -46,6 +63,10 @@ class ExportService:
         """
         Export data to Excel format.
         
+        Uses xlsxwriter when installed, otherwise openpyxl. xlsxwriter's
+        constant_memory mode is not used because pandas writes cells column by
+        column, while that mode only keeps the current row.
+        
         Args:
             data: DataFrame containing the data to export
             filename: Name for the exported file (not used in bytes output but kept for interface consistency)
@@ -57,7 +78,7 @@ class ExportService:
         buffer = io.BytesIO()
         
         # Write DataFrame to Excel format
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        with pd.ExcelWriter(buffer, engine=EXCEL_ENGINE) as writer:
             data.to_excel(writer, index=False, sheet_name='Data')
         
         # Get the bytes value
@@ -82,110 +103,120 @@ class ExportService:
             DataFrame containing the prepared export data
         """
         # Apply filters if provided
-        from src.filter_engine import FilterEngine
-        
         if filters and self._has_active_filters(filters):
-            filter_engine = FilterEngine()
-            data = filter_engine.apply_filters(data, filters)
+            data = cached_apply_filters(data, filters)
         
-        # Convert each entity type to DataFrame
+        # Convert each entity type to a dict of column lists
         export_data = {}
         
         # Add shipments data
         if data.shipments:
-            shipments_data = []
-            for shipment in data.shipments:
-                shipments_data.append({
-                    'type': 'shipment',
-                    'id': shipment.id,
-                    'origin': shipment.origin,
-                    'destination': shipment.destination,
-                    'current_location': shipment.current_location,
-                    'status': shipment.status.value,
-                    'estimated_delivery': shipment.estimated_delivery,
-                    'actual_delivery': shipment.actual_delivery,
-                    'items': ', '.join(shipment.items),
-                    'supplier_id': shipment.supplier_id,
-                    'created_at': shipment.created_at,
-                    'updated_at': shipment.updated_at
-                })
-            export_data['shipments'] = pd.DataFrame(shipments_data)
+            export_data['shipments'] = {
+                'type': ['shipment'] * len(data.shipments),
+                'id': [shipment.id for shipment in data.shipments],
+                'origin': [shipment.origin for shipment in data.shipments],
+                'destination': [shipment.destination for shipment in data.shipments],
+                'current_location': [shipment.current_location for shipment in data.shipments],
+                'status': [shipment.status.value for shipment in data.shipments],
+                'estimated_delivery': [shipment.estimated_delivery for shipment in data.shipments],
+                'actual_delivery': [shipment.actual_delivery for shipment in data.shipments],
+                'items': [', '.join(shipment.items) for shipment in data.shipments],
+                'supplier_id': [shipment.supplier_id for shipment in data.shipments],
+                'created_at': [shipment.created_at for shipment in data.shipments],
+                'updated_at': [shipment.updated_at for shipment in data.shipments]
+            }
         
         # Add inventory data
         if data.inventory:
-            inventory_data = []
-            for item in data.inventory:
-                inventory_data.append({
-                    'type': 'inventory',
-                    'id': item.id,
-                    'name': item.name,
-                    'category': item.category,
-                    'location': item.location,
-                    'quantity': item.quantity,
-                    'unit': item.unit,
-                    'reorder_point': item.reorder_point,
-                    'last_updated': item.last_updated
-                })
-            export_data['inventory'] = pd.DataFrame(inventory_data)
+            export_data['inventory'] = {
+                'type': ['inventory'] * len(data.inventory),
+                'id': [item.id for item in data.inventory],
+                'name': [item.name for item in data.inventory],
+                'category': [item.category for item in data.inventory],
+                'location': [item.location for item in data.inventory],
+                'quantity': [item.quantity for item in data.inventory],
+                'unit': [item.unit for item in data.inventory],
+                'reorder_point': [item.reorder_point for item in data.inventory],
+                'last_updated': [item.last_updated for item in data.inventory]
+            }
         
         # Add suppliers data
         if data.suppliers:
-            suppliers_data = []
-            for supplier in data.suppliers:
-                suppliers_data.append({
-                    'type': 'supplier',
-                    'id': supplier.id,
-                    'name': supplier.name,
-                    'contact': supplier.contact,
-                    'performance_score': supplier.performance_score,
-                    'on_time_delivery_rate': supplier.on_time_delivery_rate,
-                    'quality_score': supplier.quality_score,
-                    'average_lead_time': supplier.average_lead_time,
-                    'total_shipments': supplier.total_shipments,
-                    'last_updated': supplier.last_updated
-                })
-            export_data['suppliers'] = pd.DataFrame(suppliers_data)
+            export_data['suppliers'] = {
+                'type': ['supplier'] * len(data.suppliers),
+                'id': [supplier.id for supplier in data.suppliers],
+                'name': [supplier.name for supplier in data.suppliers],
+                'contact': [supplier.contact for supplier in data.suppliers],
+                'performance_score': [supplier.performance_score for supplier in data.suppliers],
+                'on_time_delivery_rate': [supplier.on_time_delivery_rate for supplier in data.suppliers],
+                'quality_score': [supplier.quality_score for supplier in data.suppliers],
+                'average_lead_time': [supplier.average_lead_time for supplier in data.suppliers],
+                'total_shipments': [supplier.total_shipments for supplier in data.suppliers],
+                'last_updated': [supplier.last_updated for supplier in data.suppliers]
+            }
         
         # Add nodes data
         if data.nodes:
-            nodes_data = []
-            for node in data.nodes:
-                nodes_data.append({
-                    'type': 'node',
-                    'id': node.id,
-                    'name': node.name,
-                    'node_type': node.type.value,
-                    'location': node.location,
-                    'latitude': node.latitude,
-                    'longitude': node.longitude,
-                    'status': node.status.value,
-                    'capacity': node.capacity
-                })
-            export_data['nodes'] = pd.DataFrame(nodes_data)
+            export_data['nodes'] = {
+                'type': ['node'] * len(data.nodes),
+                'id': [node.id for node in data.nodes],
+                'name': [node.name for node in data.nodes],
+                'node_type': [node.type.value for node in data.nodes],
+                'location': [node.location for node in data.nodes],
+                'latitude': [node.latitude for node in data.nodes],
+                'longitude': [node.longitude for node in data.nodes],
+                'status': [node.status.value for node in data.nodes],
+                'capacity': [node.capacity for node in data.nodes]
+            }
         
         # Add edges data
         if data.edges:
-            edges_data = []
-            for edge in data.edges:
-                edges_data.append({
-                    'type': 'edge',
-                    'id': edge.id,
-                    'source_node_id': edge.source_node_id,
-                    'target_node_id': edge.target_node_id,
-                    'shipment_ids': ', '.join(edge.shipment_ids),
-                    'active': edge.active
-                })
-            export_data['edges'] = pd.DataFrame(edges_data)
-        
-        # Combine all DataFrames
+            export_data['edges'] = {
+                'type': ['edge'] * len(data.edges),
+                'id': [edge.id for edge in data.edges],
+                'source_node_id': [edge.source_node_id for edge in data.edges],
+                'target_node_id': [edge.target_node_id for edge in data.edges],
+                'shipment_ids': [', '.join(edge.shipment_ids) for edge in data.edges],
+                'active': [edge.active for edge in data.edges]
+            }
+        
+        # Combine all entity types into one DataFrame
         if export_data:
-            # Concatenate all DataFrames, filling missing columns with None
-            combined_df = pd.concat(export_data.values(), ignore_index=True, sort=False)
-            return combined_df
+            return self._combine_columns(list(export_data.values()))
         else:
             # Return empty DataFrame if no data
             return pd.DataFrame()
     
+    def _combine_columns(self, parts: list[dict]) -> pd.DataFrame:
+        """
+        Stack per-entity column lists into a single DataFrame.
+        
+        Each column of the union schema, in order of first appearance, is built
+        as one list with NaN where an entity type lacks it. This gives the same
+        result as concatenating one DataFrame per entity type, without the
+        per-frame reindex and block copies. Columns in CATEGORICAL_COLUMNS are
+        stored as categoricals.
+        
+        Args:
+            parts: Dicts mapping column name to a list of values, one dict per entity type
+            
+        Returns:
+            DataFrame with one row per entity
+        """
+        columns = list(dict.fromkeys(name for part in parts for name in part))
+        lengths = [len(part['type']) for part in parts]
+        
+        combined = {}
+        for name in columns:
+            values = []
+            for part, length in zip(parts, lengths):
+                values.extend(part[name] if name in part else [np.nan] * length)
+            if name in CATEGORICAL_COLUMNS:
+                values = pd.Categorical(values, categories=CATEGORICAL_COLUMNS[name])
+            combined[name] = values
+        
+        return pd.DataFrame(combined, columns=columns)
+    
     def _has_active_filters(self, filters: FilterCriteria) -> bool:
         """
         Check if any filters are active.
@@ -201,5 +232,6 @@ class ExportService:
             filters.status is not None or
             filters.location is not None or
             filters.category is not None or
-            filters.search_query is not None
+            filters.search_query is not None or
+            filters.low_stock_only
         )
@@ -5,11 +5,25 @@ This module provides the FilterEngine class that handles filtering and searching
 supply chain data based on various criteria.
 """
 
+import re
 from dataclasses import dataclass
+from itertools import chain
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Any, Dict, Optional, List, Set, Tuple
 
-from src.models import SupplyChainData, Shipment, InventoryItem, Supplier, Node
+import numpy as np
+
+from src.models import SupplyChainData, Shipment, InventoryItem, Supplier, Node, Edge
+
+
+# Runs of characters that make up a search token
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Length of the substrings in the k-gram index; shorter queries use the token index
+GRAM_LENGTH = 3
+
+# Filtered results kept per dataset by cached_apply_filters
+FILTER_CACHE_SIZE = 32
 
 
 @dataclass
@@ -24,6 +38,7 @@ class FilterCriteria:
         category: Optional list of categories to filter by
         search_query: Optional search query string
         search_fields: Optional list of field names to search in
+        low_stock_only: If True, keep only inventory items below their reorder point
     """
     date_range: Optional[Tuple[datetime, datetime]] = None
     status: Optional[List[str]] = None
@@ -31,6 +46,32 @@ class FilterCriteria:
     category: Optional[List[str]] = None
     search_query: Optional[str] = None
     search_fields: Optional[List[str]] = None
+    low_stock_only: bool = False
+    
+    def cache_key(self) -> Tuple:
+        """
+        Snapshot the criteria values as a hashable tuple, with list fields as tuples.
+        
+        Caches key on a snapshot taken at call time, so entries are matched by
+        value and a later in-place change to the criteria cannot hit an entry
+        stored under the old values.
+        """
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (
+                self.date_range, self.status, self.location, self.category,
+                self.search_query, self.search_fields, self.low_stock_only
+            )
+        )
+    
+    def __hash__(self) -> int:
+        """
+        Hash the criteria by value, treating list fields as tuples.
+        
+        Criteria are mutable: an object used as a dict or set key must not be
+        changed afterwards. Caches should key on cache_key() instead.
+        """
+        return hash(self.cache_key())
 
 
 class FilterEngine:
@@ -48,6 +89,10 @@ class FilterEngine:
         
         Filters are applied to each entity type (shipments, inventory, suppliers, nodes)
         based on the provided criteria. Only applicable filters are applied to each type.
+        Status, location and category filters are resolved through the data's position
+        indexes, and date ranges by binary search over its sorted dates, when they have
+        been built, instead of scanning every entity; search queries go through the same
+        token indexes as search.
         
         Args:
             data: SupplyChainData object to filter
@@ -56,18 +101,33 @@ class FilterEngine:
         Returns:
             New SupplyChainData object containing only filtered entities
         """
+        # Search indexes are only needed when a search is part of the criteria
+        searching = bool(filters.search_query and filters.search_fields)
+        # Date indexes hold naive datetime64 values, so timezone-aware ranges are scanned
+        dated = not filters.date_range or all(d.tzinfo is None for d in filters.date_range)
+        
         # Filter each entity type
-        filtered_shipments = self._filter_shipments(data.shipments, filters)
-        filtered_inventory = self._filter_inventory(data.inventory, filters)
-        filtered_suppliers = self._filter_suppliers(data.suppliers, filters)
-        filtered_nodes = self._filter_nodes(data.nodes, filters)
+        filtered_shipments = self._filter_shipments(
+            data.shipments, filters, data.shipments_by_status, data.shipments_by_location,
+            data.shipments_by_eta if dated else None,
+            self._search_index(data, "shipments") if searching else None
+        )
+        filtered_inventory = self._filter_inventory(
+            data.inventory, filters, data.inventory_by_location, data.inventory_by_category,
+            data.inventory_by_last_updated if dated else None,
+            self._search_index(data, "inventory") if searching else None
+        )
+        filtered_suppliers = self._filter_suppliers(
+            data.suppliers, filters, data.suppliers_by_last_updated if dated else None,
+            self._search_index(data, "suppliers") if searching else None
+        )
+        filtered_nodes = self._filter_nodes(
+            data.nodes, filters, data.nodes_by_status, data.nodes_by_location,
+            self._search_index(data, "nodes") if searching else None
+        )
         
         # Filter edges to only include those connecting filtered nodes
-        filtered_node_ids = {node.id for node in filtered_nodes}
-        filtered_edges = [
-            edge for edge in data.edges
-            if edge.source_node_id in filtered_node_ids and edge.target_node_id in filtered_node_ids
-        ]
+        filtered_edges = self._filter_edges(data, filtered_nodes)
         
         return SupplyChainData(
             shipments=filtered_shipments,
@@ -83,6 +143,9 @@ class FilterEngine:
         Search across specified fields.
         
         Performs case-insensitive text search across the specified fields in all entity types.
+        Candidates are looked up in token indexes stored on the data, built on the first
+        search and rebuilt after data.last_updated changes, and then verified against
+        cached lowercased field values with the same substring test as a full scan.
         
         Args:
             data: SupplyChainData object to search
@@ -98,17 +161,19 @@ class FilterEngine:
         query_lower = query.lower()
         
         # Search each entity type
-        filtered_shipments = self._search_shipments(data.shipments, query_lower, fields)
-        filtered_inventory = self._search_inventory(data.inventory, query_lower, fields)
-        filtered_suppliers = self._search_suppliers(data.suppliers, query_lower, fields)
-        filtered_nodes = self._search_nodes(data.nodes, query_lower, fields)
+        filtered_shipments = self._search_shipments(
+            data.shipments, query_lower, fields, self._search_index(data, "shipments")
+        )
+        filtered_inventory = self._search_inventory(
+            data.inventory, query_lower, fields, self._search_index(data, "inventory")
+        )
+        filtered_suppliers = self._search_suppliers(
+            data.suppliers, query_lower, fields, self._search_index(data, "suppliers")
+        )
+        filtered_nodes = self._search_nodes(data.nodes, query_lower, fields, self._search_index(data, "nodes"))
         
         # Filter edges to only include those connecting filtered nodes
-        filtered_node_ids = {node.id for node in filtered_nodes}
-        filtered_edges = [
-            edge for edge in data.edges
-            if edge.source_node_id in filtered_node_ids and edge.target_node_id in filtered_node_ids
-        ]
+        filtered_edges = self._filter_edges(data, filtered_nodes)
         
         return SupplyChainData(
             shipments=filtered_shipments,
@@ -130,172 +195,477 @@ class FilterEngine:
     
     # Private helper methods for filtering
     
-    def _filter_shipments(self, shipments: List[Shipment], filters: FilterCriteria) -> List[Shipment]:
-        """Filter shipments based on criteria."""
-        result = shipments
+    def _filter_shipments(
+        self,
+        shipments: List[Shipment],
+        filters: FilterCriteria,
+        by_status: Optional[Dict[str, List[int]]] = None,
+        by_location: Optional[Dict[str, List[int]]] = None,
+        by_eta: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        search_index: Optional["_SearchIndex"] = None
+    ) -> List[Shipment]:
+        """Filter shipments based on criteria, using position indexes when given."""
+        # Narrow to indexed matches first, keeping the original order
+        positions = None
+        if filters.status and by_status is not None:
+            positions = _positions_matching(by_status, filters.status)
+        if filters.location and by_location is not None:
+            positions = _intersect(positions, _positions_matching(by_location, filters.location))
+        if filters.date_range and by_eta is not None:
+            positions = _intersect(positions, _positions_in_range(by_eta, filters.date_range))
+        searched = _search_matches(shipments, filters, search_index)
+        positions = _intersect(positions, searched)
+        result = shipments if positions is None else [shipments[p] for p in sorted(positions)]
         
-        # Apply date range filter (using estimated_delivery)
-        if filters.date_range:
-            start_date, end_date = filters.date_range
-            result = [
-                s for s in result
-                if start_date <= s.estimated_delivery <= end_date
-            ]
+        # Check the remaining predicates in one pass, cheapest first
+        predicates = []
         
-        # Apply status filter
-        if filters.status:
-            result = [
-                s for s in result
-                if s.status.value in filters.status
-            ]
+        # Status filter
+        if filters.status and by_status is None:
+            status_set = frozenset(filters.status)
+            predicates.append(lambda s: s.status.value in status_set)
         
-        # Apply location filter (matches origin, destination, or current_location)
-        if filters.location:
-            result = [
-                s for s in result
-                if s.origin in filters.location or 
-                   s.destination in filters.location or 
-                   s.current_location in filters.location
-            ]
+        # Location filter (matches origin, destination, or current_location)
+        if filters.location and by_location is None:
+            location_set = frozenset(filters.location)
+            predicates.append(
+                lambda s: s.origin in location_set or
+                          s.destination in location_set or
+                          s.current_location in location_set
+            )
+        
+        # Date range filter (using estimated_delivery)
+        if filters.date_range and by_eta is None:
+            start_date, end_date = filters.date_range
+            predicates.append(lambda s: start_date <= s.estimated_delivery <= end_date)
         
-        # Apply search if specified
-        if filters.search_query and filters.search_fields:
-            result = self._search_shipments(result, filters.search_query.lower(), filters.search_fields)
+        # Search, if specified and not answered by the index
+        if filters.search_query and filters.search_fields and searched is None:
+            predicates.append(_query_predicate(filters))
         
-        return result
+        return _select(result, predicates)
     
-    def _filter_inventory(self, inventory: List[InventoryItem], filters: FilterCriteria) -> List[InventoryItem]:
-        """Filter inventory items based on criteria."""
-        result = inventory
+    def _filter_inventory(
+        self,
+        inventory: List[InventoryItem],
+        filters: FilterCriteria,
+        by_location: Optional[Dict[str, List[int]]] = None,
+        by_category: Optional[Dict[str, List[int]]] = None,
+        by_last_updated: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        search_index: Optional["_SearchIndex"] = None
+    ) -> List[InventoryItem]:
+        """Filter inventory items based on criteria, using position indexes when given."""
+        # Narrow to indexed matches first, keeping the original order
+        positions = None
+        if filters.location and by_location is not None:
+            positions = _positions_matching(by_location, filters.location)
+        if filters.category and by_category is not None:
+            positions = _intersect(positions, _positions_matching(by_category, filters.category))
+        if filters.date_range and by_last_updated is not None:
+            positions = _intersect(positions, _positions_in_range(by_last_updated, filters.date_range))
+        searched = _search_matches(inventory, filters, search_index)
+        positions = _intersect(positions, searched)
+        result = inventory if positions is None else [inventory[p] for p in sorted(positions)]
         
-        # Apply date range filter (using last_updated)
-        if filters.date_range:
-            start_date, end_date = filters.date_range
-            result = [
-                i for i in result
-                if start_date <= i.last_updated <= end_date
-            ]
+        # Check the remaining predicates in one pass, cheapest first
+        predicates = []
         
-        # Apply location filter
-        if filters.location:
-            result = [
-                i for i in result
-                if i.location in filters.location
-            ]
+        # Location filter
+        if filters.location and by_location is None:
+            location_set = frozenset(filters.location)
+            predicates.append(lambda i: i.location in location_set)
         
-        # Apply category filter
-        if filters.category:
-            result = [
-                i for i in result
-                if i.category in filters.category
-            ]
+        # Category filter
+        if filters.category and by_category is None:
+            category_set = frozenset(filters.category)
+            predicates.append(lambda i: i.category in category_set)
         
-        # Apply search if specified
-        if filters.search_query and filters.search_fields:
-            result = self._search_inventory(result, filters.search_query.lower(), filters.search_fields)
+        # Low stock filter
+        if filters.low_stock_only:
+            predicates.append(lambda i: i.quantity < i.reorder_point)
         
-        return result
+        # Date range filter (using last_updated)
+        if filters.date_range and by_last_updated is None:
+            start_date, end_date = filters.date_range
+            predicates.append(lambda i: start_date <= i.last_updated <= end_date)
+        
+        # Search, if specified and not answered by the index
+        if filters.search_query and filters.search_fields and searched is None:
+            predicates.append(_query_predicate(filters))
+        
+        return _select(result, predicates)
     
-    def _filter_suppliers(self, suppliers: List[Supplier], filters: FilterCriteria) -> List[Supplier]:
-        """Filter suppliers based on criteria."""
-        result = suppliers
+    def _filter_suppliers(
+        self,
+        suppliers: List[Supplier],
+        filters: FilterCriteria,
+        by_last_updated: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        search_index: Optional["_SearchIndex"] = None
+    ) -> List[Supplier]:
+        """Filter suppliers based on criteria, using sorted dates when given."""
+        # Narrow to indexed matches first, keeping the original order
+        positions = None
+        if filters.date_range and by_last_updated is not None:
+            positions = _positions_in_range(by_last_updated, filters.date_range)
+        searched = _search_matches(suppliers, filters, search_index)
+        positions = _intersect(positions, searched)
+        result = suppliers if positions is None else [suppliers[p] for p in sorted(positions)]
         
-        # Apply date range filter (using last_updated)
-        if filters.date_range:
+        # Check the remaining predicates in one pass
+        predicates = []
+        
+        # Date range filter (using last_updated)
+        if filters.date_range and by_last_updated is None:
             start_date, end_date = filters.date_range
-            result = [
-                s for s in result
-                if start_date <= s.last_updated <= end_date
-            ]
+            predicates.append(lambda s: start_date <= s.last_updated <= end_date)
         
-        # Apply search if specified
-        if filters.search_query and filters.search_fields:
-            result = self._search_suppliers(result, filters.search_query.lower(), filters.search_fields)
+        # Search, if specified and not answered by the index
+        if filters.search_query and filters.search_fields and searched is None:
+            predicates.append(_query_predicate(filters))
         
-        return result
+        return _select(result, predicates)
     
-    def _filter_nodes(self, nodes: List[Node], filters: FilterCriteria) -> List[Node]:
-        """Filter nodes based on criteria."""
-        result = nodes
+    def _filter_nodes(
+        self,
+        nodes: List[Node],
+        filters: FilterCriteria,
+        by_status: Optional[Dict[str, List[int]]] = None,
+        by_location: Optional[Dict[str, List[int]]] = None,
+        search_index: Optional["_SearchIndex"] = None
+    ) -> List[Node]:
+        """Filter nodes based on criteria, using position indexes when given."""
+        # Narrow to indexed matches first, keeping the original order
+        positions = None
+        if filters.status and by_status is not None:
+            positions = _positions_matching(by_status, filters.status)
+        if filters.location and by_location is not None:
+            positions = _intersect(positions, _positions_matching(by_location, filters.location))
+        searched = _search_matches(nodes, filters, search_index)
+        positions = _intersect(positions, searched)
+        result = nodes if positions is None else [nodes[p] for p in sorted(positions)]
         
-        # Apply status filter
-        if filters.status:
-            result = [
-                n for n in result
-                if n.status.value in filters.status
-            ]
+        # Check the remaining predicates in one pass, cheapest first
+        predicates = []
         
-        # Apply location filter
-        if filters.location:
-            result = [
-                n for n in result
-                if n.location in filters.location
-            ]
+        # Status filter
+        if filters.status and by_status is None:
+            status_set = frozenset(filters.status)
+            predicates.append(lambda n: n.status.value in status_set)
         
-        # Apply search if specified
-        if filters.search_query and filters.search_fields:
-            result = self._search_nodes(result, filters.search_query.lower(), filters.search_fields)
+        # Location filter
+        if filters.location and by_location is None:
+            location_set = frozenset(filters.location)
+            predicates.append(lambda n: n.location in location_set)
         
-        return result
+        # Search, if specified and not answered by the index
+        if filters.search_query and filters.search_fields and searched is None:
+            predicates.append(_query_predicate(filters))
+        
+        return _select(result, predicates)
+    
+    def _filter_edges(self, data: SupplyChainData, nodes: List[Node]) -> List[Edge]:
+        """Keep the edges of data whose source and target are both among nodes."""
+        if nodes is data.nodes and data.nodes_by_id is not None:
+            # No node was filtered out: reuse the ID index, and the edge list itself
+            # when the adjacency indexes show every endpoint is a known node
+            node_ids = data.nodes_by_id
+            if data.edges_by_source is not None and data.edges_by_target is not None and all(
+                node_id in node_ids for node_id in chain(data.edges_by_source, data.edges_by_target)
+            ):
+                return data.edges
+        else:
+            node_ids = {node.id for node in nodes}
+        
+        return [
+            edge for edge in data.edges
+            if edge.source_node_id in node_ids and edge.target_node_id in node_ids
+        ]
     
     # Private helper methods for searching
     
-    def _search_shipments(self, shipments: List[Shipment], query: str, fields: List[str]) -> List[Shipment]:
+    def _search_index(self, data: SupplyChainData, kind: str) -> "_SearchIndex":
+        """
+        Get the search index for one entity list of data, rebuilding it if the data changed.
+        
+        data.search_indexes may be shared between copies of the same load, such as
+        the per-rerun copies of a cached dataset, since indexes refer to entities
+        by position.
+        """
+        if data.search_indexes is None:
+            data.search_indexes = {}
+        index = data.search_indexes.get(kind)
+        entities = getattr(data, kind)
+        if index is None or index.version != data.last_updated or index.size != len(entities):
+            index = _SearchIndex(entities, data.last_updated)
+            data.search_indexes[kind] = index
+        return index
+    
+    def _search_shipments(
+        self,
+        shipments: List[Shipment],
+        query: str,
+        fields: List[str],
+        index: Optional["_SearchIndex"] = None
+    ) -> List[Shipment]:
         """Search shipments in specified fields."""
-        result = []
-        for shipment in shipments:
-            for field in fields:
-                if hasattr(shipment, field):
-                    value = getattr(shipment, field)
-                    # Convert value to string for searching
-                    if value is not None:
-                        value_str = str(value).lower()
-                        if query in value_str:
-                            result.append(shipment)
-                            break
-        return result
+        return _search_entities(shipments, query, fields, index)
     
-    def _search_inventory(self, inventory: List[InventoryItem], query: str, fields: List[str]) -> List[InventoryItem]:
+    def _search_inventory(
+        self,
+        inventory: List[InventoryItem],
+        query: str,
+        fields: List[str],
+        index: Optional["_SearchIndex"] = None
+    ) -> List[InventoryItem]:
         """Search inventory items in specified fields."""
-        result = []
-        for item in inventory:
-            for field in fields:
-                if hasattr(item, field):
-                    value = getattr(item, field)
-                    # Convert value to string for searching
-                    if value is not None:
-                        value_str = str(value).lower()
-                        if query in value_str:
-                            result.append(item)
-                            break
-        return result
+        return _search_entities(inventory, query, fields, index)
     
-    def _search_suppliers(self, suppliers: List[Supplier], query: str, fields: List[str]) -> List[Supplier]:
+    def _search_suppliers(
+        self,
+        suppliers: List[Supplier],
+        query: str,
+        fields: List[str],
+        index: Optional["_SearchIndex"] = None
+    ) -> List[Supplier]:
         """Search suppliers in specified fields."""
-        result = []
-        for supplier in suppliers:
-            for field in fields:
-                if hasattr(supplier, field):
-                    value = getattr(supplier, field)
-                    # Convert value to string for searching
-                    if value is not None:
-                        value_str = str(value).lower()
-                        if query in value_str:
-                            result.append(supplier)
-                            break
-        return result
+        return _search_entities(suppliers, query, fields, index)
     
-    def _search_nodes(self, nodes: List[Node], query: str, fields: List[str]) -> List[Node]:
+    def _search_nodes(
+        self,
+        nodes: List[Node],
+        query: str,
+        fields: List[str],
+        index: Optional["_SearchIndex"] = None
+    ) -> List[Node]:
         """Search nodes in specified fields."""
-        result = []
-        for node in nodes:
-            for field in fields:
-                if hasattr(node, field):
-                    value = getattr(node, field)
-                    # Convert value to string for searching
-                    if value is not None:
-                        value_str = str(value).lower()
-                        if query in value_str:
-                            result.append(node)
-                            break
+        return _search_entities(nodes, query, fields, index)
+
+
+class _SearchIndex:
+    """
+    Lowercased values with token and k-gram postings over entity fields.
+    
+    Each field is indexed on first use: the string form of its values is
+    lowercased once, and every run of TOKEN_PATTERN characters, or every
+    GRAM_LENGTH character substring, maps to the positions of the entities
+    whose value contains it.
+    
+    Results are positions, so an index built over one list also answers for
+    copies of it with the same version, e.g. unpickled from a cache.
+    """
+    
+    __slots__ = ("entities", "version", "size", "_values", "_postings", "_grams")
+    
+    def __init__(self, entities: List[Any], version: datetime):
+        self.entities = entities
+        self.version = version
+        self.size = len(entities)
+        self._values: Dict[str, List[Optional[str]]] = {}
+        self._postings: Dict[str, Dict[str, Set[int]]] = {}
+        self._grams: Dict[str, Dict[str, Set[int]]] = {}
+    
+    def values(self, field: str) -> List[Optional[str]]:
+        """Get the lowercased string form of a field per position, None where it is missing."""
+        values = self._values.get(field)
+        if values is None:
+            values = []
+            for entity in self.entities:
+                value = getattr(entity, field, None)
+                values.append(None if value is None else str(value).lower())
+            self._values[field] = values
+        return values
+    
+    def grams(self, field: str) -> Dict[str, Set[int]]:
+        """Get the k-gram postings for a field, building them on first use."""
+        grams = self._grams.get(field)
+        if grams is None:
+            grams = {}
+            for position, value_str in enumerate(self.values(field)):
+                if value_str is not None:
+                    for start in range(len(value_str) - GRAM_LENGTH + 1):
+                        grams.setdefault(value_str[start:start + GRAM_LENGTH], set()).add(position)
+            self._grams[field] = grams
+        return grams
+    
+    def postings(self, field: str) -> Dict[str, Set[int]]:
+        """Get the token postings for a field, building them on first use."""
+        postings = self._postings.get(field)
+        if postings is None:
+            postings = {}
+            for position, value_str in enumerate(self.values(field)):
+                if value_str is not None:
+                    for token in TOKEN_PATTERN.findall(value_str):
+                        postings.setdefault(token, set()).add(position)
+            self._postings[field] = postings
+        return postings
+    
+    def matching(self, query: str, fields: List[str]) -> Set[int]:
+        """
+        Find the positions of entities with query as a substring of one of the fields.
+        
+        Candidates are narrowed through the postings and then checked against the
+        cached lowercased values, so the result is the same as a full scan.
+        
+        Args:
+            query: Lowercased search query
+            fields: Field names to search in
+            
+        Returns:
+            Set of matching positions
+        """
+        result: Set[int] = set()
+        for field in fields:
+            values = self.values(field)
+            candidates = self._candidates(query, field)
+            if candidates is None:
+                candidates = range(len(values))
+            result.update(
+                position for position in candidates
+                if position not in result and values[position] is not None and query in values[position]
+            )
         return result
+    
+    def _candidates(self, query: str, field: str) -> Optional[Set[int]]:
+        """
+        Find the positions of entities that may contain query in a field.
+        
+        Queries of at least GRAM_LENGTH characters intersect the postings of their
+        k-grams, since a value containing the query contains each of them. Shorter
+        queries use the token index: every token of a matching query lies inside
+        some token of the value, so an entity is a candidate if each query token is
+        contained in one of its tokens.
+        
+        Returns:
+            Set of candidate positions, or None if the query has nothing to look up
+        """
+        if len(query) >= GRAM_LENGTH:
+            grams = self.grams(field)
+            query_grams = {query[start:start + GRAM_LENGTH] for start in range(len(query) - GRAM_LENGTH + 1)}
+            postings = sorted((grams.get(gram, set()) for gram in query_grams), key=len)
+        else:
+            query_tokens = set(TOKEN_PATTERN.findall(query))
+            if not query_tokens:
+                return None
+            token_postings = self.postings(field)
+            postings = [
+                set().union(*(
+                    entity_positions for token, entity_positions in token_postings.items()
+                    if query_token in token
+                ))
+                for query_token in query_tokens
+            ]
+        
+        positions = set(postings[0])
+        for entity_positions in postings[1:]:
+            if not positions:
+                break
+            positions &= entity_positions
+        return positions
+
+
+def _search_entities(entities: List[Any], query: str, fields: List[str], index: Optional[_SearchIndex] = None) -> List[Any]:
+    """
+    Keep the entities with query as a substring of one of the fields.
+    
+    When an index over the full entity list, or a copy of it, is given, matches
+    are found through it; other lists are scanned.
+    """
+    if index is None or index.size != len(entities):
+        return [entity for entity in entities if _matches_query(entity, query, fields)]
+    
+    return [entities[p] for p in sorted(index.matching(query, fields))]
+
+
+def _matches_query(entity: Any, query: str, fields: List[str]) -> bool:
+    """Check whether query is a substring of the lowercased string form of one of the fields."""
+    for field in fields:
+        # Missing fields read as None, so a single lookup replaces hasattr + getattr
+        value = getattr(entity, field, None)
+        # Convert value to string for searching
+        if value is not None and query in str(value).lower():
+            return True
+    return False
+
+
+def _query_predicate(filters: FilterCriteria):
+    """Build the search predicate for the query and fields in filters."""
+    query = filters.search_query.lower()
+    fields = filters.search_fields
+    return lambda entity: _matches_query(entity, query, fields)
+
+
+def _search_matches(
+    entities: List[Any],
+    filters: FilterCriteria,
+    index: Optional[_SearchIndex]
+) -> Optional[Set[int]]:
+    """Look up the positions of entities matching the search, or None if there is no index for them."""
+    if index is None or index.size != len(entities) or not (filters.search_query and filters.search_fields):
+        return None
+    return index.matching(filters.search_query.lower(), filters.search_fields)
+
+
+def _select(entities: List[Any], predicates: List) -> List[Any]:
+    """Keep the entities passing every predicate, checking them in order."""
+    if not predicates:
+        return entities
+    if len(predicates) == 1:
+        return list(filter(predicates[0], entities))
+    return [entity for entity in entities if all(predicate(entity) for predicate in predicates)]
+
+
+def _intersect(positions: Optional[Set[int]], matching: Optional[Set[int]]) -> Optional[Set[int]]:
+    """Intersect two optional position sets, where None means no restriction."""
+    if positions is None:
+        return matching
+    if matching is None:
+        return positions
+    return positions & matching
+
+def _positions_matching(index: Dict[str, List[int]], keys: List[str]) -> Set[int]:
+    """Collect the positions listed under any of the keys in a position index."""
+    return set().union(*(index.get(key, ()) for key in keys))
+
+
+def _positions_in_range(by_date: Tuple[np.ndarray, np.ndarray], date_range: Tuple[datetime, datetime]) -> Set[int]:
+    """Collect the positions whose date lies within date_range, inclusive, by binary search."""
+    sorted_dates, order = by_date
+    start_date, end_date = date_range
+    lo = np.searchsorted(sorted_dates, np.datetime64(start_date, "us"), side="left")
+    hi = np.searchsorted(sorted_dates, np.datetime64(end_date, "us"), side="right")
+    return set(order[lo:hi].tolist())
+
+
+def cached_apply_filters(data: SupplyChainData, filters: FilterCriteria) -> SupplyChainData:
+    """
+    Apply filter criteria to dataset, reusing earlier results.
+    
+    Results are memoized on the data object itself, keyed by data.last_updated
+    and a snapshot of the criteria values, so components filtering the same data
+    with equal criteria share one pass, and the results are released together
+    with the data. The returned SupplyChainData is shared between callers and
+    must not be modified.
+    
+    Args:
+        data: SupplyChainData object to filter
+        filters: FilterCriteria specifying the filters to apply
+        
+    Returns:
+        SupplyChainData object containing only filtered entities
+    """
+    if data.filter_results is None:
+        data.filter_results = {}
+    
+    key = (data.last_updated, filters.cache_key())
+    result = data.filter_results.pop(key, None)
+    
+    if result is None:
+        result = FilterEngine().apply_filters(data, filters)
+        
+        # Evict the least recently used result when full
+        if len(data.filter_results) >= FILTER_CACHE_SIZE:
+            del data.filter_results[next(iter(data.filter_results))]
+    
+    # Reinsert so the most recently used result is last
+    data.filter_results[key] = result
+    return result
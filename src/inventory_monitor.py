@@ -7,9 +7,11 @@ low stock detection, and trend analysis functionality.
 
 from typing import List
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from src.models import InventoryItem, SupplyChainData
+import numpy as np
+
+from src.models import InventoryItem, SupplyChainData, find_by_id
 from src.filter_engine import FilterCriteria, FilterEngine
 
 
@@ -100,26 +102,23 @@ class InventoryMonitor:
             ValueError: If item with the given ID is not found
         """
         # Find the inventory item
-        item = next((i for i in self.data.inventory if i.id == item_id), None)
+        item = find_by_id(self.data.inventory, self.data.inventory_by_id, item_id)
         if item is None:
             raise ValueError(f"Inventory item not found: {item_id}")
         
-        # Generate date range
-        end_date = datetime.now()
-        dates = [end_date - timedelta(days=i) for i in range(days - 1, -1, -1)]
+        # Generate date range, one day apart and ending now
+        end_date = np.datetime64(datetime.now(), "us")
+        dates = (end_date - np.arange(days - 1, -1, -1) * np.timedelta64(1, "D")).tolist()
         
         # In a real implementation, we would query historical data
         # For now, we'll generate a simple trend based on current quantity
         # This simulates gradual changes in inventory over time
         current_quantity = item.quantity
-        values = []
         
-        for i in range(days):
-            # Simple simulation: add some variation around current quantity
-            # In production, this would be actual historical data
-            variation = (i - days // 2) * 0.05  # Small variation
-            simulated_value = max(0, current_quantity * (1 + variation))
-            values.append(simulated_value)
+        # Simple simulation: add some variation around current quantity
+        # In production, this would be actual historical data
+        variation = (np.arange(days) - days // 2) * 0.05  # Small variation
+        values = np.maximum(0.0, current_quantity * (1 + variation)).tolist()
         
         return TimeSeries(
             dates=dates,
@@ -5,10 +5,12 @@ This module defines the core data structures used throughout the application,
 including shipments, inventory items, suppliers, network nodes, alerts, and status updates.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 # Enumerations
@@ -21,6 +23,10 @@ class ShipmentStatus(Enum):
     DELIVERED = "delivered"
 
 
+# Integer code of each shipment status, in declaration order
+SHIPMENT_STATUS_CODES = {status: code for code, status in enumerate(ShipmentStatus)}
+
+
 class NodeType(Enum):
     """Type of node in the supply chain network."""
     SUPPLIER = "supplier"
@@ -52,7 +58,7 @@ class AlertSeverity(Enum):
 
 # Data Models
 
-@dataclass
+@dataclass(slots=True)
 class Shipment:
     """
     Represents a shipment in the supply chain.
@@ -94,7 +100,7 @@ class Shipment:
             raise ValueError("Shipment supplier_id cannot be empty")
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """
     Represents an inventory item tracked in the supply chain.
@@ -130,7 +136,7 @@ class InventoryItem:
             raise ValueError("InventoryItem reorder_point cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class Supplier:
     """
     Represents a supplier in the supply chain.
@@ -174,7 +180,7 @@ class Supplier:
             raise ValueError("Supplier total_shipments cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """
     Represents a node in the supply chain network.
@@ -212,7 +218,7 @@ class Node:
             raise ValueError("Node capacity cannot be negative")
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """
     Represents a connection between nodes in the supply chain network.
@@ -242,7 +248,7 @@ class Edge:
             raise ValueError("Edge source and target nodes cannot be the same")
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """
     Represents an alert generated by the system.
@@ -322,6 +328,32 @@ class SupplyChainData:
         nodes: List of all network nodes
         edges: List of all network edges
         last_updated: Timestamp of last data update
+        inventory_quantity: Optional array of inventory quantities, aligned with inventory
+        inventory_reorder_point: Optional array of inventory reorder points, aligned with inventory
+        supplier_performance: Optional array of supplier performance scores, aligned with suppliers
+        shipment_status_codes: Optional int8 array of SHIPMENT_STATUS_CODES, aligned with shipments
+        shipments_by_status: Optional map of status value to shipment positions
+        shipments_by_location: Optional map of origin, destination or current location to shipment positions
+        inventory_by_location: Optional map of location to inventory positions
+        inventory_by_category: Optional map of category to inventory positions
+        nodes_by_status: Optional map of status value to node positions
+        nodes_by_location: Optional map of location to node positions
+        shipments_by_eta: Optional (sorted estimated delivery times, shipment positions in that order)
+        inventory_by_last_updated: Optional (sorted last updated times, inventory positions in that order)
+        suppliers_by_last_updated: Optional (sorted last updated times, supplier positions in that order)
+        shipments_by_id: Optional map of ID to shipment
+        inventory_by_id: Optional map of ID to inventory item
+        suppliers_by_id: Optional map of ID to supplier
+        nodes_by_id: Optional map of ID to node
+        edges_by_source: Optional map of source node ID to edge positions
+        edges_by_target: Optional map of target node ID to edge positions
+        search_indexes: Optional map of entity list name to text search index
+        filter_results: Optional memo of filtered copies of this data, keyed by version and criteria
+    
+    The numeric arrays and position indexes are derived caches of the entity
+    lists; they are None until build_derived_caches is called and after the
+    data is modified. Search indexes and filter results are built lazily by
+    the filter engine and dropped along with the other caches.
     """
     shipments: List[Shipment]
     inventory: List[InventoryItem]
@@ -329,3 +361,148 @@ class SupplyChainData:
     nodes: List[Node]
     edges: List[Edge]
     last_updated: datetime
+    inventory_quantity: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    inventory_reorder_point: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    supplier_performance: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    shipment_status_codes: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    shipments_by_status: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    shipments_by_location: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    inventory_by_location: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    inventory_by_category: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    nodes_by_status: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    nodes_by_location: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    shipments_by_eta: Optional[Tuple[np.ndarray, np.ndarray]] = field(default=None, repr=False, compare=False)
+    inventory_by_last_updated: Optional[Tuple[np.ndarray, np.ndarray]] = field(default=None, repr=False, compare=False)
+    suppliers_by_last_updated: Optional[Tuple[np.ndarray, np.ndarray]] = field(default=None, repr=False, compare=False)
+    shipments_by_id: Optional[Dict[str, Shipment]] = field(default=None, repr=False, compare=False)
+    inventory_by_id: Optional[Dict[str, InventoryItem]] = field(default=None, repr=False, compare=False)
+    suppliers_by_id: Optional[Dict[str, Supplier]] = field(default=None, repr=False, compare=False)
+    nodes_by_id: Optional[Dict[str, Node]] = field(default=None, repr=False, compare=False)
+    edges_by_source: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    edges_by_target: Optional[Dict[str, List[int]]] = field(default=None, repr=False, compare=False)
+    search_indexes: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    filter_results: Optional[Dict[Tuple, "SupplyChainData"]] = field(default=None, repr=False, compare=False)
+    
+    def build_derived_caches(self) -> None:
+        """Build the numeric arrays and position indexes from the current entity lists."""
+        self.inventory_quantity = np.fromiter(
+            (item.quantity for item in self.inventory), dtype=np.float64, count=len(self.inventory)
+        )
+        self.inventory_reorder_point = np.fromiter(
+            (item.reorder_point for item in self.inventory), dtype=np.float64, count=len(self.inventory)
+        )
+        self.supplier_performance = np.fromiter(
+            (supplier.performance_score for supplier in self.suppliers), dtype=np.float64, count=len(self.suppliers)
+        )
+        self.shipment_status_codes = np.fromiter(
+            (SHIPMENT_STATUS_CODES[shipment.status] for shipment in self.shipments), dtype=np.int8, count=len(self.shipments)
+        )
+        
+        self.shipments_by_status = _positions_by(shipment.status.value for shipment in self.shipments)
+        self.shipments_by_location = _positions_by(
+            (shipment.origin, shipment.destination, shipment.current_location) for shipment in self.shipments
+        )
+        self.inventory_by_location = _positions_by(item.location for item in self.inventory)
+        self.inventory_by_category = _positions_by(item.category for item in self.inventory)
+        self.nodes_by_status = _positions_by(node.status.value for node in self.nodes)
+        self.nodes_by_location = _positions_by(node.location for node in self.nodes)
+        
+        self.shipments_by_eta = _sorted_dates(shipment.estimated_delivery for shipment in self.shipments)
+        self.inventory_by_last_updated = _sorted_dates(item.last_updated for item in self.inventory)
+        self.suppliers_by_last_updated = _sorted_dates(supplier.last_updated for supplier in self.suppliers)
+        
+        self.shipments_by_id = index_by_id(self.shipments)
+        self.inventory_by_id = index_by_id(self.inventory)
+        self.suppliers_by_id = index_by_id(self.suppliers)
+        self.nodes_by_id = index_by_id(self.nodes)
+        
+        self.edges_by_source = _positions_by(edge.source_node_id for edge in self.edges)
+        self.edges_by_target = _positions_by(edge.target_node_id for edge in self.edges)
+    
+    def clear_derived_caches(self) -> None:
+        """Drop the numeric arrays, indexes and memoized filter results so they are not used after the data changes."""
+        self.inventory_quantity = None
+        self.inventory_reorder_point = None
+        self.supplier_performance = None
+        self.shipment_status_codes = None
+        self.shipments_by_status = None
+        self.shipments_by_location = None
+        self.inventory_by_location = None
+        self.inventory_by_category = None
+        self.nodes_by_status = None
+        self.nodes_by_location = None
+        self.shipments_by_eta = None
+        self.inventory_by_last_updated = None
+        self.suppliers_by_last_updated = None
+        self.shipments_by_id = None
+        self.inventory_by_id = None
+        self.suppliers_by_id = None
+        self.nodes_by_id = None
+        self.edges_by_source = None
+        self.edges_by_target = None
+        self.search_indexes = None
+        self.filter_results = None
+
+
+def index_by_id(entities: list) -> dict:
+    """Map each entity ID to the first entity in the list with that ID."""
+    index = {}
+    for entity in entities:
+        index.setdefault(entity.id, entity)
+    return index
+
+
+def find_by_id(entities: list, index: Optional[dict], entity_id: str) -> Optional[Any]:
+    """
+    Find the first entity with the given ID.
+    
+    Args:
+        entities: List of entities to search
+        index: Optional map of ID to entity for the same list, as built by index_by_id
+        entity_id: ID to look up
+        
+    Returns:
+        The matching entity, or None if there is none
+    """
+    if index is not None:
+        return index.get(entity_id)
+    return next((entity for entity in entities if entity.id == entity_id), None)
+
+
+def _sorted_dates(dates) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Sort dates for range lookups with np.searchsorted.
+    
+    datetime64 has no timezone, so timezone-aware dates are left unindexed
+    and filtered by comparing the datetimes themselves.
+    
+    Args:
+        dates: One datetime per position
+        
+    Returns:
+        Tuple of (datetime64[us] array in ascending order, positions in that order),
+        or None if any date is timezone-aware
+    """
+    dates = list(dates)
+    if any(date.tzinfo is not None for date in dates):
+        return None
+    values = np.array(dates, dtype="datetime64[us]")
+    order = np.argsort(values, kind="stable")
+    return values[order], order
+
+
+def _positions_by(keys) -> Dict[str, List[int]]:
+    """
+    Map each key to the ascending positions it occurs at.
+    
+    Args:
+        keys: One key, or a tuple of keys, per position
+        
+    Returns:
+        Dictionary of key to list of positions, each position listed once per key
+    """
+    index: Dict[str, List[int]] = {}
+    for position, key in enumerate(keys):
+        for value in (dict.fromkeys(key) if isinstance(key, tuple) else (key,)):
+            index.setdefault(value, []).append(position)
+    return index
@@ -9,7 +9,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 import plotly.graph_objects as go
 
-from src.models import Node, Edge, SupplyChainData, NodeStatus
+from src.models import Node, Edge, SupplyChainData, NodeStatus, find_by_id
 
 
 @dataclass
@@ -59,7 +59,8 @@ class NetworkVisualizer:
         
         Creates an interactive network visualization using plotly with nodes
         positioned in a layout and edges connecting them. Nodes are color-coded
-        by their status.
+        by their status. Traces use WebGL (Scattergl) so large networks render
+        without building an SVG element per point.
         
         Args:
             nodes: List of Node objects to visualize
@@ -94,7 +95,7 @@ class NetworkVisualizer:
                 x0, y0 = node_positions[edge.source_node_id]
                 x1, y1 = node_positions[edge.target_node_id]
                 
-                edge_trace = go.Scatter(
+                edge_trace = go.Scattergl(
                     x=[x0, x1, None],
                     y=[y0, y1, None],
                     mode='lines',
@@ -118,7 +119,7 @@ class NetworkVisualizer:
                 node_colors.append(self.STATUS_COLORS.get(node.status, 'gray'))
                 node_text.append(f"{node.name}<br>Type: {node.type.value}<br>Status: {node.status.value}")
         
-        node_trace = go.Scatter(
+        node_trace = go.Scattergl(
             x=node_x,
             y=node_y,
             mode='markers+text',
@@ -153,7 +154,8 @@ class NetworkVisualizer:
         Get details for a specific network node.
         
         Retrieves the node and enriches it with information about connected
-        shipments and edge counts.
+        shipments and edge counts. Edges are looked up through the data's
+        adjacency indexes when they have been built, instead of walking every edge.
         
         Args:
             node_id: Unique identifier of the node
@@ -165,28 +167,29 @@ class NetworkVisualizer:
             ValueError: If node with the given ID is not found
         """
         # Find the node
-        node = next((n for n in self.data.nodes if n.id == node_id), None)
+        node = find_by_id(self.data.nodes, self.data.nodes_by_id, node_id)
         if node is None:
             raise ValueError(f"Node not found: {node_id}")
         
+        # Find the edges leaving and entering the node
+        edges = self.data.edges
+        if self.data.edges_by_source is not None and self.data.edges_by_target is not None:
+            outgoing = [edges[position] for position in self.data.edges_by_source.get(node_id, ())]
+            incoming = [edges[position] for position in self.data.edges_by_target.get(node_id, ())]
+        else:
+            outgoing = [edge for edge in edges if edge.source_node_id == node_id]
+            incoming = [edge for edge in edges if edge.target_node_id == node_id]
+        
         # Find connected shipments
         connected_shipment_ids = set()
-        incoming_edges = 0
-        outgoing_edges = 0
-        
-        for edge in self.data.edges:
-            if edge.source_node_id == node_id:
-                outgoing_edges += 1
-                connected_shipment_ids.update(edge.shipment_ids)
-            if edge.target_node_id == node_id:
-                incoming_edges += 1
-                connected_shipment_ids.update(edge.shipment_ids)
+        for edge in outgoing + incoming:
+            connected_shipment_ids.update(edge.shipment_ids)
         
         return NodeDetails(
             node=node,
             connected_shipment_ids=list(connected_shipment_ids),
-            incoming_edges=incoming_edges,
-            outgoing_edges=outgoing_edges
+            incoming_edges=len(incoming),
+            outgoing_edges=len(outgoing)
         )
     
     def render_geographic_map(self, nodes: List[Node]) -> go.Figure:
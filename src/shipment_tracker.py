@@ -8,7 +8,7 @@ listing, searching, and detail retrieval functionality.
 from typing import List, Optional
 from dataclasses import dataclass
 
-from src.models import Shipment, SupplyChainData
+from src.models import Shipment, SupplyChainData, find_by_id
 from src.filter_engine import FilterCriteria, FilterEngine
 
 
@@ -76,12 +76,12 @@ class ShipmentTracker:
             ValueError: If shipment with the given ID is not found
         """
         # Find the shipment
-        shipment = next((s for s in self.data.shipments if s.id == shipment_id), None)
+        shipment = find_by_id(self.data.shipments, self.data.shipments_by_id, shipment_id)
         if shipment is None:
             raise ValueError(f"Shipment not found: {shipment_id}")
         
         # Find the supplier name
-        supplier = next((s for s in self.data.suppliers if s.id == shipment.supplier_id), None)
+        supplier = find_by_id(self.data.suppliers, self.data.suppliers_by_id, shipment.supplier_id)
         supplier_name = supplier.name if supplier else None
         
         return ShipmentDetails(
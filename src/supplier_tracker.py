@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from src.models import Supplier, Shipment, SupplyChainData
+from src.models import Supplier, Shipment, SupplyChainData, find_by_id
 
 
 @dataclass
@@ -118,7 +118,7 @@ class SupplierPerformanceTracker:
             ValueError: If supplier_id is not found
         """
         # Find the supplier
-        supplier = next((s for s in self.data.suppliers if s.id == supplier_id), None)
+        supplier = find_by_id(self.data.suppliers, self.data.suppliers_by_id, supplier_id)
         if supplier is None:
             raise ValueError(f"Supplier not found: {supplier_id}")
         
@@ -254,7 +254,7 @@ class SupplierPerformanceTracker:
             raise ValueError("days must be non-negative")
         
         # Verify supplier exists
-        supplier = next((s for s in self.data.suppliers if s.id == supplier_id), None)
+        supplier = find_by_id(self.data.suppliers, self.data.suppliers_by_id, supplier_id)
         if supplier is None:
             raise ValueError(f"Supplier not found: {supplier_id}")
         
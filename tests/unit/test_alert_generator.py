@@ -5,6 +5,7 @@ Tests the alert generation functionality including shipment delays,
 low inventory, and supplier performance alerts.
 """
 
+import uuid
 import pytest
 from datetime import datetime, timedelta
 from src.alert_generator import AlertGenerator
@@ -27,7 +28,8 @@ class TestAlertGenerator:
         """Test AlertGenerator initialization."""
         generator = AlertGenerator()
         assert generator is not None
-        assert generator._alerts == {}
+        assert generator._alerts == []
+        assert generator._alert_index == {}
     
     def test_check_shipment_delays_with_delayed_status(self):
         """Test alert generation for shipments with DELAYED status."""
@@ -305,6 +307,34 @@ class TestAlertGenerator:
         assert AlertType.SHIPMENT_DELAY in alert_types
         assert AlertType.LOW_STOCK in alert_types
         assert AlertType.SUPPLIER_PERFORMANCE in alert_types
+        
+        # All alerts from one pass share the same creation time
+        assert len({alert.created_at for alert in alerts}) == 1
+    
+    def test_generated_alert_ids_are_unique_uuid4(self):
+        """Test batch-generated alert IDs are distinct version 4 UUIDs."""
+        generator = AlertGenerator()
+        now = datetime.now()
+        
+        suppliers = [
+            Supplier(
+                id=f"SUP{i:03d}",
+                name=f"Supplier {i}",
+                contact="contact@example.com",
+                performance_score=50.0,
+                on_time_delivery_rate=80.0,
+                quality_score=60.0,
+                average_lead_time=10.0,
+                total_shipments=10,
+                last_updated=now
+            )
+            for i in range(5)
+        ]
+        
+        alerts = generator.check_supplier_performance(suppliers, performance_threshold=70.0)
+        
+        assert len({alert.id for alert in alerts}) == 5
+        assert all(uuid.UUID(alert.id).version == 4 for alert in alerts)
     
     def test_acknowledge_alert(self):
         """Test alert acknowledgment."""
@@ -346,10 +376,45 @@ class TestAlertGenerator:
         generator.acknowledge_alert(alert_id)
         
         # Verify acknowledgment
-        acknowledged_alert = generator._alerts[alert_id]
+        acknowledged_alert = generator._alerts[generator._alert_index[alert_id]]
         assert acknowledged_alert.acknowledged
         assert acknowledged_alert.acknowledged_at is not None
     
+    def test_acknowledge_by_index(self):
+        """Test alert acknowledgment by position in generation order."""
+        generator = AlertGenerator()
+        now = datetime.now()
+        
+        supplier = Supplier(
+            id="SUP001",
+            name="Acme Corp",
+            contact="contact@acme.com",
+            performance_score=50.0,
+            on_time_delivery_rate=55.0,
+            quality_score=60.0,
+            average_lead_time=7.0,
+            total_shipments=50,
+            last_updated=now
+        )
+        
+        data = SupplyChainData(
+            shipments=[],
+            inventory=[],
+            suppliers=[supplier],
+            nodes=[],
+            edges=[],
+            last_updated=now
+        )
+        
+        alerts = generator.generate_alerts(data, {'supplier_performance_threshold': 70.0})
+        generator.acknowledge_by_index(0)
+        
+        assert alerts[0].acknowledged
+        assert alerts[0].acknowledged_at is not None
+        
+        with pytest.raises(ValueError, match="out of range"):
+            generator.acknowledge_by_index(1)
+    
     def test_acknowledge_alert_not_found(self):
         """Test acknowledging non-existent alert raises error."""
         generator = AlertGenerator()
@@ -357,6 +422,81 @@ class TestAlertGenerator:
         with pytest.raises(ValueError, match="Alert not found"):
             generator.acknowledge_alert("non-existent-id")
     
+    def test_acknowledge_alerts_bulk(self):
+        """Test acknowledging several alerts in one call."""
+        generator = AlertGenerator()
+        now = datetime.now()
+        
+        shipments = [
+            Shipment(
+                id=f"S00{i}",
+                origin="New York",
+                destination="Los Angeles",
+                current_location="Chicago",
+                status=ShipmentStatus.DELAYED,
+                estimated_delivery=now - timedelta(hours=12),
+                actual_delivery=None,
+                items=["item1"],
+                supplier_id="SUP001",
+                created_at=now - timedelta(days=2),
+                updated_at=now
+            )
+            for i in range(1, 4)
+        ]
+        
+        data = SupplyChainData(
+            shipments=shipments,
+            inventory=[],
+            suppliers=[],
+            nodes=[],
+            edges=[],
+            last_updated=now
+        )
+        
+        alerts = generator.generate_alerts(data, {'delay_threshold_hours': 24})
+        assert len(alerts) == 3
+        
+        generator.acknowledge_alerts([alerts[0].id, alerts[2].id])
+        
+        assert alerts[0].acknowledged and alerts[2].acknowledged
+        assert not alerts[1].acknowledged
+        assert alerts[0].acknowledged_at == alerts[2].acknowledged_at
+    
+    def test_acknowledge_alerts_not_found_leaves_alerts_unchanged(self):
+        """Test bulk acknowledgment with an unknown ID raises before updating any alert."""
+        generator = AlertGenerator()
+        now = datetime.now()
+        
+        shipment = Shipment(
+            id="S001",
+            origin="New York",
+            destination="Los Angeles",
+            current_location="Chicago",
+            status=ShipmentStatus.DELAYED,
+            estimated_delivery=now - timedelta(hours=12),
+            actual_delivery=None,
+            items=["item1"],
+            supplier_id="SUP001",
+            created_at=now - timedelta(days=2),
+            updated_at=now
+        )
+        
+        data = SupplyChainData(
+            shipments=[shipment],
+            inventory=[],
+            suppliers=[],
+            nodes=[],
+            edges=[],
+            last_updated=now
+        )
+        
+        alerts = generator.generate_alerts(data, {'delay_threshold_hours': 24})
+        
+        with pytest.raises(ValueError, match="Alert not found"):
+            generator.acknowledge_alerts([alerts[0].id, "non-existent-id"])
+        
+        assert not alerts[0].acknowledged
+    
     def test_empty_data(self):
         """Test generate_alerts with empty data."""
         generator = AlertGenerator()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the vectorized alert rule kernels.
+
+Tests matching and severity grading for shipment delays, low inventory,
+and supplier performance scans.
+"""
+
+import numpy as np
+from datetime import datetime, timedelta
+from src.alert_kernels import (
+    SEVERITY_LOW,
+    SEVERITY_MEDIUM,
+    SEVERITY_HIGH,
+    SEVERITY_CRITICAL,
+    hours_overdue,
+    delay_scan,
+    low_stock_scan,
+    supplier_scan,
+)
+
+
+class TestAlertKernels:
+    """Test suite for alert kernel functions."""
+
+    def test_hours_overdue_matches_timedelta(self):
+        """Test hours overdue matches timedelta arithmetic exactly."""
+        now = datetime(2024, 3, 1, 12, 0, 0, 250000)
+        estimated = [now - timedelta(hours=30, microseconds=7), now + timedelta(minutes=90)]
+
+        result = hours_overdue(np.array(estimated, dtype="datetime64[us]"), now)
+
+        assert result.tolist() == [(now - e).total_seconds() / 3600 for e in estimated]
+
+    def test_delay_scan(self):
+        """Test delayed and overdue shipments match with graded severity."""
+        overdue = np.array([80.0, 50.0, 30.0, 10.0, 100.0, 10.0])
+        delayed = np.array([False, False, False, False, False, True])
+        delivered = np.array([False, False, False, False, True, False])
+
+        indices, severities = delay_scan(overdue, delayed, delivered, 24)
+
+        assert indices.tolist() == [0, 1, 2, 5]
+        assert severities.tolist() == [SEVERITY_CRITICAL, SEVERITY_HIGH, SEVERITY_MEDIUM, SEVERITY_LOW]
+
+    def test_low_stock_scan(self):
+        """Test items below threshold match with graded severity."""
+        quantities = np.array([10.0, 40.0, 60.0, 90.0, 150.0])
+        reorder_points = np.full(5, 100.0)
+
+        indices, severities = low_stock_scan(quantities, reorder_points, 1.0)
+
+        assert indices.tolist() == [0, 1, 2, 3]
+        assert severities.tolist() == [SEVERITY_CRITICAL, SEVERITY_HIGH, SEVERITY_MEDIUM, SEVERITY_LOW]
+
+    def test_low_stock_scan_zero_threshold(self):
+        """Test a non-positive threshold grades matches as critical."""
+        indices, severities = low_stock_scan(np.array([-1.0, 0.0]), np.array([0.0, 0.0]), 1.0)
+
+        assert indices.tolist() == [0]
+        assert severities.tolist() == [SEVERITY_CRITICAL]
+
+    def test_supplier_scan(self):
+        """Test suppliers below threshold match with graded severity."""
+        scores = np.array([35.0, 45.0, 55.0, 65.0, 75.0])
+
+        indices, severities = supplier_scan(scores, 70.0)
+
+        assert indices.tolist() == [0, 1, 2, 3]
+        assert severities.tolist() == [SEVERITY_CRITICAL, SEVERITY_HIGH, SEVERITY_MEDIUM, SEVERITY_LOW]
+
+    def test_severity_bin_edges(self):
+        """Test values exactly on a bin edge fall into the less severe bin."""
+        _, delay_severities = delay_scan(np.array([48.0, 72.0]), np.array([True, True]), np.array([False, False]), 24)
+        _, stock_severities = low_stock_scan(np.array([25.0, 50.0]), np.full(2, 100.0), 1.0)
+        _, supplier_severities = supplier_scan(np.array([60.0, 40.0]), 70.0)
+
+        assert delay_severities.tolist() == [SEVERITY_MEDIUM, SEVERITY_HIGH]
+        assert stock_severities.tolist() == [SEVERITY_HIGH, SEVERITY_MEDIUM]
+        assert supplier_severities.tolist() == [SEVERITY_LOW, SEVERITY_HIGH]
+
+    def test_empty_inputs(self):
+        """Test scans over empty arrays return no matches."""
+        empty = np.array([], dtype=np.float64)
+        no_flags = np.array([], dtype=bool)
+
+        assert delay_scan(empty, no_flags, no_flags, 24)[0].size == 0
+        assert low_stock_scan(empty, empty, 1.0)[0].size == 0
+        assert supplier_scan(empty, 70.0)[0].size == 0
@@ -0,0 +1,64 @@
+"""
+Unit tests for the alert page utilities.
+
+Tests that cached alerts follow reloads of the data they were generated from.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.alert_generator
+from pages import alert_utils
+from src.models import Shipment, ShipmentStatus, SupplyChainData
+
+
+ETA = datetime(2024, 1, 15, 12, 0)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() returns a settable time."""
+
+    current = ETA
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze the time alerts are generated at, with a clean alert cache."""
+    monkeypatch.setattr(src.alert_generator, "datetime", FrozenDatetime)
+    alert_utils._generate_alerts_cached.clear()
+    yield FrozenDatetime
+    alert_utils._generate_alerts_cached.clear()
+
+
+def test_alerts_regenerated_when_data_reloads(clock):
+    """Test a shipment passing its estimated delivery raises an alert on the next load."""
+    shipment = Shipment(
+        id="S001",
+        origin="New York",
+        destination="Chicago",
+        current_location="Cleveland",
+        status=ShipmentStatus.IN_TRANSIT,
+        estimated_delivery=ETA,
+        actual_delivery=None,
+        items=["ITEM001"],
+        supplier_id="SUP001",
+        created_at=ETA - timedelta(days=2),
+        updated_at=ETA - timedelta(days=1)
+    )
+    data = SupplyChainData(
+        shipments=[shipment], inventory=[], suppliers=[], nodes=[], edges=[], last_updated=ETA
+    )
+
+    clock.current = ETA + timedelta(hours=1)
+    assert alert_utils.get_alerts(data) == []
+
+    # Past the delay threshold, a reload of the same files brings the new alert
+    clock.current = ETA + timedelta(hours=30)
+    data.last_updated = clock.current
+    alerts = alert_utils.get_alerts(data)
+    assert [(a.entity_id, a.type.value) for a in alerts] == [("S001", "shipment_delay")]
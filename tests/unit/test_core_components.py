@@ -6,7 +6,7 @@ components to ensure they work correctly with sample data.
 """
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from src.data_access import DataAccessService
 from src.shipment_tracker import ShipmentTracker
@@ -54,6 +54,19 @@ class TestShipmentTracker:
         assert details.shipment.id == first_shipment.id
         assert details.supplier_name is not None or details.supplier_name is None
     
+    def test_get_shipment_details_with_id_indexes(self, sample_data):
+        """Test details looked up through the ID indexes match the list scan."""
+        tracker = ShipmentTracker(sample_data)
+        shipment_id = sample_data.shipments[-1].id
+        sample_data.clear_derived_caches()
+        scanned = tracker.get_shipment_details(shipment_id)
+        
+        sample_data.build_derived_caches()
+        
+        assert tracker.get_shipment_details(shipment_id) == scanned
+        with pytest.raises(ValueError, match="Shipment not found"):
+            tracker.get_shipment_details("INVALID_ID")
+    
     def test_get_shipment_details_not_found(self, sample_data):
         """Test getting details for non-existent shipment."""
         tracker = ShipmentTracker(sample_data)
@@ -166,6 +179,19 @@ class TestNetworkVisualizer:
             assert details.incoming_edges >= 0
             assert details.outgoing_edges >= 0
     
+    def test_get_node_details_with_adjacency_indexes(self, sample_data):
+        """Test node details through the adjacency indexes match walking the edges."""
+        visualizer = NetworkVisualizer(sample_data)
+        sample_data.clear_derived_caches()
+        scanned = [visualizer.get_node_details(node.id) for node in sample_data.nodes]
+        
+        sample_data.build_derived_caches()
+        indexed = [visualizer.get_node_details(node.id) for node in sample_data.nodes]
+        
+        for before, after in zip(scanned, indexed):
+            assert sorted(after.connected_shipment_ids) == sorted(before.connected_shipment_ids)
+            assert (after.incoming_edges, after.outgoing_edges) == (before.incoming_edges, before.outgoing_edges)
+    
     def test_get_node_details_not_found(self, sample_data):
         """Test getting details for non-existent node."""
         visualizer = NetworkVisualizer(sample_data)
@@ -243,6 +269,54 @@ class TestDashboard:
         # With status filter, only in_transit shipments should be counted
         assert metrics.total_shipments == metrics.in_transit_count
     
+    def test_render_caches_metrics(self, sample_data):
+        """Test repeat renders reuse metrics until the data is updated."""
+        dashboard = Dashboard(sample_data)
+        
+        first = dashboard.render(FilterCriteria(status=['in_transit']))
+        assert dashboard.render(FilterCriteria(status=['in_transit'])) is first
+        assert dashboard.render(FilterCriteria(status=['delayed'])) is not first
+        
+        sample_data.last_updated = sample_data.last_updated + timedelta(seconds=1)
+        assert dashboard.render(FilterCriteria(status=['in_transit'])) is not first
+    
+    def test_render_cache_keys_on_filter_values(self, sample_data, monkeypatch):
+        """Test filters with colliding hashes do not share cached metrics."""
+        monkeypatch.setattr(FilterCriteria, "__hash__", lambda self: 0)
+        dashboard = Dashboard(sample_data)
+        
+        in_transit = dashboard.render(FilterCriteria(status=['in_transit']))
+        delivered = dashboard.render(FilterCriteria(status=['delivered']))
+        
+        assert delivered is not in_transit
+        assert delivered.total_shipments == sum(s.status == ShipmentStatus.DELIVERED for s in sample_data.shipments)
+    
+    def test_render_unfiltered_reuses_metrics(self, sample_data):
+        """Test unfiltered renders reuse metrics until the data is updated."""
+        dashboard = Dashboard(sample_data)
+        
+        first = dashboard.render()
+        assert dashboard.render() is first
+        
+        sample_data.last_updated = sample_data.last_updated + timedelta(seconds=1)
+        assert dashboard.render() is not first
+    
+    def test_get_metrics_numeric_arrays_match_lists(self, sample_data):
+        """Test vectorized metrics match the per-item calculation."""
+        dashboard = Dashboard(sample_data)
+        assert sample_data.inventory_quantity is not None
+        vectorized = dashboard.get_metrics(sample_data)
+        
+        sample_data.clear_derived_caches()
+        fallback = dashboard.get_metrics(sample_data)
+        
+        assert vectorized.in_transit_count == fallback.in_transit_count
+        assert vectorized.delayed_count == fallback.delayed_count
+        assert vectorized.delivered_count == fallback.delivered_count
+        assert vectorized.pending_count == fallback.pending_count
+        assert vectorized.low_stock_count == fallback.low_stock_count
+        assert vectorized.average_supplier_performance == pytest.approx(fallback.average_supplier_performance)
+    
     def test_get_metrics_empty_data(self):
         """Test metrics calculation with empty data."""
         from src.models import SupplyChainData
@@ -177,6 +177,25 @@ def test_load_data_from_csv(data_service, temp_data_dir):
     assert len(edge.shipment_ids) == 2
 
 
+def test_load_data_with_mixed_utc_offsets(data_service, temp_data_dir):
+    """Test loading datetimes whose UTC offsets differ between rows."""
+    shipments_file = temp_data_dir / "shipments.csv"
+    with open(shipments_file, 'a', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerow([
+            'SH002', 'Boston', 'Denver', 'Boston', 'pending',
+            '2024-01-16T10:00:00+05:00', '', 'ITEM003', 'SUP001',
+            '2024-01-10T08:00:00+00:00', '2024-01-12T14:30:00+00:00'
+        ])
+
+    data = data_service.load_data(str(temp_data_dir))
+
+    assert len(data.shipments) == 2
+    shipment = data.shipments[1]
+    assert shipment.estimated_delivery.utcoffset().total_seconds() == 5 * 3600
+    assert shipment.created_at.utcoffset().total_seconds() == 0
+    assert data.shipments[0].estimated_delivery == datetime(2024, 1, 15, 10, 0)
+
+
 def test_load_data_nonexistent_source(data_service):
     """Test loading data from nonexistent source raises error."""
     with pytest.raises(FileNotFoundError):
@@ -218,6 +237,32 @@ def test_refresh_data(data_service, temp_data_dir):
     assert len(data2.shipments) == 1
 
 
+def test_refresh_data_reuses_unchanged_source(data_service, temp_data_dir):
+    """Test refreshing returns the cache until a source file changes."""
+    data1 = data_service.load_data(str(temp_data_dir))
+    assert data_service.refresh_data(str(temp_data_dir)) is data1
+    
+    # Append a node so the file's size changes
+    with open(temp_data_dir / "nodes.csv", 'a', newline='', encoding='utf-8') as f:
+        f.write("N9,Extra Node,warehouse,Denver,,,normal,\n")
+    
+    data2 = data_service.refresh_data(str(temp_data_dir))
+    assert data2 is not data1
+    assert len(data2.nodes) == len(data1.nodes) + 1
+
+
+def test_source_signature_covers_change_logs(data_service, temp_data_dir):
+    """Test the source signature changes when an update is appended to a change log."""
+    data_service.load_data(str(temp_data_dir))
+    signature = data_service.source_signature(str(temp_data_dir))
+    assert data_service.source_signature(str(temp_data_dir)) == signature
+
+    update = StatusUpdate('shipment', 'SH001', 'current_location', 'Chicago', 'Denver', datetime.now())
+    data_service.persist_update(update, str(temp_data_dir))
+
+    assert data_service.source_signature(str(temp_data_dir)) != signature
+
+
 def test_persist_update_shipment(data_service, temp_data_dir):
     """Test persisting a shipment update."""
     # Load initial data
@@ -241,12 +286,63 @@ def test_persist_update_shipment(data_service, temp_data_dir):
     shipment = next(s for s in cached.shipments if s.id == 'SH001')
     assert shipment.current_location == 'Denver'
     
-    # Verify CSV was updated
+    # Verify the update was appended to the change log
+    updates_file = temp_data_dir / "shipments.updates.csv"
+    with open(updates_file, 'r', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+        assert len(rows) == 1
+        assert rows[0]['entity_id'] == 'SH001'
+        assert rows[0]['current_location'] == 'Denver'
+    
+    # Verify reloading replays the change log
+    reloaded = DataAccessService().load_data(str(temp_data_dir))
+    shipment = next(s for s in reloaded.shipments if s.id == 'SH001')
+    assert shipment.current_location == 'Denver'
+
+
+def test_persist_updates_batch(data_service, temp_data_dir):
+    """Test persisting several updates appends them in one batch."""
+    data_service.load_data(str(temp_data_dir))
+    
+    now = datetime.now()
+    updates = [
+        StatusUpdate('shipment', 'SH001', 'current_location', 'Chicago', 'Denver', now),
+        StatusUpdate('shipment', 'SH001', 'current_location', 'Denver', 'Phoenix', now),
+        StatusUpdate('inventory', 'INV001', 'quantity', 100.0, 75.0, now),
+    ]
+    data_service.persist_updates(updates, str(temp_data_dir))
+    
+    with open(temp_data_dir / "shipments.updates.csv", 'r', encoding='utf-8') as f:
+        assert [row['current_location'] for row in csv.DictReader(f)] == ['Denver', 'Phoenix']
+    
+    # Verify reloading replays every logged update
+    reloaded = DataAccessService().load_data(str(temp_data_dir))
+    assert next(s for s in reloaded.shipments if s.id == 'SH001').current_location == 'Phoenix'
+    assert next(i for i in reloaded.inventory if i.id == 'INV001').quantity == 75.0
+
+
+def test_compact_rewrites_csv(data_service, temp_data_dir):
+    """Test compacting folds logged updates into the CSV files."""
+    data_service.load_data(str(temp_data_dir))
+    
+    update = StatusUpdate(
+        entity_type='shipment',
+        entity_id='SH001',
+        field='current_location',
+        old_value='Chicago',
+        new_value='Denver',
+        timestamp=datetime.now()
+    )
+    data_service.persist_update(update, str(temp_data_dir))
+    data_service.compact(str(temp_data_dir))
+    
+    # Verify CSV was updated and the change log removed
     shipments_file = temp_data_dir / "shipments.csv"
     with open(shipments_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         row = next(reader)
         assert row['current_location'] == 'Denver'
+    assert not (temp_data_dir / "shipments.updates.csv").exists()
 
 
 def test_persist_update_inventory(data_service, temp_data_dir):
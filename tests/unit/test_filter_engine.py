@@ -4,10 +4,13 @@ Unit tests for FilterEngine.
 Tests the filtering and searching functionality of the FilterEngine class.
 """
 
+import pickle
+import warnings
+
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from src.filter_engine import FilterEngine, FilterCriteria
+from src.filter_engine import FilterEngine, FilterCriteria, cached_apply_filters
 from src.models import (
     SupplyChainData,
     Shipment,
@@ -206,6 +209,7 @@ class TestFilterCriteria:
         assert criteria.category is None
         assert criteria.search_query is None
         assert criteria.search_fields is None
+        assert criteria.low_stock_only is False
     
     def test_filter_criteria_with_values(self):
         """Test FilterCriteria with specified values."""
@@ -317,6 +321,15 @@ class TestApplyFilters:
         inventory_ids = {i.id for i in result.inventory}
         assert inventory_ids == {"I1", "I3"}
     
+    def test_filter_inventory_low_stock_only(self, filter_engine, sample_data):
+        """Test filtering inventory to items below their reorder point."""
+        criteria = FilterCriteria(low_stock_only=True)
+        result = filter_engine.apply_filters(sample_data, criteria)
+        
+        assert len(result.inventory) == 1
+        assert result.inventory[0].id == "I3"
+        assert result.inventory[0].quantity < result.inventory[0].reorder_point
+    
     def test_filter_nodes_by_status(self, filter_engine, sample_data):
         """Test filtering nodes by status."""
         criteria = FilterCriteria(status=["normal"])
@@ -362,6 +375,103 @@ class TestApplyFilters:
         assert len(result.shipments) == 2
         shipment_ids = {s.id for s in result.shipments}
         assert shipment_ids == {"S1", "S2"}
+    
+    def test_indexed_filters_match_scans(self, filter_engine, sample_data):
+        """Test filtering through position indexes matches scanning the lists."""
+        criteria = FilterCriteria(
+            status=["in_transit", "delayed"],
+            location=["Chicago", "Denver"],
+            category=["Electronics"]
+        )
+        scanned = filter_engine.apply_filters(sample_data, criteria)
+        
+        sample_data.build_derived_caches()
+        indexed = filter_engine.apply_filters(sample_data, criteria)
+        
+        assert indexed == scanned
+        assert [s.id for s in indexed.shipments] == ["S1", "S2"]
+    
+    def test_sorted_date_filters_match_scans(self, filter_engine, sample_data):
+        """Test date ranges resolved by binary search match scanning, including both bounds."""
+        criteria = FilterCriteria(
+            date_range=(sample_data.shipments[1].estimated_delivery, sample_data.shipments[0].estimated_delivery)
+        )
+        scanned = filter_engine.apply_filters(sample_data, criteria)
+        
+        sample_data.build_derived_caches()
+        indexed = filter_engine.apply_filters(sample_data, criteria)
+        
+        assert indexed == scanned
+        assert [s.id for s in indexed.shipments] == ["S1", "S2"]
+
+    def test_timezone_aware_date_filters_match_scans(self, filter_engine, sample_data):
+        """Test timezone-aware dates are compared by instant, not by wall-clock time."""
+        eta = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        # 12:00+05:00 is 07:00 UTC, earlier than 10:00 UTC despite the later wall clock
+        sample_data.shipments[0].estimated_delivery = eta.replace(tzinfo=timezone(timedelta(hours=5)))
+        sample_data.shipments[1].estimated_delivery = eta - timedelta(hours=2)
+        for shipment in sample_data.shipments[2:]:
+            shipment.estimated_delivery = eta + timedelta(days=1)
+        for entity in sample_data.inventory + sample_data.suppliers:
+            entity.last_updated = eta
+        criteria = FilterCriteria(date_range=(eta - timedelta(hours=4), eta))
+        scanned = filter_engine.apply_filters(sample_data, criteria)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            sample_data.build_derived_caches()
+            indexed = filter_engine.apply_filters(sample_data, criteria)
+
+        assert sample_data.shipments_by_eta is None
+        assert indexed == scanned
+        assert [s.id for s in indexed.shipments] == ["S2"]
+
+    def test_unfiltered_nodes_keep_edges(self, filter_engine, sample_data):
+        """Test edges are reused when no node is filtered out, and dangling edges still dropped."""
+        sample_data.build_derived_caches()
+        result = filter_engine.apply_filters(sample_data, FilterCriteria(category=["Electronics"]))
+        assert result.edges is sample_data.edges
+        
+        sample_data.edges.append(
+            Edge(id="E3", source_node_id="N1", target_node_id="N9", shipment_ids=[], active=True)
+        )
+        sample_data.build_derived_caches()
+        result = filter_engine.apply_filters(sample_data, FilterCriteria(category=["Electronics"]))
+        assert [e.id for e in result.edges] == ["E1", "E2"]
+    
+    def test_indexed_node_filters_match_scans(self, filter_engine, sample_data):
+        """Test filtering nodes through position indexes matches scanning the list."""
+        criteria = FilterCriteria(status=["normal", "congested"], location=["Chicago", "Los Angeles"])
+        scanned = filter_engine.apply_filters(sample_data, criteria)
+        
+        sample_data.build_derived_caches()
+        indexed = filter_engine.apply_filters(sample_data, criteria)
+        
+        assert indexed.nodes == scanned.nodes
+        assert [n.id for n in indexed.nodes] == ["N2", "N3"]
+    
+    def test_cached_apply_filters(self, sample_data):
+        """Test memoized filtering reuses results until the data is updated."""
+        criteria = FilterCriteria(status=["in_transit"])
+        first = cached_apply_filters(sample_data, criteria)
+        
+        assert cached_apply_filters(sample_data, FilterCriteria(status=["in_transit"])) is first
+        assert [s.id for s in first.shipments] == ["S1"]
+        
+        sample_data.last_updated = sample_data.last_updated + timedelta(seconds=1)
+        assert cached_apply_filters(sample_data, criteria) is not first
+    
+    def test_cached_apply_filters_snapshots_criteria(self, sample_data):
+        """Test memoized results are matched by criteria values, not by hash or object."""
+        criteria = FilterCriteria(status=["in_transit"])
+        first = cached_apply_filters(sample_data, criteria)
+        
+        criteria.status.append("delayed")
+        second = cached_apply_filters(sample_data, criteria)
+        
+        assert second is not first
+        assert [s.id for s in second.shipments] == ["S1", "S2"]
+        assert cached_apply_filters(sample_data, FilterCriteria(status=["in_transit"])) is first
 
 
 class TestSearch:
@@ -418,6 +528,43 @@ class TestSearch:
         assert len(result.shipments) >= 1
         assert any(s.id == "S1" for s in result.shipments)
     
+    def test_search_substring_within_token(self, filter_engine, sample_data):
+        """Test indexed search still matches substrings inside words."""
+        result = filter_engine.search(sample_data, "ork, new", ["origin", "destination"])
+        assert result.shipments == []
+        
+        result = filter_engine.search(sample_data, "EW yo", ["origin"])
+        assert [s.id for s in result.shipments] == ["S1"]
+        
+        result = filter_engine.search(sample_data, "idge", ["name"])
+        assert {i.id for i in result.inventory} == {"I1", "I2"}
+    
+    def test_search_index_rebuilt_after_update(self, filter_engine, sample_data):
+        """Test search sees entity changes once last_updated is bumped."""
+        assert filter_engine.search(sample_data, "Portland", ["origin"]).shipments == []
+        
+        sample_data.shipments[1].origin = "Portland"
+        sample_data.last_updated = sample_data.last_updated + timedelta(seconds=1)
+        
+        result = filter_engine.search(sample_data, "Portland", ["origin"])
+        assert [s.id for s in result.shipments] == ["S2"]
+
+    def test_search_index_shared_with_copies(self, filter_engine, sample_data):
+        """Test a copy of the data reuses the search indexes and resolves matches to its own entities."""
+        filter_engine.search(sample_data, "Boston", ["origin"])
+        index = sample_data.search_indexes["shipments"]
+
+        copy = pickle.loads(pickle.dumps(sample_data))
+        copy.search_indexes = sample_data.search_indexes
+        result = filter_engine.search(copy, "Boston", ["origin"])
+
+        assert copy.search_indexes["shipments"] is index
+        assert [s.id for s in result.shipments] == ["S2"]
+        assert result.shipments[0] is copy.shipments[1]
+
+        filtered = filter_engine.apply_filters(copy, FilterCriteria(search_query="boston", search_fields=["origin"]))
+        assert filtered.shipments[0] is copy.shipments[1]
+
     def test_search_with_empty_query(self, filter_engine, sample_data):
         """Test that empty query returns all data."""
         result = filter_engine.search(sample_data, "", ["name"])